@@ -1,3 +1,8 @@
+from ._backend import NumericBackend, get_backend, numeric_backend, promote, backend_of, array_backend, readonly
+from ._names import LazyName, as_name, dot_names, sympify_number, applied_name
+from ._approximation import ErrorBudget, EXACT, product_budget, approximate, get_approximation
+from ._cache import ArithmeticCache, arithmetic_cache, get_arithmetic_cache, cached, fingerprint
+from ._predicates import COMPARISONS, parse_predicate, event_mask, threshold_number
 from ._sample_base import SampleBase
 from ._randvar_base import RandVarBase
 from ._jointdist import JointDistribution
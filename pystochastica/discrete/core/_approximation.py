@@ -0,0 +1,114 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import math
+
+class ErrorBudget:
+	"""
+
+	Summary
+	-------
+	The error accumulated by approximate arithmetic (c.f., ``RandVar.prune`` and
+	``RandVar.rebin``), carried by random variables and random vectors in the
+	attribute ``error_budget`` and propagated through their arithmetic.
+
+	- ``lost_mass``, the total probability mass dropped by pruning, before renormalising
+	- ``wasserstein``, an upper bound on the Wasserstein-1 distance between the law held and the exact law
+
+	The Wasserstein-1 distance is subadditive under sums of independent random variables
+	and scales with the absolute value of scalar multiples. Where no bound is available,
+	e.g., for powers, it is ``inf``. Exact results carry the budget ``EXACT``.
+
+	"""
+	__slots__ = ('lost_mass', 'wasserstein')
+
+	def __init__(self, lost_mass: float = 0.0, wasserstein: float = 0.0) -> None:
+		self.lost_mass: float = float(lost_mass)
+		self.wasserstein: float = float(wasserstein)
+
+	@property
+	def exact(self) -> bool:
+		return self.lost_mass == 0 and self.wasserstein == 0
+
+	def __add__(self, second_budget):
+		"""budget of sums of independent random variables"""
+		if second_budget.exact:
+			return self
+		if self.exact:
+			return second_budget
+		return ErrorBudget(self.lost_mass + second_budget.lost_mass, self.wasserstein + second_budget.wasserstein)
+
+	def scaled(self, factor: float):
+		"""budget of ``factor`` times the random variable"""
+		if self.exact:
+			return self
+		wasserstein: float = _times(abs(float(factor)), self.wasserstein)
+		return ErrorBudget(self.lost_mass, wasserstein)
+
+	def unbounded(self):
+		"""budget after an operation without a Wasserstein-1 bound, e.g., powers"""
+		return self if self.exact else ErrorBudget(self.lost_mass, math.inf)
+
+	def __repr__(self) -> str:
+		return f"ErrorBudget(lost_mass={self.lost_mass}, wasserstein={self.wasserstein})"
+
+EXACT: ErrorBudget = ErrorBudget()
+
+def _times(first: float, second: float) -> float:
+	"""product of non-negative bounds, with 0*inf = 0"""
+	return 0.0 if first == 0 or second == 0 else first*second
+
+def product_budget(first_budget: ErrorBudget, first_abs_mean: float, second_budget: ErrorBudget, second_abs_mean: float) -> ErrorBudget:
+	"""Budget of products of independent random variables
+
+	Summary
+	-------
+	For approximations X', Y' of X, Y, the triangle inequality gives the bound
+	W(X'Y', XY) <= E|Y'| W(X', X) + E|X| W(Y', Y) with E|X| <= E|X'| + W(X', X)
+
+	"""
+	if first_budget.exact and second_budget.exact:
+		return EXACT
+	wasserstein: float = (
+			_times(second_abs_mean, first_budget.wasserstein)
+			+ _times(first_abs_mean + first_budget.wasserstein, second_budget.wasserstein)
+		)
+	return ErrorBudget(first_budget.lost_mass + second_budget.lost_mass, wasserstein)
+
+_approximation: ContextVar = ContextVar('approximation', default=(None, None))
+
+@contextmanager
+def approximate(threshold: float = None, size: int = None):
+	"""Approximate arithmetic within a context
+
+	Summary
+	-------
+	Every result of arithmetic among random variables within the context is pruned of
+	atoms with probability below ``threshold`` and then rebinned onto at most ``size``
+	points (c.f., ``RandVar.prune`` and ``RandVar.rebin``), so that supports stay bounded
+	over long chains of operations. Random vectors are pruned only.
+
+	Parameters
+	----------
+	threshold : float, optional
+		the mass threshold for pruning, default is None (no pruning)
+
+	size : int, optional
+		the largest support size kept, default is None (no rebinning)
+
+	Example
+	-------
+	>>> with approximate(threshold=1e-12, size=512):
+	... 	S = sum(X*Y for _ in range(100))
+	>>> S.error_budget
+	ErrorBudget(lost_mass=..., wasserstein=...)
+
+	"""
+	token = _approximation.set((threshold, size))
+	try:
+		yield
+	finally:
+		_approximation.reset(token)
+
+def get_approximation() -> tuple:
+	"""the current ``(threshold, size)`` for approximate arithmetic, c.f., ``approximate``"""
+	return _approximation.get()
@@ -0,0 +1,172 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
+
+class NumericBackend:
+	"""
+
+	Summary
+	-------
+	The number type in which sample values and probabilities are held and combined.
+	Three backends are provided:
+
+	- ``'float64'``, numpy ``float64`` arrays. This is the default and the fastest
+	- ``'decimal'``, object arrays of ``Decimal``, converted from ``str`` as to keep decimal literals exact
+	- ``'fraction'``, object arrays of ``Fraction``, for exact rational arithmetic
+
+	Random variables and random vectors hold their backend in the attribute ``backend``.
+	It is chosen per object through the ``backend`` keyword of the constructor, otherwise
+	the current default applies (c.f., ``numeric_backend``). Arithmetic between objects
+	on different backends is carried out in the more exact one, float64 < decimal < fraction
+	(c.f., ``promote``).
+
+	"""
+	def __init__(self, name: str, dtype: type, rank: int, number) -> None:
+		"""Constructor method
+
+		Parameters
+		----------
+		name : str
+			the name by which the backend is selected
+
+		dtype : type
+			the numpy dtype of arrays on this backend, ``float`` or ``object``
+
+		rank : int
+			the exactness of the backend, used to promote mixed arithmetic
+
+		number : function
+			conversion of a single ``int``, ``float``, ``Decimal`` or ``Fraction`` to this backend
+
+		"""
+		self.name: str = name
+		self.dtype: type = dtype
+		self.rank: int = rank
+		self.number = number
+		self._numbers = np.frompyfunc(number, 1, 1)
+
+	@property
+	def exact(self) -> bool:
+		"""True if arithmetic on this backend is carried out on python objects rather than floats"""
+		return self.dtype is object
+
+	def array(self, values) -> np.ndarray:
+		"""convert an array_like of numbers to an array on this backend"""
+		if not self.exact:
+			return np.asarray(values, dtype=float)
+		return np.asarray(self._numbers(np.asarray(values, dtype=object)), dtype=object)
+
+	def group_sum(self, inverse: np.ndarray, weights: np.ndarray, length: int) -> np.ndarray:
+		"""sum ``weights`` into ``length`` bins by the bin indices ``inverse``, as for ``numpy.bincount``"""
+		if not self.exact:
+			return np.bincount(inverse, weights=weights, minlength=length)
+		total = np.full(length, self.number(0), dtype=object)
+		np.add.at(total, inverse, weights)
+		return total
+
+	def power(self, values: np.ndarray, power) -> np.ndarray:
+		"""raise each of ``values`` to ``power``"""
+		if not self.exact:
+			return np.power(values, float(power))
+		if not isinstance(power, (int, np.integer)):
+			power = self.number(power)
+		return self.array(values**power)
+
+	def __repr__(self) -> str:
+		return f"NumericBackend({self.name!r})"
+
+def _to_float(value) -> float:
+	return float(value)
+
+def _to_decimal(value) -> Decimal:
+	if isinstance(value, Decimal):
+		return value
+	if isinstance(value, Fraction):
+		return Decimal(value.numerator) / Decimal(value.denominator)
+	return Decimal(str(value)) # decimal literal of int or float
+
+def _to_fraction(value) -> Fraction:
+	if isinstance(value, (Fraction, Decimal, int)):
+		return Fraction(value)
+	if isinstance(value, np.integer):
+		return Fraction(int(value))
+	return Fraction(str(float(value))) # decimal literal of float, i.e., Fraction(str(0.1)) == Fraction(1, 10)
+
+FLOAT64: NumericBackend = NumericBackend('float64', float, 0, _to_float)
+DECIMAL: NumericBackend = NumericBackend('decimal', object, 1, _to_decimal)
+FRACTION: NumericBackend = NumericBackend('fraction', object, 2, _to_fraction)
+BACKENDS: dict = {backend.name: backend for backend in (FLOAT64, DECIMAL, FRACTION)}
+
+_default_backend: ContextVar = ContextVar('numeric_backend', default=FLOAT64)
+
+def get_backend(backend=None) -> NumericBackend:
+	"""Resolve a numeric backend
+
+	Parameters
+	----------
+	backend : str, NumericBackend or None, optional
+		the backend or its name, one of ``'float64'``, ``'decimal'`` or ``'fraction'``.
+		Default is None, which resolves to the current default backend
+
+	Raises
+	------
+	ValueError
+		if ``backend`` names no known backend
+
+	"""
+	if backend is None:
+		return _default_backend.get()
+	if isinstance(backend, NumericBackend):
+		return backend
+	try:
+		return BACKENDS[backend]
+	except KeyError:
+		raise ValueError(f"{backend} is not a numeric backend, expected one of {list(BACKENDS.keys())}")
+
+@contextmanager
+def numeric_backend(backend):
+	"""Set the default numeric backend within a context
+
+	Example
+	-------
+	>>> with numeric_backend('fraction'):
+	... 	X = RandVar(name=sympy.Symbol('X'), values=[0, 1], probabilities=[0.9, 0.1])
+	>>> X.E
+	Fraction(1, 10)
+
+	"""
+	token = _default_backend.set(get_backend(backend))
+	try:
+		yield _default_backend.get()
+	finally:
+		_default_backend.reset(token)
+
+def promote(*backends) -> NumericBackend:
+	"""the most exact among the passed backends, float64 < decimal < fraction"""
+	return max(backends, key=lambda backend: backend.rank)
+
+def backend_of(value) -> NumericBackend:
+	"""the backend on which a single number is naturally held"""
+	if isinstance(value, Fraction):
+		return FRACTION
+	if isinstance(value, Decimal):
+		return DECIMAL
+	return FLOAT64
+
+def readonly(array: np.ndarray) -> np.ndarray:
+	"""a read-only view of ``array``. Probability laws are immutable once held by a random variable
+	or random vector, so that what is computed from them once (e.g., ``fingerprint`` or ``sampler``)
+	never goes stale. Copy the arrays to modify them, e.g., ``X.values.copy()``"""
+	view: np.ndarray = np.asarray(array).view()
+	view.flags.writeable = False
+	return view
+
+def array_backend(values: np.ndarray) -> NumericBackend:
+	"""the backend on which an array is held, inferred from its dtype and first entry"""
+	if not values.dtype == object:
+		return FLOAT64
+	if values.size == 0:
+		return get_backend()
+	return backend_of(values.flat[0])
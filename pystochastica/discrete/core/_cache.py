@@ -0,0 +1,197 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hashlib
+import sys
+import threading
+import numpy as np
+
+OBJECT_ITEM_SIZE: int = 64 # estimated bytes per entry of object arrays, e.g., a Fraction and its pointer
+DICT_ITEM_SIZE: int = 256 # estimated bytes per item of cached pspace dicts
+
+def fingerprint(*parts) -> bytes:
+	"""Content fingerprint
+
+	Summary
+	-------
+	A 128 bit blake2b digest of arrays and strings. Float arrays are hashed through
+	their raw bytes, object arrays (c.f., ``NumericBackend``) through the ``repr`` of
+	their entries, so that the fingerprint tells backends apart.
+
+	Example
+	-------
+	>>> fingerprint('float64', numpy.array([0.0, 1.0])).hex()
+	'...'
+
+	"""
+	digest = hashlib.blake2b(digest_size=16)
+	for part in parts:
+		if isinstance(part, np.ndarray):
+			digest.update(f"{part.dtype.str}{part.shape}".encode())
+			if part.dtype == object:
+				digest.update(repr(part.tolist()).encode())
+			else:
+				digest.update(np.ascontiguousarray(part).tobytes())
+		else:
+			digest.update(str(part).encode())
+		digest.update(b'|')
+	return digest.digest()
+
+def _size(entry) -> int:
+	"""estimated memory held by a cache entry, in bytes"""
+	if isinstance(entry, np.ndarray):
+		return entry.size * OBJECT_ITEM_SIZE if entry.dtype == object else entry.nbytes
+	if isinstance(entry, (tuple, list)):
+		return sum(_size(item) for item in entry)
+	if isinstance(entry, dict):
+		return len(entry) * DICT_ITEM_SIZE
+	return sys.getsizeof(entry)
+
+def _freeze(entry) -> None:
+	"""make the arrays of a cache entry read-only, as they are shared by every result built from it"""
+	if isinstance(entry, np.ndarray):
+		entry.flags.writeable = False
+	elif isinstance(entry, (tuple, list)):
+		for item in entry:
+			_freeze(item)
+
+class ArithmeticCache:
+	"""
+
+	Summary
+	-------
+	Bounded least-recently-used cache for the results of arithmetic among probability
+	laws. Keys are built from the operation and the content fingerprints of the operands
+	(c.f., ``RandVarBase.fingerprint``), so repeated operations on equal laws are computed
+	once, whatever the objects or names involved. Entries are evicted least recently used
+	first once their estimated memory exceeds ``max_bytes``.
+
+	Cached arrays are read-only and shared by every result built from them, as are the arrays
+	of any random variable or random vector (c.f., ``readonly``). Lookups and insertions hold
+	a lock, so a cache may be shared among threads.
+
+	The cache in use is set through the context ``arithmetic_cache``. Caching is off by
+	default, so one-off operations never pay for fingerprinting their operands or hold memory.
+
+	Example
+	-------
+	>>> cache = ArithmeticCache(max_bytes=2**20)
+	>>> with arithmetic_cache(cache):
+	... 	S, T = X + Y, X + Y
+	>>> cache.stats
+	{'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': ..., 'max_bytes': 1048576}
+
+	"""
+	def __init__(self, max_bytes: int = 2**26) -> None:
+		"""Constructor method
+
+		Parameters
+		----------
+		max_bytes : int, optional
+			the memory cap on cached results, in bytes. Default is 64 MiB
+
+		"""
+		self.max_bytes: int = max_bytes
+		self.hits: int = 0
+		self.misses: int = 0
+		self.evictions: int = 0
+		self.bytes: int = 0
+		self._entries: OrderedDict = OrderedDict() # key -> (entry, size)
+		self._lock = threading.Lock()
+
+	def get(self, key):
+		"""the entry cached under ``key``, else None"""
+		with self._lock:
+			try:
+				entry, _ = self._entries[key]
+			except KeyError:
+				self.misses += 1
+				return None
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return entry
+
+	def put(self, key, entry) -> None:
+		"""cache ``entry`` under ``key``, evicting least recently used entries beyond the memory cap"""
+		size: int = _size(entry)
+		if size > self.max_bytes:
+			return
+		_freeze(entry)
+		with self._lock:
+			if key in self._entries:
+				self.bytes -= self._entries.pop(key)[1]
+			self._entries[key] = (entry, size)
+			self.bytes += size
+			while self.bytes > self.max_bytes:
+				_, (_, evicted_size) = self._entries.popitem(last=False)
+				self.bytes -= evicted_size
+				self.evictions += 1
+
+	def clear(self) -> None:
+		"""drop all entries and reset the statistics"""
+		with self._lock:
+			self._entries.clear()
+			self.hits, self.misses, self.evictions, self.bytes = 0, 0, 0, 0
+
+	@property
+	def stats(self) -> dict:
+		"""hit/miss statistics and memory use"""
+		return {
+				'hits': self.hits,
+				'misses': self.misses,
+				'evictions': self.evictions,
+				'entries': len(self._entries),
+				'bytes': self.bytes,
+				'max_bytes': self.max_bytes
+			}
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def __contains__(self, key) -> bool:
+		return key in self._entries
+
+	def __repr__(self) -> str:
+		return f"ArithmeticCache({self.stats})"
+
+_arithmetic_cache: ContextVar = ContextVar('arithmetic_cache', default=None)
+
+@contextmanager
+def arithmetic_cache(cache: ArithmeticCache = None):
+	"""Set the arithmetic cache within a context
+
+	Parameters
+	----------
+	cache : ArithmeticCache or None, optional
+		the cache to use, default is None which disables caching
+
+	Example
+	-------
+	>>> with arithmetic_cache(ArithmeticCache(max_bytes=2**30)) as cache:
+	... 	results = [X*Y for _ in range(10)]
+	>>> cache.stats['hits']
+	9
+
+	"""
+	token = _arithmetic_cache.set(cache)
+	try:
+		yield cache
+	finally:
+		_arithmetic_cache.reset(token)
+
+def get_arithmetic_cache() -> ArithmeticCache:
+	"""the arithmetic cache in use, None if caching is disabled (c.f., ``arithmetic_cache``)"""
+	return _arithmetic_cache.get()
+
+def cached(key: tuple, compute):
+	"""the result of ``compute()``, memoised under ``key`` in the arithmetic cache in use. The key is 
+	passed as a function building it, called only if caching is enabled (c.f., ``arithmetic_cache``)"""
+	cache: ArithmeticCache = _arithmetic_cache.get()
+	if cache is None:
+		return compute()
+	key = key()
+	entry = cache.get(key)
+	if entry is None:
+		entry = compute()
+		cache.put(key, entry)
+	return entry
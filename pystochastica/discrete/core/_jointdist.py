@@ -1,7 +1,12 @@
 from ._sample_base import SampleBase
-from ._randvar_base import RandVarBase
-from decimal import Decimal, InvalidOperation
+from ._randvar_base import RandVarBase, PROBABILITY_TOLERANCE, validate_probabilities
+from ._backend import NumericBackend, get_backend, array_backend, readonly
+from ._names import LazyName, as_name
+from ._approximation import ErrorBudget, EXACT
+from ._cache import fingerprint
+from ._predicates import parse_predicate, event_mask, threshold_number
 import numpy as np
+import sympy as sp
 
 class JointDistribution:
     """
@@ -13,6 +18,13 @@ class JointDistribution:
     whence the dependent variables follow the marginal distributions of the joint
     distribution.
 
+    The joint distribution is stored column-wise: one name per axis in ``name``,
+    the joint samples as rows of the ``(N, dimension)`` array ``values`` and their
+    probabilities in the array ``probabilities``, both held on the numeric backend
+    ``backend`` (c.f., ``NumericBackend``). The dict ``pspace`` is built from these 
+    arrays on demand. Names are held as ``LazyName`` objects, rendered to ``sympy.Expr``
+    objects only when ``name`` is accessed.
+
     Example
     -------
     X : random variable
@@ -21,6 +33,12 @@ class JointDistribution:
         - to get X - X == 0, form as RandVec operation [X, -X]@[1, 1] (c.f., discrete.vectors.RandVec)
 
     """
+    # samples in the pspace view are instances of this class, c.f., ``RandVec``
+    _sample_class: type = SampleBase
+
+    # exact unless set by approximate arithmetic, c.f., ``RandVec.prune``
+    error_budget: ErrorBudget = EXACT
+
     def __new__(cls, **kwargs):
         """Argument validation before calling the constructor
 
@@ -32,16 +50,40 @@ class JointDistribution:
             - the keys are ``tuple[SampleBase]`` type objects
             - the values are probabilities
 
+        name : list[sympy.Expr], optional
+            the name of the random variable at each index, passed together with ``values``
+            and ``probabilities`` in place of ``pspace``
+
+        values : array_like, optional
+            the joint samples as rows of an ``(N, dimension)`` array
+
+        probabilities : array_like, optional
+            the probability of each row in ``values``
+
+        backend : str or NumericBackend, optional
+            the number type of joint samples and probabilities, default is the current default backend
+
+        tolerance : float, optional
+            the absolute tolerance on the total law of probability, default is 1e-9
+
         Raises
         ------
         TypeError
             if not all samples in pspace.keys() are SampleBase type objects
 
+            if not all names are ``sympy.Expr`` type objects
+
         ValueError
             if length of each tuple in pspace.keys() are not all equal
 
+            if not all joint samples are unique
+
+            if probabilities are not values between (0, 1)
+
             if all probabilties do not sum to 1.0 (total law of probability)
 
+            if backend is not a known numeric backend
+
         IndexError
             if name of all SampleBase objects at given index do not coincide
 
@@ -51,6 +93,15 @@ class JointDistribution:
             base object for the random vectors class (c.f., RandVec)
 
         """
+        # raises ValueError for unknown backends
+        get_backend(kwargs.get('backend'))
+
+        tolerance: float = kwargs.get('tolerance', PROBABILITY_TOLERANCE)
+        if 'pspace' not in kwargs:
+            # joint distribution passed column-wise, validate vectorised
+            cls._validate_arrays(kwargs['name'], kwargs['values'], kwargs['probabilities'], tolerance)
+            return super(JointDistribution, cls).__new__(cls)
+
         pspace: dict = kwargs['pspace']
         
         # validation of pspace keys, must be all of type Sample
@@ -59,43 +110,119 @@ class JointDistribution:
         
         # validation, each sample tuple must have the same length
         dimension = next(len(sample_tuple) for sample_tuple in pspace.keys())
-        for sample_tuple in pspace.keys():
-            if not len(sample_tuple) == dimension:
-                raise ValueError(f"dimension mismatch, got {len(sample_tuple)}-dimensional for {sample_tuple} but expected {dimension}-dimensional")
+        if not {len(sample_tuple) for sample_tuple in pspace.keys()} == {dimension}:
+            sample_tuple = next(sample_tuple for sample_tuple in pspace.keys() if not len(sample_tuple) == dimension)
+            raise ValueError(f"dimension mismatch, got {len(sample_tuple)}-dimensional for {sample_tuple} but expected {dimension}-dimensional")
 
         # validation, sample name at each index must coincide
-        stacked = []
-        for sample_tuple in pspace.keys():
-            try:
-                stacked = np.vstack([stacked, np.array([sample.name for sample in sample_tuple])])
-            except ValueError:
-                stacked = np.array([sample.name for sample in sample_tuple])
-
-        if not all(len(set(stacked[:,i])) == 1 for i in range(dimension)):
+        names: set = {tuple(sample.name for sample in sample_tuple) for sample_tuple in pspace.keys()}
+        if not len(names) == 1:
             raise IndexError("sample index mismatch, all sample names at a given index must coincide")
         
-        # validation, total law of probability
-        try:
-            all_probabilities: Decimal = sum([Decimal(str(p)) for p in pspace.values()])
-        except InvalidOperation:
-            # pspace.values() are Fraction objects
-            all_probabilities: Decimal = Decimal(str(float(sum([p for p in pspace.values()]))))
-
-        if not all_probabilities == Decimal('1.0'):
-            raise ValueError(f"total law of probability violated, all probabilities must sum to {1.0} but got {all_probabilities}")
+        # validation, probabilities and total law of probability
+        probabilities = np.array([float(p) for p in pspace.values()], dtype=float)
+        validate_probabilities(probabilities, tolerance)
 
         return super(JointDistribution, cls).__new__(cls)
 
+    @classmethod
+    def _validate_arrays(cls, name, values, probabilities, tolerance: float = PROBABILITY_TOLERANCE) -> None:
+        """vectorised validation of a joint distribution passed column-wise, c.f., ``__new__``"""
+        if not all(isinstance(n, sp.Expr) for n in name):
+            raise TypeError(f"not all names in {name} are {sp.Expr.__name__} type objects")
+
+        values = np.asarray(values, dtype=float)
+        probabilities = np.asarray(probabilities, dtype=float)
+        if not (values.ndim == 2 and values.shape == (len(probabilities), len(name))):
+            raise ValueError(f"dimension mismatch, got values of shape {values.shape} but expected {(len(probabilities), len(name))}")
+
+        if not len(np.unique(values, axis=0)) == len(values):
+            raise ValueError("not all joint samples are unique")
+
+        validate_probabilities(probabilities, tolerance)
+
     def __init__(self, **kwargs) -> None:
         
-        try:
-            self.pspace: dict = {s: Decimal(str(p)) for s, p in kwargs['pspace'].items() if Decimal(str(p)) != Decimal('0')}
-        except InvalidOperation:
-            # kwargs['pspace'].values() are Fraction objects
-            self.pspace: dict = kwargs['pspace']
+        if 'pspace' in kwargs:
+            pspace: dict = kwargs['pspace']
+            name: list = [sample.name for sample in next(s for s in pspace.keys())]
+            values = [[sample.value for sample in sample_tuple] for sample_tuple in pspace.keys()]
+            probabilities = list(pspace.values())
+        else:
+            name: list = list(kwargs['name'])
+            values = kwargs['values']
+            probabilities = kwargs['probabilities']
+
+        backend: NumericBackend = get_backend(kwargs.get('backend'))
+        values = backend.array(values).reshape(-1, len(name))
+        probabilities = backend.array(probabilities)
+        nonzero = probabilities != 0
+
+        self.name: list = name
+        self.backend: NumericBackend = backend
+        self.dimension: int = len(name)
+        self.values: np.ndarray = readonly(values[nonzero])
+        self.probabilities: np.ndarray = readonly(probabilities[nonzero])
+
+    @classmethod
+    def _from_arrays(cls, name: list, values: np.ndarray, probabilities: np.ndarray, backend: NumericBackend = None):
+        """Trusted constructor
+
+        Summary
+        -------
+        Initialise directly from unique rows of joint samples with non-zero probabilities,
+        skipping argument validation. Internal use only, for results which are correct by
+        construction (e.g., products of valid joint distributions). If no backend is 
+        passed, it is inferred from the arrays
+
+        """
+        joint_dist = object.__new__(cls)
+        joint_dist.name = list(name)
+        joint_dist.backend = array_backend(values) if backend is None else backend
+        joint_dist.dimension = len(name)
+        joint_dist.values = readonly(values)
+        joint_dist.probabilities = readonly(probabilities)
+        return joint_dist
+
+    @classmethod
+    def _from_pspace(cls, pspace: dict, backend: NumericBackend = None):
+        """Trusted constructor from a ``pspace`` dict, skipping argument validation (c.f., ``_from_arrays``)"""
+        joint_dist = object.__new__(cls)
+        joint_dist.__init__(pspace=pspace, backend=backend)
+        return joint_dist
 
-        self.name: list = [sample.name for sample in next(s for s in self.pspace.keys())]
-        self.dimension: int = next(len(sample_tuple) for sample_tuple in self.pspace.keys())
+    @property
+    def name(self) -> list:
+        """the name of the random variable at each index as ``sympy.Expr`` objects (c.f., ``LazyName``)"""
+        return [n.expr() for n in self._name]
+
+    @name.setter
+    def name(self, name: list) -> None:
+        self._name: list[LazyName] = [as_name(n) for n in name]
+
+    @property
+    def pspace(self) -> dict:
+        """the joint distribution as a dict, keys are ``tuple[SampleBase]`` objects and values are probabilities"""
+        try:
+            return self._pspace
+        except AttributeError:
+            # one sample object per distinct value at each index, shared among the keys
+            from_value = self._sample_class._from_value
+            columns: list = []
+            for n, column in zip(self.name, self.values.T):
+                column_values, inverse = np.unique(column, return_inverse=True)
+                samples = [from_value(n, value) for value in column_values.tolist()]
+                columns += [[samples[k] for k in inverse.ravel().tolist()]]
+
+            self._pspace: dict = dict(zip(zip(*columns), self.probabilities.tolist()))
+            return self._pspace
+
+    def _marginal_arrays(self, column: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """sorted, unique values in ``column`` of the joint table with their marginal probabilities"""
+        values, inverse = np.unique(column, return_inverse=True)
+        probabilities = self.backend.group_sum(inverse.ravel(), self.probabilities, len(values))
+        nonzero = probabilities != 0
+        return values[nonzero], probabilities[nonzero]
 
     def derive_marginals(self, inplace=False) -> None:
         """Generate marginal distributions from the joint distribution
@@ -117,19 +244,14 @@ class JointDistribution:
         - i.e., if P(X, Y) = P(X)P(Y), then (X, Y) are independent
 
         """
-        jdist_pspace: dict = self.pspace
-        marginals: list = []
-        for i in range(self.dimension):
-            rv_name = next(sample for sample in jdist_pspace.keys())[i].name
-            rv_pspace: dict = {}
-            for sample_tuple, prob in jdist_pspace.items():
-                sample: SampleBase = sample_tuple[i]
-                try:
-                    rv_pspace[sample] += prob
-                except KeyError:
-                    rv_pspace[sample] = prob
-
-            marginals += [RandVarBase(**{'name': rv_name, 'pspace': rv_pspace})]
+        marginals: list = [
+                RandVarBase._from_arrays(self._name[i], *self._marginal_arrays(self.values[:, i]), self.backend) 
+                for i in range(self.dimension)
+            ]
+        if not self.error_budget.exact:
+            # marginals are no further from exact than the joint distribution
+            for marginal in marginals:
+                marginal.error_budget = self.error_budget
 
         if inplace == True:
             return marginals
@@ -155,33 +277,23 @@ class JointDistribution:
         """
         if self.dimension == 1:
             # return RandVarBase initialised for RandVar object
-            secondary = RandVarBase(name=(next(sample.name for sample in self.pspace.keys())[0]), pspace=self.pspace)
-            secondaries = [secondary]
+            secondaries = self.derive_marginals(inplace=True)
             if inplace == True:
                 return secondaries 
             else:
                 self.secondaries = secondaries
                 return
         
-        jdist_pspace: dict = self.pspace
         secondaries: list = []
         for i in range(self.dimension-1):
-            rv_i_name = next(sample for sample in jdist_pspace.keys())[i]
             for j in range(i+1, self.dimension):
-                rv_j_name = next(sample for sample in jdist_pspace.keys())[j]
+                name = self._name[i]*self._name[j]
+                secondary_arrays = self._marginal_arrays(self.values[:, i]*self.values[:, j])
+                secondaries += [RandVarBase._from_arrays(name, *secondary_arrays, self.backend)]
 
-                rvrv_pspace: dict = {}
-                name = rv_i_name.name*rv_j_name.name
-                for sample_tuple, prob in jdist_pspace.items():
-                    sample_name = name
-                    sample_value = sample_tuple[i].value * sample_tuple[j].value
-                    sample = SampleBase(name=sample_name, value=sample_value)
-                    try:
-                        rvrv_pspace[sample] += prob 
-                    except KeyError:
-                        rvrv_pspace[sample] = prob        
-
-                secondaries += [RandVarBase(name=name, pspace=rvrv_pspace)]
+        if not self.error_budget.exact:
+            for secondary in secondaries:
+                secondary.error_budget = self.error_budget.unbounded()
 
         if inplace == True:
             return secondaries
@@ -192,6 +304,125 @@ class JointDistribution:
     def secnds(self):
         return self.derive_secondaries(inplace=True)
 
+    def _axis_index(self, axis: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sorted index of an axis
+
+        Summary
+        -------
+        The row order sorting the column ``axis`` of the joint table, the sorted column and
+        the start of each run of equal values in it. Built once per axis on first use, so
+        that repeated conditioning on the axis is a binary search and a slice (c.f., ``given``)
+
+        Raises
+        ------
+        ValueError
+            if ``axis`` is not an axis of self
+
+        """
+        if not (isinstance(axis, (int, np.integer)) and 0 <= axis < self.dimension):
+            raise ValueError(f"{axis} is not an axis of a joint distribution of dimension {self.dimension}")
+        try:
+            return self._axis_indices[axis]
+        except AttributeError:
+            self._axis_indices: dict = {}
+        except KeyError:
+            pass
+        order: np.ndarray = np.argsort(self.values[:, axis], kind='stable')
+        column: np.ndarray = self.values[order, axis]
+        starts: np.ndarray = np.flatnonzero(np.concatenate(([True], np.asarray(column[1:] != column[:-1], dtype=bool))))
+        self._axis_indices[axis] = (order, column, starts)
+        return self._axis_indices[axis]
+
+    def _event(self, axis: int, predicate: str) -> tuple[np.ndarray, object]:
+        """Rows of an event on one axis
+
+        Summary
+        -------
+        The rows of the joint table, in order, whose value at ``axis`` satisfies ``predicate``,
+        with the probability of the event. Compiled intervals (c.f., ``parse_predicate``) are
+        found by binary search on the sorted index of the axis, any other predicate is evaluated
+        on the sorted column (c.f., ``event_mask``)
+
+        Raises
+        ------
+        ValueError
+            if the event has probability zero
+
+        """
+        order, column, _ = self._axis_index(axis)
+        clauses = parse_predicate(predicate)
+        if clauses is None or any(operator == '!=' for operator, _ in clauses):
+            rows: np.ndarray = order[event_mask(column, predicate, self.backend)]
+        else:
+            start, stop = 0, len(column)
+            for operator, threshold in clauses:
+                threshold = threshold_number(threshold, self.backend)
+                if operator in ('>=', '=='):
+                    start = max(start, int(np.searchsorted(column, threshold, side='left')))
+                if operator == '>':
+                    start = max(start, int(np.searchsorted(column, threshold, side='right')))
+                if operator in ('<=', '=='):
+                    stop = min(stop, int(np.searchsorted(column, threshold, side='right')))
+                if operator == '<':
+                    stop = min(stop, int(np.searchsorted(column, threshold, side='left')))
+            rows: np.ndarray = order[start:max(start, stop)]
+        rows = np.sort(rows)
+
+        mass = self.probabilities[rows].sum() if len(rows) else 0
+        if mass == 0:
+            raise ValueError(f"cannot condition on the event {self.name[axis]} {predicate} of probability zero")
+        return rows, mass
+
+    def given(self, axis: int, predicate: str):
+        """Conditioning on an event
+
+        Summary
+        -------
+        The joint distribution conditioned on the value at ``axis`` satisfying ``predicate``,
+        i.e., the joint samples in the event with their probabilities renormalised by the
+        probability of the event. Conditioning on the same axis again reuses its sorted index
+
+        Parameters
+        ----------
+        axis : int
+            the index of the random variable conditioned on
+
+        predicate : str
+            the event, e.g., ``'<= 1'`` or ``'> 0 and <= 2'`` (c.f., ``RandVar.Prob``)
+
+        Returns
+        -------
+        joint_dist : JointDistribution
+            the conditional joint distribution under the same names, of the same type as self
+
+        Raises
+        ------
+        ValueError
+            if ``axis`` is not an axis of self, or if the event has probability zero
+
+        Example
+        -------
+        >>> rvec.given(1, '> 0').Prob(['<= 1', '> 0']) # Pr(X <= 1 | Y > 0) for rvec = [X, Y]
+
+        """
+        rows, mass = self._event(axis, predicate)
+        joint_dist = type(self)._from_arrays(self._name, self.values[rows], self.probabilities[rows]/mass, self.backend)
+        if not self.error_budget.exact:
+            # conditioning amplifies errors by the inverse of the probability of the event
+            joint_dist.error_budget = self.error_budget.unbounded()
+        return joint_dist
+
+    def _conditional_expectation_arrays(self, index: int, axis: int) -> tuple[np.ndarray, np.ndarray]:
+        """E[X_index | X_axis = x] at each distinct x in the column ``axis``, with the probabilities of x,
+        summed over the runs of the sorted index of the axis (c.f., ``_axis_index``)"""
+        if not (isinstance(index, (int, np.integer)) and 0 <= index < self.dimension):
+            raise ValueError(f"{index} is not an axis of a joint distribution of dimension {self.dimension}")
+        order, _, starts = self._axis_index(axis)
+        probabilities: np.ndarray = self.probabilities[order]
+        masses: np.ndarray = np.add.reduceat(probabilities, starts)
+        moments: np.ndarray = np.add.reduceat(self.values[order, index]*probabilities, starts)
+        return moments/masses, masses
+
     def __str__(self) -> str:
         string: str = f"Joint Probability Distribution {*self.name,}"
         for sample_tuple, probability in self.pspace.items():
@@ -210,19 +441,51 @@ class JointDistribution:
         pspace: dict = self.pspace
         return tuple([(s, p) for s, p in pspace.items()])
 
+    def _sorted_rows(self) -> tuple[np.ndarray, np.ndarray]:
+        """rows of the joint table and their probabilities as floats, sorted lexicographically"""
+        values = self.values.astype(float)
+        order = np.lexsort(values.T[::-1])
+        return values[order], self.probabilities.astype(float)[order]
+
     def __eq__(self, second_joint_dist: object) -> bool:
+        """Test for when two ``JointDistribution`` objects are equivalent
 
-        if not set(self.name) == set(second_joint_dist):
+        Summary
+        -------
+        Equivalent joint distributions share their names and joint samples, with
+        probabilities agreeing up to floating point accuracy. Names are compared last,
+        since this may require rendering them
+        
+        """
+        if not isinstance(second_joint_dist, JointDistribution):
+            return NotImplemented
+
+        if not self.dimension == second_joint_dist.dimension:
             return False
 
-        if not set(self.pspace.keys()) == set(second_joint_dist.pspace.keys()):
+        values, probabilities = self._sorted_rows()
+        second_values, second_probabilities = second_joint_dist._sorted_rows()
+        if not np.array_equal(values, second_values):
             return False
         
-        for key, prob in self.pspace.items():
-            if not second_joint_dist[key] == prob:
-                return False
-            
-        return True
+        if not np.allclose(probabilities, second_probabilities, rtol=1e-09, atol=1e-12):
+            return False
+
+        return all(n.equals(m) for n, m in zip(self._name, second_joint_dist._name))
+
+    @property
+    def fingerprint(self) -> bytes:
+        """content fingerprint of the joint table and its backend, computed once (c.f., ``ArithmeticCache``)"""
+        try:
+            return self._fingerprint
+        except AttributeError:
+            self._fingerprint: bytes = fingerprint(self.backend.name, self.values, self.probabilities)
+            return self._fingerprint
 
     def __hash__(self) -> int:
-        return hash(self.to_tuple())
+        try:
+            return self._hash
+        except AttributeError:
+            values, _ = self._sorted_rows()
+            self._hash: int = hash((values + 0.0).tobytes())
+            return self._hash
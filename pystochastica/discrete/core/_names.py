@@ -0,0 +1,267 @@
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
+import sympy as sp
+
+def sympify_number(number) -> sp.Expr:
+	"""a number as a sympy rational, as to keep names free of floats, e.g., 0.1 --> 1/10"""
+	if isinstance(number, (int, np.integer)):
+		return sp.Integer(int(number))
+	if isinstance(number, Fraction):
+		return sp.Rational(number.numerator, number.denominator)
+	if isinstance(number, Decimal):
+		return sp.Rational(str(number))
+	return sp.nsimplify(float(number))
+
+class LazyName:
+	"""
+
+	Summary
+	-------
+	Deferred symbolic name. Arithmetic among names only records a node in an
+	expression tree, in constant time, so that names cost nothing however long the
+	expression has grown. The tree is rendered to a ``sympy.Expr`` once, on first
+	request through ``expr``, and cached. Chains of additions or multiplications are
+	rendered as a single flat ``sympy.Add`` or ``sympy.Mul``.
+
+	Each node carries a structural hash, computed from the hashes of its children,
+	so that comparing names rarely requires rendering them (c.f., ``equals``).
+
+	Example
+	-------
+	>>> X, Y = LazyName.leaf(sympy.Symbol('X')), LazyName.leaf(sympy.Symbol('Y'))
+	>>> name = 0.5*X + Y
+	>>> name.expr()
+	X/2 + Y
+
+	"""
+	__slots__ = ('op', 'args', '_hash', '_expr', '_symbols')
+
+	# numpy scalars defer to the reflected operations below, e.g., numpy.float64(0.5)*name
+	__array_ufunc__ = None
+
+	def __init__(self, op: str, args: tuple) -> None:
+		"""Constructor method
+
+		Parameters
+		----------
+		op : str
+			one of ``'leaf'``, ``'add'``, ``'mul'`` or ``'pow'``
+
+		args : tuple
+			the ``sympy.Expr`` for leaves, else the ``LazyName`` operands
+
+		"""
+		self.op: str = op
+		self.args: tuple = args
+		if op == 'leaf':
+			self._hash: int = hash(args[0])
+		else:
+			self._hash: int = hash((op,) + tuple(arg._hash for arg in args))
+
+	@classmethod
+	def leaf(cls, expr: sp.Expr):
+		"""wrap a ``sympy.Expr`` as a name"""
+		return cls('leaf', (expr,))
+
+	@property
+	def is_rendered(self) -> bool:
+		return hasattr(self, '_expr')
+
+	def _operands(self) -> list:
+		"""the operands of the chain of same operations rooted at self, e.g., [X, Y, Z] for (X + Y) + Z"""
+		if self.op == 'pow':
+			return list(self.args)
+
+		operands, stack = [], [self]
+		while stack:
+			node = stack.pop()
+			if node is self or (node.op == self.op and not node.is_rendered):
+				stack.extend(reversed(node.args))
+			else:
+				operands.append(node)
+		return operands
+
+	def expr(self) -> sp.Expr:
+		"""render the name as a ``sympy.Expr``, cached after the first call"""
+		try:
+			return self._expr
+		except AttributeError:
+			pass
+
+		# iterative post-order traversal, expression trees can be far deeper than the recursion limit
+		stack: list = [self]
+		while stack:
+			node = stack[-1]
+			if node.is_rendered:
+				stack.pop()
+				continue
+
+			if node.op == 'leaf':
+				node._expr = node.args[0]
+				stack.pop()
+				continue
+
+			operands = node._operands()
+			pending = [operand for operand in operands if not operand.is_rendered]
+			if pending:
+				stack.extend(pending)
+				continue
+
+			exprs = [operand._expr for operand in operands]
+			if node.op == 'add':
+				node._expr = sp.Add(*exprs)
+			elif node.op == 'mul':
+				node._expr = sp.Mul(*exprs)
+			else:
+				node._expr = exprs[0]**exprs[1]
+			stack.pop()
+
+		return self._expr
+
+	def equals(self, second_name) -> bool:
+		"""Test for when two names are equivalent
+
+		Summary
+		-------
+		Structurally identical trees are equivalent without rendering. Otherwise,
+		both names are rendered and compared as ``sympy.Expr`` objects, e.g.,
+		X + Y and Y + X are equivalent
+
+		"""
+		second_name = as_name(second_name)
+		if self.same(second_name):
+			return True
+		return self.expr() == second_name.expr()
+
+	def same(self, second_name) -> bool:
+		"""structural equality of expression trees, without rendering"""
+		stack: list = [(self, second_name)]
+		while stack:
+			first, second = stack.pop()
+			if first is second:
+				continue
+			if not (first._hash == second._hash and first.op == second.op and len(first.args) == len(second.args)):
+				return False
+			if first.op == 'leaf':
+				if not first.args[0] == second.args[0]:
+					return False
+				continue
+			stack.extend(zip(first.args, second.args))
+		return True
+
+	def negates(self, second_name) -> bool:
+		"""True if self is structurally (-1)*second_name, i.e., self + second_name == 0"""
+		if not self.op == 'mul':
+			return False
+		coefficient, name = self.args
+		return coefficient.op == 'leaf' and coefficient.args[0] == -1 and name.same(second_name)
+
+	def cancels(self, second_name) -> bool:
+		"""True if the sum of self and second_name is zero
+
+		Summary
+		-------
+		Structurally, e.g., X + (-X), without rendering. Otherwise, if both names share free
+		symbols or neither has any, both are rendered and their sum compared to zero as
+		``sympy.Expr`` objects, e.g., 2*X + (-2)*X. Names over disjoint symbols never cancel,
+		so sums of independent random variables are not rendered
+
+		"""
+		if self.negates(second_name) or second_name.negates(self):
+			return True
+		symbols, second_symbols = self.free_symbols, second_name.free_symbols
+		if symbols.isdisjoint(second_symbols) and (symbols or second_symbols):
+			return False
+		return self.expr() + second_name.expr() == 0
+
+	@property
+	def free_symbols(self) -> frozenset:
+		"""the free symbols of the leaves of the name, collected without rendering and cached at each node"""
+		try:
+			return self._symbols
+		except AttributeError:
+			pass
+
+		# iterative post-order traversal, c.f., ``expr``
+		stack: list = [self]
+		while stack:
+			node = stack[-1]
+			if hasattr(node, '_symbols'):
+				stack.pop()
+				continue
+
+			if node.op == 'leaf':
+				node._symbols = frozenset(node.args[0].free_symbols)
+				stack.pop()
+				continue
+
+			pending = [arg for arg in node.args if not hasattr(arg, '_symbols')]
+			if pending:
+				stack.extend(pending)
+				continue
+
+			node._symbols = frozenset().union(*(arg._symbols for arg in node.args))
+			stack.pop()
+
+		return self._symbols
+
+	def __hash__(self) -> int:
+		return self._hash
+
+	def __add__(self, second_name):
+		return LazyName('add', (self, as_name(second_name)))
+
+	def __radd__(self, second_name):
+		return LazyName('add', (as_name(second_name), self))
+
+	def __mul__(self, second_name):
+		return LazyName('mul', (self, as_name(second_name)))
+
+	def __rmul__(self, second_name):
+		return LazyName('mul', (as_name(second_name), self))
+
+	def __neg__(self):
+		return (-1)*self
+
+	def __sub__(self, second_name):
+		return self + (-1)*as_name(second_name)
+
+	def __rsub__(self, second_name):
+		return as_name(second_name) + (-1)*self
+
+	def __pow__(self, power):
+		return LazyName('pow', (self, as_name(power)))
+
+	def __str__(self) -> str:
+		return str(self.expr())
+
+	def __repr__(self) -> str:
+		return f"LazyName({self.expr()!r})"
+
+def as_name(name) -> LazyName:
+	"""wrap a ``sympy.Expr`` or number as a ``LazyName``, names are passed through"""
+	if isinstance(name, LazyName):
+		return name
+	if isinstance(name, sp.Basic):
+		return LazyName.leaf(name)
+	return LazyName.leaf(sympify_number(name))
+
+def dot_names(names: list, weights: list) -> LazyName:
+	"""the name of the weighted sum of ``names``, sum_i weights[i]*names[i]"""
+	terms: list = [as_name(weight)*as_name(name) for name, weight in zip(names, weights)]
+	total: LazyName = terms[0]
+	for term in terms[1:]:
+		total = total + term
+	return total
+
+def applied_name(function, *names, index: int = None) -> sp.Expr:
+	"""the name f(X, Y, ...) of ``function`` applied to the named random variables, after ``function.__name__``
+	where this is an identifier (e.g., not for lambdas), else ``f``. For the component ``index`` of a
+	vector valued function, the name is f_index(X, Y, ...)"""
+	label: str = getattr(function, '__name__', '')
+	if not label.isidentifier():
+		label = 'f'
+	if index is not None:
+		label = f"{label}_{index}"
+	return sp.Function(label)(*names)
@@ -0,0 +1,91 @@
+from fractions import Fraction
+from functools import lru_cache
+import re
+import numpy as np
+
+COMPARISONS: dict = {
+		'<=': np.less_equal,
+		'<': np.less,
+		'>=': np.greater_equal,
+		'>': np.greater,
+		'==': np.equal,
+		'!=': np.not_equal
+	}
+
+_CLAUSE = re.compile(r"^\s*(<=|>=|==|!=|<|>)\s*([+-]?(?:inf|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?))\s*$")
+
+def _threshold(token: str):
+	"""a threshold as an exact rational, from its decimal literal, c.f., ``NumericBackend.number``"""
+	if token.lstrip('+-') == 'inf':
+		return float(token)
+	return Fraction(token)
+
+def threshold_number(threshold, backend):
+	"""a parsed threshold on ``backend``, infinite thresholds are kept as floats"""
+	return threshold if isinstance(threshold, float) else backend.number(threshold)
+
+@lru_cache(maxsize=1024)
+def parse_predicate(predicate: str) -> tuple:
+	"""Compile a predicate
+
+	Summary
+	-------
+	Parse a predicate such as ``'<= 1'`` or an interval such as ``'> -1 and <= 2.5'``, i.e.,
+	comparisons joined by ``and``, into a tuple of ``(operator, threshold)`` clauses. Thresholds
+	are held as exact rationals of their decimal literals. Compiled predicates are cached.
+
+	Parameters
+	----------
+	predicate : str
+		the predicate, comparisons against numbers with one of ``<=``, ``<``, ``>=``, ``>``, ``==`` or ``!=``
+
+	Returns
+	-------
+	clauses : tuple or None
+		the clauses of the predicate, or None if the predicate is not of the above form
+
+	Example
+	-------
+	>>> parse_predicate('> -1 and <= 2.5')
+	(('>', Fraction(-1, 1)), ('<=', Fraction(5, 2)))
+
+	"""
+	clauses: list = []
+	for clause in predicate.split(' and '):
+		match = _CLAUSE.match(clause)
+		if match is None:
+			return None
+		clauses.append((match.group(1), _threshold(match.group(2))))
+	return tuple(dict.fromkeys(clauses))
+
+def event_mask(values: np.ndarray, predicate: str, backend) -> np.ndarray:
+	"""Vectorised predicate
+
+	Summary
+	-------
+	The boolean mask of ``values`` satisfying ``predicate``. Compiled predicates (c.f.,
+	``parse_predicate``) are evaluated through numpy comparisons in a single pass. Any other
+	predicate is evaluated as python source, ``eval(f"{value}" + predicate)``, once per distinct value
+
+	Parameters
+	----------
+	values : np.ndarray
+		the sample values, on ``backend``
+
+	predicate : str
+		the predicate, e.g., ``'<= 1'``
+
+	backend : NumericBackend
+		the numeric backend of ``values``, on which thresholds are compared
+
+	"""
+	clauses = parse_predicate(predicate)
+	if clauses is None:
+		distinct_values, inverse = np.unique(values, return_inverse=True)
+		holds = np.array([eval(f"{value}" + predicate) for value in distinct_values.tolist()], dtype=bool)
+		return holds[inverse.ravel()]
+
+	mask: np.ndarray = np.ones(len(values), dtype=bool)
+	for operator, threshold in clauses:
+		mask &= np.asarray(COMPARISONS[operator](values, threshold_number(threshold, backend)), dtype=bool)
+	return mask
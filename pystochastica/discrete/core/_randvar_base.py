@@ -1,9 +1,50 @@
 from ._sample_base import SampleBase
+from ._backend import NumericBackend, get_backend, array_backend, readonly
+from ._names import LazyName, as_name
+from ._approximation import ErrorBudget, EXACT
+from ._cache import fingerprint
 import sympy as sp
-from decimal import Decimal, InvalidOperation
+import numpy as np
+import math
+
+# the total law of probability is validated up to floating point accuracy
+PROBABILITY_TOLERANCE: float = 1e-9
+
+def validate_probabilities(probabilities: np.ndarray, tolerance: float = PROBABILITY_TOLERANCE) -> None:
+	"""Vectorised validation of probabilities
+
+	Parameters
+	----------
+	probabilities : np.ndarray
+		the probabilities of a probability law, as floats
+
+	tolerance : float, optional
+		the absolute tolerance on the total law of probability, default is 1e-9
+
+	Raises
+	------
+	ValueError
+		if probabilities are not values between (0, 1)
+
+		if all probabilities do not sum to 1.0 (total law of probability)
+
+	"""
+	valid = (0 <= probabilities) & (probabilities <= 1)
+	if not np.all(valid):
+		raise ValueError(f"{probabilities[~valid][0]} is not a valid probability")
+
+	total: float = math.fsum(probabilities)
+	if not abs(total - 1.0) <= tolerance:
+		raise ValueError(f"total law of probability violated, got {total} but expected {1.0}")
 
 class RandVarBase:
 
+	# samples in the pspace view are instances of this class, c.f., ``RandVar``
+	_sample_class: type = SampleBase
+
+	# exact unless set by approximate arithmetic, c.f., ``RandVar.prune``
+	error_budget: ErrorBudget = EXACT
+
 	def __new__(cls, **kwargs):
 		"""Argument validation before calling the constructor method
 
@@ -16,6 +57,19 @@ class RandVarBase:
 
 			- the keys are ``SampleBase`` objects
 			- the values are probabilities
+
+		values : array_like, optional
+			the sample values, passed together with ``probabilities`` in place of ``pspace``
+
+		probabilities : array_like, optional
+			the probabilities assigned to each entry in ``values``
+
+		backend : str or NumericBackend, optional
+			the number type of sample values and probabilities (c.f., ``NumericBackend``),
+			default is the current default backend
+
+		tolerance : float, optional
+			the absolute tolerance on the total law of probability, default is 1e-9
 		
 		Raises
 		------
@@ -32,6 +86,8 @@ class RandVarBase:
 			
 			if all probabilities do not sum to 1.0 (total law of probability)
 
+			if backend is not a known numeric backend
+
 		Returns
 		-------
 		randvarbase : RandVarBase
@@ -40,51 +96,129 @@ class RandVarBase:
 		"""
 		# necessary keys to pass
 		name = kwargs['name']
-		pspace: dict = kwargs['pspace']
 
 		# type validation for name
 		if not isinstance(name, sp.Expr):
 			raise TypeError(f"{name} is not a {sp.Expr.__name__} type object")
 
-		# set validation, keys must be unique
-		pspace_keys = pspace.keys()
-		if not len(set(pspace_keys)) == len(pspace_keys):
-			raise ValueError("not all samples are unique")
+		# raises ValueError for unknown backends
+		get_backend(kwargs.get('backend'))
 
-		# pspace validation, keys are Sample objects, values are probabilities
-		for sample, probability in pspace.items():
+		tolerance: float = kwargs.get('tolerance', PROBABILITY_TOLERANCE)
+		if 'pspace' not in kwargs:
+			# law passed as arrays, validate vectorised
+			cls._validate_arrays(kwargs['values'], kwargs['probabilities'], tolerance)
+			return super(RandVarBase, cls).__new__(cls)
 
-			if not isinstance(sample, SampleBase):
-				raise TypeError(f"{sample} is not a {SampleBase.__name__} type object")
-			if not sample.name == name:
-				raise NameError(f"{sample} erroneously assigned to {name}")
-			
-			probability_dec = Decimal(str(float(probability)))
-			if not (Decimal('0') <= probability_dec and probability_dec <= Decimal('1')):
-				raise ValueError(f"{probability} is not a valid probability")
+		pspace: dict = kwargs['pspace']
 
-		# validation, total law of probability
-		try:
-			all_probabilities: list[Decimal] = [Decimal(str(v)) for v in pspace.values()]
-		except InvalidOperation:
-			all_probabilities: list = list(pspace.values())
+		# pspace validation, keys are Sample objects (unique, as dict keys), values are probabilities
+		if not all(isinstance(sample, SampleBase) for sample in pspace.keys()):
+			sample = next(sample for sample in pspace.keys() if not isinstance(sample, SampleBase))
+			raise TypeError(f"{sample} is not a {SampleBase.__name__} type object")
+
+		# sample names are hashed once on construction, compare as a set
+		if not {sample.name for sample in pspace.keys()} <= {name}:
+			sample = next(sample for sample in pspace.keys() if not sample.name == name)
+			raise NameError(f"{sample} erroneously assigned to {name}")
 
-		total: Decimal = Decimal(str(float(sum(all_probabilities))))
-		if not total == Decimal('1.0'):
-			raise ValueError(f"total law of probability violated, got {total} but expected {1.0}")
+		probabilities = np.array([float(p) for p in pspace.values()], dtype=float)
+		validate_probabilities(probabilities, tolerance)
 
 		return super(RandVarBase, cls).__new__(cls)
 
+	@staticmethod
+	def _validate_arrays(values, probabilities, tolerance: float = PROBABILITY_TOLERANCE) -> None:
+		"""vectorised validation of a probability law passed as arrays, c.f., ``__new__``"""
+		values = np.asarray(values, dtype=float)
+		probabilities = np.asarray(probabilities, dtype=float)
+
+		if not values.shape == probabilities.shape or not values.ndim == 1:
+			raise ValueError(f"shape mismatch, got values of shape {values.shape} and probabilities of shape {probabilities.shape}")
+
+		if not len(np.unique(values)) == len(values):
+			raise ValueError("not all samples are unique")
+
+		validate_probabilities(probabilities, tolerance)
+
 	def __init__(self, **kwargs):
 		"""Constructor method
 
+		Summary
+		-------
+		The probability law is stored as a sorted array of sample values, ``values``, 
+		alongside an array of their probabilities, ``probabilities``, both held on the
+		numeric backend ``backend``. Samples with zero probability are dropped. The dict 
+		``pspace`` is built from these arrays on demand. The name is held as a ``LazyName``,
+		rendered to a ``sympy.Expr`` only when ``name`` is accessed.
+
 		"""
 		self.name: sp.Expr = kwargs['name']
+		self.backend: NumericBackend = get_backend(kwargs.get('backend'))
+		if 'pspace' in kwargs:
+			pspace: dict = kwargs['pspace']
+			values = [sample.value for sample in pspace.keys()]
+			probabilities = list(pspace.values())
+		else:
+			values = kwargs['values']
+			probabilities = kwargs['probabilities']
+
+		values = self.backend.array(values)
+		probabilities = self.backend.array(probabilities)
+
+		order = np.argsort(values, kind='stable')
+		nonzero = probabilities[order] != 0
+		self.values: np.ndarray = readonly(values[order][nonzero])
+		self.probabilities: np.ndarray = readonly(probabilities[order][nonzero])
+
+	@classmethod
+	def _from_arrays(cls, name: sp.Expr, values: np.ndarray, probabilities: np.ndarray, backend: NumericBackend = None):
+		"""Trusted constructor
+
+		Summary
+		-------
+		Initialise directly from sorted, unique sample values with non-zero probabilities,
+		skipping argument validation. Internal use only, for results which are correct by
+		construction (e.g., convolutions of valid probability laws). If no backend is 
+		passed, it is inferred from the arrays
+
+		"""
+		randvar = object.__new__(cls)
+		randvar.name = name
+		randvar.backend = array_backend(values) if backend is None else backend
+		randvar.values = readonly(values)
+		randvar.probabilities = readonly(probabilities)
+		return randvar
+
+	@classmethod
+	def _from_pspace(cls, name: sp.Expr, pspace: dict, backend: NumericBackend = None):
+		"""Trusted constructor from a ``pspace`` dict, skipping argument validation (c.f., ``_from_arrays``)"""
+		randvar = object.__new__(cls)
+		randvar.__init__(name=name, pspace=pspace, backend=backend)
+		return randvar
+
+	@property
+	def name(self) -> sp.Expr:
+		"""the name of the random variable as a ``sympy.Expr``, rendered on first access (c.f., ``LazyName``)"""
+		return self._name.expr()
+
+	@name.setter
+	def name(self, name) -> None:
+		self._name: LazyName = as_name(name)
+
+	@property
+	def pspace(self) -> dict:
+		"""the probability law as a dict, keys are ``SampleBase`` objects and values are probabilities"""
 		try:
-			self.pspace: dict = {k: Decimal(str(v)) for k, v in kwargs['pspace'].items() if Decimal(str(v)) != Decimal('0')}
-		except InvalidOperation:
-			# kwargs['pspace'].values() are Fraction objects, leave as raw
-			self.pspace: dict = kwargs['pspace']
+			return self._pspace
+		except AttributeError:
+			from_value = self._sample_class._from_value
+			name = self.name
+			self._pspace: dict = {
+					from_value(name, value): probability 
+					for value, probability in zip(self.values.tolist(), self.probabilities.tolist())
+				}
+			return self._pspace
 
 	def to_tuple(self) -> tuple:
 		"""cast pspace to a tuple object, allows for hashing the pspace
@@ -99,20 +233,44 @@ class RandVarBase:
 		return tuple([(k, v) for k, v in pspace.items()])
 
 	def __eq__(self, second_rv: object) -> bool:
+		"""Test for when two ``RandVarBase`` objects are equivalent
 
-		if not self.name == second_rv.name:
+		Summary
+		-------
+		Equivalent random variables share their name and sample values, with
+		probabilities agreeing up to floating point accuracy. Names are compared
+		last, since this may require rendering them
+		
+		"""
+		if not isinstance(second_rv, RandVarBase):
+			return NotImplemented
+
+		# compared as floats, so equivalence holds across numeric backends
+		if not np.array_equal(self.values.astype(float), second_rv.values.astype(float)):
 			return False
 
-		if not self.to_tuple() == second_rv.to_tuple():
+		if not np.allclose(self.probabilities.astype(float), second_rv.probabilities.astype(float), rtol=1e-09, atol=1e-12):
 			return False
 		
-		return True
+		return self._name.equals(second_rv._name)
+
+	@property
+	def fingerprint(self) -> bytes:
+		"""content fingerprint of the probability law and its backend, computed once (c.f., ``ArithmeticCache``)"""
+		try:
+			return self._fingerprint
+		except AttributeError:
+			self._fingerprint: bytes = fingerprint(self.backend.name, self.values, self.probabilities)
+			return self._fingerprint
 
 	def __hash__(self) -> int:
-		"""assign unique hash value to ``RandVarBase`` object"""
-		name = self.name 
-		pspace_tuple: tuple = self.to_tuple()
-		return hash(name) + hash(pspace_tuple)
+		"""assign hash value to ``RandVarBase`` object from its support, computed once. Names are not rendered to hash"""
+		try:
+			return self._hash
+		except AttributeError:
+			# as floats, so equivalent random variables on different backends share their hash; -0.0 is 0.0
+			self._hash: int = hash((self.values.astype(float) + 0.0).tobytes())
+			return self._hash
 	
 	def __str__(self) -> str:
 		"""RandVarBase objects are displayed on console by their name, samples and probabilties
@@ -1,8 +1,19 @@
+from ._backend import get_backend
 import sympy as sp
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from fractions import Fraction
 
 class SampleBase:
+	"""
+
+	Summary
+	-------
+	Samples are immutable and slotted, i.e., hold no instance ``__dict__``. The hash
+	is computed once on construction, so that samples are cheap as dict keys (e.g.,
+	in the ``pspace`` of random variables and joint distributions).
+
+	"""
+	__slots__ = ('name', 'value', '_hash')
 
 	def __new__(cls, **kwargs):
 		"""Argument validation before calling the constructor method 
@@ -15,7 +26,10 @@ class SampleBase:
 		value : int, float, Decimal or Fraction type object
 			The value assigned to the sample. 
 
-			Note, `value` will be converted to a ``Decimal`` or ``Fraction`` type object.
+			Note, `value` will be converted to the number type of the numeric backend.
+
+		backend : str or NumericBackend, optional
+			the numeric backend for `value` (c.f., ``NumericBackend``), default is the current default backend
 
 		Raises
 		------
@@ -44,11 +58,39 @@ class SampleBase:
 
 	def __init__(self, **kwargs) -> None:
 
-		self.name: sp.Expr = kwargs['name']
-		try:
-			self.value: Decimal = Decimal(str(kwargs['value'])) # convert int or float type to Decimal
-		except InvalidOperation: # value passed is a Fraction object, keep as raw
-			self.value: Fraction = kwargs['value']
+		name: sp.Expr = kwargs['name']
+		value = get_backend(kwargs.get('backend')).number(kwargs['value'])
+		self._set(name, value)
+
+	def _set(self, name: sp.Expr, value) -> None:
+		"""assign the (immutable) attributes and the hash"""
+		object.__setattr__(self, 'name', name)
+		object.__setattr__(self, 'value', value)
+		object.__setattr__(self, '_hash', hash(name) + hash(value))
+
+	@classmethod
+	def _from_value(cls, name: sp.Expr, value):
+		"""Trusted constructor
+
+		Summary
+		-------
+		Initialise directly from a name and a value already on the numeric backend,
+		skipping argument validation and conversion. Internal use only, e.g., for 
+		building the ``pspace`` view from arrays
+
+		"""
+		sample = object.__new__(cls)
+		sample._set(name, value)
+		return sample
+
+	def __setattr__(self, attribute: str, value) -> None:
+		raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+	def __delattr__(self, attribute: str) -> None:
+		raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+	def __reduce__(self):
+		return (type(self)._from_value, (self.name, self.value))
 
 	# __eq__ and __hash__ ensures hashability of Sample objects
 	def __eq__(self, second: object) -> bool:
@@ -60,6 +102,15 @@ class SampleBase:
 		False
 		
 		"""
+		if not isinstance(second, SampleBase):
+			return NotImplemented
+
+		if self is second:
+			return True
+
+		if not self._hash == second._hash:
+			return False
+
 		if not self.name == second.name:
 			return False
 
@@ -69,8 +120,8 @@ class SampleBase:
 		return True
 	
 	def __hash__(self) -> int:
-		"""assign unique hash value to ``SampleBase`` object"""
-		return hash(self.name) + hash(self.value)
+		"""assign unique hash value to ``SampleBase`` object, precomputed on construction"""
+		return self._hash
 	
 	def __str__(self) -> str:
 		"""``SampleBase`` objects are displayed on console by their name and value
@@ -0,0 +1,37 @@
+from .. import SampleBase, RandVarBase, get_backend, numeric_backend, promote
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
+import sympy as sp
+
+name = sp.Symbol('X')
+
+def test_backend_default():
+    assert get_backend().name == 'float64'
+    with numeric_backend('decimal') as backend:
+        assert get_backend() is backend
+        assert isinstance(SampleBase(name=name, value=0.1).value, Decimal)
+    assert get_backend().name == 'float64'
+
+def test_backend_numbers():
+    decimal, fraction = get_backend('decimal'), get_backend('fraction')
+    assert decimal.number(0.1) == Decimal('0.1')
+    assert fraction.number(0.1) == Fraction(1, 10)
+    assert fraction.number(Decimal('0.25')) == Fraction(1, 4)
+    assert promote(get_backend('float64'), fraction, decimal) is fraction
+
+    try:
+        get_backend('float32')
+        assert False
+    except ValueError:
+        pass
+
+def test_backend_randvar_base():
+    rv = RandVarBase(name=name, values=[0.2, 0.1], probabilities=[0.7, 0.3], backend='fraction')
+    assert rv.values.dtype == object
+    assert list(rv.values) == [Fraction(1, 10), Fraction(1, 5)]
+    assert sum(rv.probabilities) == 1
+
+    rv_float = RandVarBase(name=name, values=[0.2, 0.1], probabilities=[0.7, 0.3])
+    assert rv_float.values.dtype == np.float64
+    assert rv == rv_float
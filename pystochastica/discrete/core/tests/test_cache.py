@@ -0,0 +1,32 @@
+from .. import RandVarBase, ArithmeticCache, arithmetic_cache, get_arithmetic_cache, cached, fingerprint
+import numpy as np
+import sympy as sp
+
+def test_cache_lru():
+    cache = ArithmeticCache(max_bytes=2*8*10)
+    with arithmetic_cache(cache):
+        assert get_arithmetic_cache() is cache
+        first = cached(lambda: ('a',), lambda: np.zeros(10))
+        assert cached(lambda: ('a',), lambda: np.ones(10)) is first
+        assert not first.flags.writeable
+        cached(lambda: ('b',), lambda: np.zeros(10))
+        cached(lambda: ('a',), lambda: np.ones(10))
+        cached(lambda: ('c',), lambda: np.zeros(10)) # evicts 'b', the least recently used
+    assert ('a',) in cache and ('c',) in cache and ('b',) not in cache
+    assert cache.stats == {'hits': 2, 'misses': 3, 'evictions': 1, 'entries': 2, 'bytes': 160, 'max_bytes': 160}
+
+    with arithmetic_cache(None):
+        assert cached(lambda: ('a',), lambda: 1) == 1
+    # caching is off by default, keys are then never built
+    assert get_arithmetic_cache() is None
+    assert cached(lambda: 1/0, lambda: 1) == 1
+    assert cache.stats['hits'] == 2
+
+def test_cache_fingerprint():
+    X, Y = sp.symbols('X, Y')
+    rvX = RandVarBase(name=X, values=[-1, 1], probabilities=[0.5, 0.5])
+    rvY = RandVarBase(name=Y, values=[-1, 1], probabilities=[0.5, 0.5])
+    rvZ = RandVarBase(name=X, values=[-1, 1], probabilities=[0.5, 0.5], backend='fraction')
+    assert rvX.fingerprint == rvY.fingerprint and rvX.fingerprint != rvZ.fingerprint
+    assert len(fingerprint(np.zeros(3))) == 16
+    assert hash(rvX) == hash(rvZ) and rvX == rvZ
@@ -34,3 +34,16 @@ def test_jd_shorthands():
     assert len(jd.margs) == jd.dimension
     assert len(jd.secnds) == 1
 
+
+def test_jd_columnar_init():
+    jd = JointDistribution(
+        name=[X, Y],
+        values=[[1.5, 0], [1.5, 1], [-1, 0], [-1, 1]],
+        probabilities=[0.14, 0.35, 0.19, 0.32]
+    )
+    assert jd == JointDistribution(pspace=jd_init_dict)
+    assert jd.values.shape == (4, 2)
+    assert len(jd.pspace) == 4
+
+    jd.derive_marginals()
+    assert jd.marginals[0].pspace[SampleBase(name=X, value=1.5)] == 0.49
@@ -0,0 +1,38 @@
+from .. import LazyName, as_name, dot_names, RandVarBase
+import sympy as sp
+
+X, Y = sp.symbols('X, Y')
+
+def test_names_render():
+    name = 0.5*as_name(X) + Y - 2
+    assert name.expr() == X/2 + Y - 2
+    assert (as_name(X)**2*Y).expr() == X**2*Y
+    assert dot_names([X, Y], [1, 0.1]).expr() == X + Y/10
+
+def test_names_deep_chain():
+    symbols = sp.symbols('X_0:5000')
+    name = as_name(symbols[0])
+    for symbol in symbols[1:]:
+        name = name + symbol # far deeper than the recursion limit
+    assert name.expr() == sp.Add(*symbols)
+
+def test_names_equals():
+    first, second = as_name(X) + Y, as_name(Y) + X
+    assert not first.same(second)
+    assert first.equals(second)
+    assert (as_name(X) + Y).same(first)
+    assert (-1*first).cancels(first)
+    assert not first.cancels(second)
+
+    # cancellations beyond (-1)*name are found by rendering names over common symbols
+    assert (2*as_name(X)).cancels((-2)*as_name(X))
+    assert (1*as_name(X)).cancels(-1*as_name(X)*1)
+    assert as_name(0).cancels(as_name(sp.S.Zero))
+    assert not (2*as_name(X)).cancels(-2*as_name(Y))
+    assert (as_name(X) + Y).free_symbols == {X, Y}
+
+def test_names_randvar_base():
+    rv = RandVarBase(name=X, values=[0, 1], probabilities=[0.5, 0.5])
+    assert isinstance(rv._name, LazyName)
+    assert rv.name == X
+    assert rv == RandVarBase._from_arrays(as_name(X)*1, rv.values, rv.probabilities)
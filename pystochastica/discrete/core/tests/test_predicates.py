@@ -0,0 +1,14 @@
+from .. import parse_predicate, event_mask, get_backend
+from fractions import Fraction
+import numpy as np
+
+def test_predicate_parse():
+    assert parse_predicate('<= 1') == (('<=', Fraction(1)),)
+    assert parse_predicate(' > -1 and <= 2.5') == (('>', Fraction(-1)), ('<=', Fraction(5, 2)))
+    assert parse_predicate('< 1e-3') == (('<', Fraction(1, 1000)),)
+    assert parse_predicate('< inf') == (('<', float('inf')),)
+    assert parse_predicate('% 2 == 0') is None
+
+    values = np.array([-1.0, 0.0, 1.0, 2.0])
+    assert event_mask(values, '> -1 and != 1', get_backend()).tolist() == [False, True, False, True]
+    assert event_mask(values, '% 2 == 0', get_backend()).tolist() == [False, True, False, True]
@@ -24,4 +24,23 @@ def test_randvar_eq():
     rv3 = RandVarBase(**{'name': new_name, 'pspace': new_pspace})
 
     assert rv == rv2
-    assert rv != rv3
\ No newline at end of file
+    assert rv != rv3
+
+def test_randvar_arrays_init():
+    rv = RandVarBase(**{'name': name, 'pspace': pspace})
+    rv_arrays = RandVarBase(**{'name': name, 'values': [1.0, -1], 'probabilities': [0.34, 0.66]})
+
+    assert list(rv_arrays.values) == [-1.0, 1.0] # values are sorted
+    assert rv == rv_arrays
+    assert set(rv_arrays.pspace.keys()) == set(pspace.keys())
+
+def test_randvar_tolerance():
+    probabilities: list = [0.34, 0.66 + 1e-6]
+    try:
+        RandVarBase(**{'name': name, 'values': [1.0, -1], 'probabilities': probabilities})
+        raise AssertionError("total law of probability is violated")
+    except ValueError:
+        pass
+
+    rv = RandVarBase(**{'name': name, 'values': [1.0, -1], 'probabilities': probabilities, 'tolerance': 1e-5})
+    assert rv == RandVarBase._from_pspace(name, {SampleBase(name=name, value=1.0): 0.34, SampleBase(name=name, value=-1): 0.66 + 1e-6})
@@ -19,3 +19,15 @@ def test_sample_eq():
 
     assert sample_obj == second_sample
     assert not sample_obj == third_sample
+
+def test_sample_immutable():
+    sample_obj = SampleBase(**{'name': name, 'value': value})
+    assert not hasattr(sample_obj, '__dict__')
+    assert sample_obj == SampleBase._from_value(name, 3.5)
+    assert hash(sample_obj) == hash(SampleBase._from_value(name, 3.5))
+
+    try:
+        sample_obj.value = 4
+        raise AssertionError("sample objects are immutable")
+    except AttributeError:
+        pass
@@ -1,3 +1,4 @@
+import numpy as np
 import matplotlib.pyplot as plt
 
 class DiscreteStochasticProcess:
@@ -24,7 +25,7 @@ class DiscreteStochasticProcess:
         """
         self.time_steps: list[int] = time_steps
 
-    def plot_process(self, **kwargs):
+    def plot_process(self, rng: np.random.Generator = None, **kwargs):
         """
 
         The ``plot_process`` methid is to be called after a process has been
@@ -35,6 +36,9 @@ class DiscreteStochasticProcess:
         stop : int, optional
             the number of random variables to sample in the discrete process 
 
+        rng : numpy.random.Generator, optional
+            the source of randomness, also accepts a seed. Default is the global state of ``numpy.random``
+
         Returns
         -------
         plot : matplotlib.pyplot
@@ -45,7 +49,8 @@ class DiscreteStochasticProcess:
         # all processes are of RandVar objects, so they can be plotted in 2 dimensions
         process: list = self.process
         x = [i for i in range(self.time_steps)]
-        y = [process[i].generate(1)[0] for i in range(self.time_steps)]
+        rng = None if rng is None else np.random.default_rng(rng)
+        y = [process[i].generate(1, rng=rng)[0] for i in range(self.time_steps)]
         try:
             stop: int = kwargs['stop']
         except KeyError:
@@ -50,17 +50,17 @@ class RandWalk(DSP):
         -------
         Generate and store in memory (i.e., as a class attribute) 
         the stochastic process as determined by the ``RandWalk``
-        class instance
+        class instance. The n-th random variable is the sum of n 
+        independent steps, obtained from ``RandVar.iid_sum``
 
         """
         name = sp.Symbol('0')
-        rv = RandVar(**{'name': name, 'pspace': {Sample(name=name, value=0): 1.0}})
+        rv = RandVar._from_pspace(name, {Sample(name=name, value=0): 1.0})
         process: list = [rv]
-        for i in range(self.time_steps-1):
-            name = sp.Symbol(f"X_{i}")
-            pspace: dict = {Sample(name=name, value=-1): self.p, Sample(name=name, value=1): self.q}
-            rv += RandVar(**{'name': name, 'pspace': pspace})
-            process += [rv]
+        if self.time_steps > 1:
+            name = sp.Symbol('X')
+            step = RandVar(**{'name': name, 'pspace': {Sample(name=name, value=-1): self.p, Sample(name=name, value=1): self.q}})
+            process += step.iid_sum(self.time_steps-1, partial_sums=True)
 
         self.process: list = process
 
@@ -1,7 +1,6 @@
-from ..core import SampleBase
-from decimal import Decimal, InvalidOperation
+from ..core import SampleBase, promote, backend_of, sympify_number
+from decimal import Decimal
 from fractions import Fraction
-import sympy as sp
 
 class Sample(SampleBase):
 	"""
@@ -9,8 +8,9 @@ class Sample(SampleBase):
 	Summary
 	-------
 	``Sample`` is a subclass of the ``SampleBase`` class. The samples of 
-	random variables are instances of ``Sample``. Any ``int`` and ``float`` 
-	objects are converted to ``Decimal`` to ensure numerical accuracy. Arithmetic 
+	random variables are instances of ``Sample``. Values are held on the numeric 
+	backend (c.f., ``NumericBackend``), arithmetic between values on different 
+	backends is carried out on the more exact one. Arithmetic 
 	coded for ``Sample`` objects are
 
 	- addition
@@ -18,31 +18,24 @@ class Sample(SampleBase):
 	- multiplication
 	- exponentiation
 	
-	Note
-	----
-	``Decimal`` + ``Fraction`` results in ``TypeError``. This error is *not* raised 
-	so users will need to manage this error.
-
 	"""
+	__slots__ = ()
+
 	def __init__(self, **kwargs) -> None:
 		super().__init__(**kwargs)
 
 	def __add__(self, second_sample):
-		
+
 		if isinstance(second_sample, (int, float, Decimal, Fraction)):
-			try:
-				second_sample = Decimal(str(second_sample))
-			except InvalidOperation:
-				# second_sample is a Fraction object
-				pass
-			new_name = self.name + second_sample
-			new_value = self.value + second_sample
+			new_name = self.name + sympify_number(second_sample)
+			second_value = second_sample
 		else:
-			new_name = self.name + second_sample.name 
-			new_value = self.value + second_sample.value
+			new_name = self.name + second_sample.name
+			second_value = second_sample.value
 
-		new_name = sp.nsimplify(new_name)
-		return Sample(**{'name': new_name, 'value': new_value})
+		backend = promote(backend_of(self.value), backend_of(second_value))
+		new_value = backend.number(self.value) + backend.number(second_value)
+		return Sample._from_value(new_name, new_value)
 
 	def __radd__(self, second_sample):
 		return self.__add__(second_sample)
@@ -50,19 +43,15 @@ class Sample(SampleBase):
 	def __mul__(self, second_sample):
 
 		if isinstance(second_sample, (int, float, Decimal, Fraction)):
-			try:
-				second_sample = Decimal(str(second_sample))
-			except InvalidOperation:
-				# second_sample is a Fraction object
-				pass
-			new_name = self.name * second_sample
-			new_value = self.value * second_sample
+			new_name = self.name * sympify_number(second_sample)
+			second_value = second_sample
 		else:
 			new_name = self.name * second_sample.name
-			new_value = self.value * second_sample.value
-			
-		new_name = sp.nsimplify(new_name)
-		return Sample(**{'name': new_name, 'value': new_value})
+			second_value = second_sample.value
+
+		backend = promote(backend_of(self.value), backend_of(second_value))
+		new_value = backend.number(self.value) * backend.number(second_value)
+		return Sample._from_value(new_name, new_value)
 
 	def __rmul__(self, second_sample):
 		return self.__mul__(second_sample)
@@ -82,5 +71,5 @@ class Sample(SampleBase):
 
 		new_name = self.name**power 
 		new_value = self.value**power
-		return Sample(**{'name': new_name, 'value': new_value})
+		return Sample._from_value(new_name, backend_of(self.value).number(new_value))
 
@@ -1 +1,2 @@
-from ._simulation import RandVarSimulator
\ No newline at end of file
+from ._simulation import RandVarSimulator
+from ._sampler import AliasSampler
\ No newline at end of file
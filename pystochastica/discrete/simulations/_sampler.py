@@ -0,0 +1,76 @@
+import numpy as np
+
+class AliasSampler:
+    """
+
+    Summary
+    -------
+    Sampler for discrete probability laws by Walker's alias method, as
+    constructed by Vose. The alias table is built once, in time linear in the
+    number of outcomes, after which each draw costs O(1): a uniformly chosen
+    outcome is kept or replaced by its alias according to a single uniform number.
+
+    Example
+    -------
+    >>> sampler = AliasSampler([0.2, 0.5, 0.3])
+    >>> sampler.draw(5, rng=numpy.random.default_rng(0))
+    array([2, 1, 1, 1, 1])
+
+    """
+    def __init__(self, probabilities) -> None:
+        """Constructor method
+
+        Parameters
+        ----------
+        probabilities : array_like
+            the probabilities of each outcome, indexed 0, 1, 2, ...; normalised to sum to 1
+
+        """
+        probabilities = np.asarray(probabilities, dtype=float)
+        size: int = len(probabilities)
+        scaled = probabilities * (size / probabilities.sum())
+
+        threshold = np.ones(size)
+        alias = np.arange(size)
+        small: list[int] = np.flatnonzero(scaled < 1).tolist()
+        large: list[int] = np.flatnonzero(scaled >= 1).tolist()
+        while small and large:
+            less, more = small.pop(), large.pop()
+            threshold[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # leftover outcomes have scaled probability 1 up to rounding
+        self.size: int = size
+        self.threshold: np.ndarray = threshold
+        self.alias: np.ndarray = alias
+
+    def draw(self, iterations: int, rng: np.random.Generator = None) -> np.ndarray:
+        """draw outcome indices
+
+        Parameters
+        ----------
+        iterations : int
+            the number of independent draws
+
+        rng : numpy.random.Generator, optional
+            the source of randomness, also accepts a seed. Default is the global state of ``numpy.random``, as set by ``numpy.random.seed``
+
+        Returns
+        -------
+        indices : np.ndarray
+            the drawn outcomes as ``int`` indices into the probabilities passed
+
+        """
+        if rng is None:
+            columns = np.random.randint(0, self.size, size=iterations)
+            keep = np.random.random(iterations) < self.threshold[columns]
+        else:
+            rng = np.random.default_rng(rng)
+            columns = rng.integers(0, self.size, size=iterations)
+            keep = rng.random(iterations) < self.threshold[columns]
+        return np.where(keep, columns, self.alias[columns])
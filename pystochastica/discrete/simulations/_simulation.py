@@ -1,4 +1,5 @@
 from ..core import RandVarBase
+import numpy as np
 import matplotlib.pyplot as plt
 
 class RandVarSimulator:
@@ -132,27 +133,27 @@ class RandVarSimulator:
         plt.tight_layout()
         plt.show()
 
-    def pdfs(self, *randvars):
+    def pdfs(self, *randvars, rng: np.random.Generator = None):
         """
         
         Parameters
         ----------
         randvars : list[RandVar]
             a list of ``RandVar`` objects    
+
+        rng : numpy.random.Generator, optional
+            the source of randomness, also accepts a seed. Default is the global state of ``numpy.random``
         
         """
+        rng = None if rng is None else np.random.default_rng(rng)
         # generate plot data for pdf plots
         plt_data: dict = {}
         for randvar in randvars:
             plt_data[randvar] = {}
-            rv_outcomes = {sample.value: 0 for sample in randvar.pspace}
-            outcomes: list = randvar.generate(self.ITERATIONS)
-            for outcome in outcomes:
-                rv_outcomes[outcome] += 1
-            
-            rv_outcomes = dict(sorted(rv_outcomes.items())) # sorted by key
-            plt_data[randvar]['x'] = list(rv_outcomes.keys())
-            plt_data[randvar]['y'] = list(rv_outcomes.values())
+            # count outcomes by their index into the (sorted) support
+            outcomes: np.ndarray = randvar.sampler.draw(self.ITERATIONS, rng=rng)
+            plt_data[randvar]['x'] = list(randvar.values)
+            plt_data[randvar]['y'] = list(np.bincount(outcomes, minlength=len(randvar.values)))
             plt_type: str = 'bar'
 
         # optional parameters for decorating the plot, e.g., color, xtick rotation etc.
@@ -191,8 +192,8 @@ class RandVarSimulator:
         plt_data: dict = {}
         for randvar in randvars:
             plt_data[randvar] = {}
-            x = sorted([sample.value for sample in randvar.pspace])
-            y = [randvar.Prob(f'<= {val}') for val in x]
+            x = list(randvar.values)
+            y = list(randvar.cumulative) # Pr(X <= x) over the sorted support, in a single pass
             plt_data[randvar]['x'] = x
             plt_data[randvar]['y'] = y 
             plt_type: str = 'plot'
@@ -1,4 +1,7 @@
 from .dict_convolution import convolve_dicts, convolve_dicts_many
 from .dict_multiply import dict_mul
 from .dict_conversions import rvdict_to_samples, rvdict_to_pspace, rvdict_to_init
-from .jointdist_generators import generate_jdist, generate_jdist_random
\ No newline at end of file
+from .jointdist_generators import generate_jdist, generate_jdist_random, generate_jdist_columnar, product_arrays, product_chunks
+from .array_reduction import reduce_arrays, reduce_rows, combine_arrays, combine_many_arrays
+from .array_convolution import convolve_arrays, convolve_dense, convolve_rows, lattice_indices
+from .array_approximation import prune_arrays, rebin_arrays
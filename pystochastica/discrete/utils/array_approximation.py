@@ -0,0 +1,119 @@
+from ..core import array_backend
+import numpy as np
+
+def prune_arrays(values: np.ndarray, probabilities: np.ndarray, threshold: float) -> tuple:
+    """Epsilon-mass pruning of a probability law
+
+    Summary
+    -------
+    Drop the atoms with probability below ``threshold`` and renormalise the remaining
+    probabilities. If all atoms fall below the threshold, the most likely atom is kept.
+    Works for laws of random variables, with ``values`` of shape ``(N,)``, as well as
+    for joint distributions, with ``values`` of shape ``(N, dimension)``.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        the sample values, or joint samples as rows
+
+    probabilities : np.ndarray
+        the probabilities of each entry in ``values``
+
+    threshold : float
+        atoms with probability strictly below ``threshold`` are dropped
+
+    Returns
+    -------
+    result : tuple
+        ``(values, probabilities, lost_mass, wasserstein)``, the pruned law, the mass dropped
+        before renormalising and an upper bound on the Wasserstein-1 distance (in the 1-norm)
+        between the pruned and the passed law
+
+    Example
+    -------
+    >>> prune_arrays(np.array([0., 1., 2.]), np.array([0.001, 0.499, 0.5]), 0.01)
+    (array([1., 2.]), array([0.4994995, 0.5005005]), 0.001, 0.002)
+
+    """
+    keep = probabilities >= threshold
+    if np.all(keep):
+        return values, probabilities, 0.0, 0.0
+    if not np.any(keep):
+        keep[np.argmax(probabilities.astype(float))] = True
+
+    kept_values, kept_probabilities = values[keep], probabilities[keep]
+    lost_mass: float = float(probabilities[~keep].astype(float).sum())
+    kept_probabilities = kept_probabilities / kept_probabilities.sum()
+
+    # renormalising moves each dropped atom onto the kept atoms, at most as far as the furthest one
+    dropped = values[~keep].astype(float).reshape(len(probabilities) - len(kept_probabilities), -1)
+    kept = kept_values.astype(float).reshape(len(kept_probabilities), -1)
+    furthest = np.maximum(np.abs(dropped - kept.min(axis=0)), np.abs(dropped - kept.max(axis=0))).sum(axis=1)
+    wasserstein: float = float(furthest @ probabilities[~keep].astype(float))
+
+    return kept_values, kept_probabilities, lost_mass, wasserstein
+
+def rebin_arrays(values: np.ndarray, probabilities: np.ndarray, size: int) -> tuple:
+    """Rebinning of a probability law onto a grid, preserving mean and variance
+
+    Summary
+    -------
+    Each atom is split between its two neighbouring points on a uniform grid of ``size``
+    points spanning the support, in proportion to its distance to either. This preserves
+    the mean and only increases the variance, which is then restored by contracting the
+    grid about the mean. Laws on an exact numeric backend are rebinned in ``float64``
+    and converted back.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        the sorted, unique sample values
+
+    probabilities : np.ndarray
+        the probabilities of each entry in ``values``
+
+    size : int
+        the number of grid points, at least 2. Laws supported on at most ``size`` points
+        are returned as passed
+
+    Returns
+    -------
+    result : tuple
+        ``(values, probabilities, wasserstein)``, the rebinned law and an upper bound on
+        the Wasserstein-1 distance between the rebinned and the passed law
+
+    Raises
+    ------
+    ValueError
+        if ``size`` is less than 2
+
+    """
+    if size < 2:
+        raise ValueError(f"cannot rebin onto {size} points while preserving the variance, need at least 2")
+    if len(values) <= size:
+        return values, probabilities, 0.0
+
+    backend = array_backend(values)
+    x, p = values.astype(float), probabilities.astype(float)
+    lower, upper = x[0], x[-1]
+    step: float = (upper - lower) / (size - 1)
+    grid = lower + step*np.arange(size)
+
+    # mean preserving split onto the neighbouring grid points
+    left = np.minimum(((x - lower) // step).astype(np.int64), size - 2)
+    right_weight = np.clip((x - grid[left]) / step, 0, 1)
+    rebinned = np.bincount(left, weights=p*(1 - right_weight), minlength=size)
+    rebinned += np.bincount(left + 1, weights=p*right_weight, minlength=size)
+    split_cost: float = float(2*step*(p @ (right_weight*(1 - right_weight))))
+
+    # contract about the mean to restore the variance
+    mean: float = float(x @ p)
+    variance: float = float(((x - mean)**2) @ p)
+    rebinned_variance: float = float(((grid - mean)**2) @ rebinned)
+    contraction: float = np.sqrt(variance / rebinned_variance) if rebinned_variance > 0 else 1.0
+    contraction_cost: float = float((1 - contraction) * (np.abs(grid - mean) @ rebinned))
+    grid = mean + (grid - mean)*contraction
+
+    nonzero = rebinned > 0
+    grid, rebinned = grid[nonzero], rebinned[nonzero] / rebinned[nonzero].sum()
+    return backend.array(grid), backend.array(rebinned), split_cost + contraction_cost
@@ -0,0 +1,199 @@
+from .array_reduction import combine_arrays, reduce_rows
+import numpy as np
+
+MAX_DECIMALS: int = 12 # finest decimal grid tested for in lattice detection
+MAX_LATTICE_LENGTH: int = 2**26 # longest dense probability vector convolved
+DIRECT_LENGTH: int = 64 # below this length, convolve directly rather than by FFT
+EPSILON: float = np.finfo(float).eps
+ROW_PAIRS: int = 2**20 # largest number of pairs of joint samples summed at once
+
+def lattice_indices(*value_arrays, max_decimals: int = MAX_DECIMALS):
+    """Common lattice for sample values
+
+    Summary
+    -------
+    Test whether all the passed arrays of sample values lie on a common decimal
+    grid, i.e., whether every value can be written as ``(origin + step*index)/scale``
+    for integers ``origin``, ``step`` and ``index`` and ``scale`` a power of ten.
+    The origin is taken per array, the step and scale are shared. Distinct values
+    are put on distinct grid points, or no lattice is returned. Arrays on an
+    exact numeric backend are never put on a lattice, as to stay exact.
+
+    Parameters
+    ----------
+    value_arrays : list[np.ndarray]
+        sorted arrays of sample values
+
+    max_decimals : int, optional
+        the number of decimal places to test for, default is 12
+
+    Returns
+    -------
+    result : tuple or None
+        ``(scale, step, origins, indices)`` if a common lattice exists, else ``None``.
+        Here ``origins`` is a list of ints and ``indices`` a list of int arrays.
+
+    Example
+    -------
+    >>> lattice_indices(np.array([-0.5, 0.5]), np.array([0.0, 1.5]))
+    (10, 5, [-5, 0], [array([0, 2]), array([0, 3])])
+
+    """
+    if any(values.dtype == object for values in value_arrays):
+        return None
+
+    for decimals in range(max_decimals + 1):
+        scale: int = 10**decimals
+        scaled = [values * scale for values in value_arrays]
+        if any(np.any(np.abs(s) > 2**52) for s in scaled):
+            return None # beyond integer precision of float64
+
+        # integral up to rounding errors on the order of the largest value
+        rounded = [np.rint(s) for s in scaled]
+        if not all(np.all(np.abs(s - r) <= 16*EPSILON*max(np.abs(s).max(), 1)) for s, r in zip(scaled, rounded)):
+            continue
+        # distinct values within rounding errors of each other would share a grid point
+        if all(np.all(np.diff(r) > 0) for r in rounded):
+            break
+    else:
+        return None
+
+    integers = [r.astype(np.int64) for r in rounded]
+    origins = [int(k[0]) for k in integers]
+    step = int(np.gcd.reduce(np.concatenate([k - k[0] for k in integers])))
+    step = max(step, 1) # all arrays are single points
+    indices = [(k - origin)//step for k, origin in zip(integers, origins)]
+    return scale, step, origins, indices
+
+def convolve_dense(first: np.ndarray, second: np.ndarray, nonnegative: bool = False) -> np.ndarray:
+    """Convolution of dense vectors
+
+    Summary
+    -------
+    Convolve directly through ``numpy.convolve`` if either vector is short, else
+    through the real FFT. For nonnegative vectors such as probabilities, entries which
+    are zero in the exact convolution are recovered as exact zeros by also convolving
+    the supports, and negative rounding errors are clipped.
+
+    Parameters
+    ----------
+    first, second : np.ndarray
+        the dense vectors, of float64
+
+    nonnegative : bool, optional
+        True if both vectors are nonnegative, default is False
+
+    """
+    if min(len(first), len(second)) <= DIRECT_LENGTH:
+        return np.convolve(first, second)
+
+    length: int = len(first) + len(second) - 1
+    fft_length: int = 1 << (length - 1).bit_length()
+    def _fft_convolve(a, b):
+        return np.fft.irfft(np.fft.rfft(a, fft_length) * np.fft.rfft(b, fft_length), fft_length)[:length]
+
+    convolved = _fft_convolve(first, second)
+    if not nonnegative:
+        return convolved
+    support = _fft_convolve(first != 0, second != 0) > 0.5
+    return np.where(support, np.clip(convolved, 0, None), 0.0)
+
+def convolve_arrays(
+        first_values: np.ndarray,
+        first_probabilities: np.ndarray,
+        second_values: np.ndarray,
+        second_probabilities: np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray]:
+    """Law of the sum of independent random variables
+
+    Summary
+    -------
+    If the sample values of both laws lie on a common integer or decimal grid
+    (c.f., ``lattice_indices``), the probabilities are scattered onto dense vectors
+    over the grid and convolved there (c.f., ``convolve_dense``). Otherwise, fall back to
+    the outer sum of sample values, reduced by sorting (c.f., ``combine_arrays``).
+
+    Parameters
+    ----------
+    first_values, first_probabilities : np.ndarray
+        the law of the first random variable, sorted by sample value
+
+    second_values, second_probabilities : np.ndarray
+        the law of the second random variable, sorted by sample value
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        sorted, unique sample values and their probabilities
+
+    """
+    size: int = len(first_values) * len(second_values)
+    lattice = lattice_indices(first_values, second_values)
+    if lattice is not None:
+        scale, step, (first_origin, second_origin), (first_indices, second_indices) = lattice
+        dense_length: int = int(first_indices[-1]) + int(second_indices[-1]) + 1
+        if dense_length <= min(4*size, MAX_LATTICE_LENGTH):
+            # accumulate rather than assign, so no probability is overwritten
+            first_dense = np.bincount(first_indices, weights=first_probabilities, minlength=int(first_indices[-1]) + 1)
+            second_dense = np.bincount(second_indices, weights=second_probabilities, minlength=int(second_indices[-1]) + 1)
+
+            convolved = convolve_dense(first_dense, second_dense, nonnegative=True)
+            indices = np.flatnonzero(convolved)
+            values = (first_origin + second_origin + step*indices) / scale
+            return values, convolved[indices]
+
+    return combine_arrays(first_values, first_probabilities, second_values, second_probabilities, np.add)
+
+def convolve_rows(
+        first_values: np.ndarray,
+        first_probabilities: np.ndarray,
+        second_values: np.ndarray,
+        second_probabilities: np.ndarray,
+        chunk_size: int = ROW_PAIRS
+        ) -> tuple[np.ndarray, np.ndarray]:
+    """Law of the sum of independent random vectors
+
+    Summary
+    -------
+    The joint convolution of two joint tables: every pair of rows is summed through a
+    broadcast outer sum, the probabilities are multiplied and repeated rows are merged
+    (c.f., ``reduce_rows``). The cost is in the number of pairs of joint samples, never in
+    the product of the supports of the marginals, so dependence within each vector is kept
+    and sparse joint tables stay cheap. Beyond ``chunk_size`` pairs, the rows of the first 
+    table are taken in chunks, each reduced before the partial results are merged.
+
+    Parameters
+    ----------
+    first_values, first_probabilities : np.ndarray
+        the first joint table, rows of shape ``(N1, dimension)`` and their probabilities
+
+    second_values, second_probabilities : np.ndarray
+        the second joint table, assumed independent of the first
+
+    chunk_size : int, optional
+        the largest number of pairs of rows summed at once, default is 2**20
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        unique rows of the sum and their probabilities
+
+    Example
+    -------
+    >>> convolve_rows(np.array([[0., 0.], [1., 1.]]), np.array([0.5, 0.5]), np.array([[0., 1.]]), np.array([1.]))
+    (array([[0., 1.],
+           [1., 2.]]), array([0.5, 0.5]))
+
+    """
+    dimension: int = first_values.shape[1]
+    rows_per_chunk: int = max(1, chunk_size // len(second_values))
+    partial_laws: list = []
+    for start in range(0, len(first_values), rows_per_chunk):
+        stop: int = start + rows_per_chunk
+        values = (first_values[start:stop, None, :] + second_values[None, :, :]).reshape(-1, dimension)
+        probabilities = np.multiply.outer(first_probabilities[start:stop], second_probabilities).ravel()
+        partial_laws.append(reduce_rows(values, probabilities))
+
+    if len(partial_laws) == 1:
+        return partial_laws[0]
+    return reduce_rows(np.concatenate([values for values, _ in partial_laws]), np.concatenate([probabilities for _, probabilities in partial_laws]))
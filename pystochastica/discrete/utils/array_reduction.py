@@ -0,0 +1,180 @@
+from ..core import array_backend
+from functools import reduce
+import numpy as np
+
+OUTER_SIZE: int = 2**16 # largest outer product over many laws built at once
+
+def reduce_arrays(values: np.ndarray, probabilities: np.ndarray, drop_zeros: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    """Group-by reduction of a probability law
+
+    Summary
+    -------
+    Sort the support of a probability law given as a pair of arrays, merging
+    repeated values by summing their probabilities and dropping values carrying
+    zero probability. This is the array analogue of accumulating probabilities
+    into a dictionary keyed by sample values. Arrays on an exact numeric backend 
+    (c.f., ``NumericBackend``) are summed as python objects.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        the (possibly repeated, unsorted) sample values
+
+    probabilities : np.ndarray
+        the probabilities assigned to each entry in ``values``
+
+    drop_zeros : bool, optional
+        drop values carrying zero probability, default is True
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        sorted, unique sample values and their probabilities
+
+    Example
+    -------
+    >>> reduce_arrays(np.array([1.0, -1.0, 1.0]), np.array([0.2, 0.5, 0.3]))
+    (array([-1.,  1.]), array([0.5, 0.5]))
+
+    """
+    values = np.asarray(values).ravel()
+    probabilities = np.asarray(probabilities).ravel()
+
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    unique_probabilities = array_backend(probabilities).group_sum(inverse.ravel(), probabilities, len(unique_values))
+    if not drop_zeros:
+        return unique_values, unique_probabilities
+
+    nonzero = unique_probabilities != 0
+    return unique_values[nonzero], unique_probabilities[nonzero]
+
+def combine_arrays(
+        first_values: np.ndarray,
+        first_probabilities: np.ndarray,
+        second_values: np.ndarray,
+        second_probabilities: np.ndarray,
+        operation: np.ufunc = np.add,
+        drop_zeros: bool = True
+        ) -> tuple[np.ndarray, np.ndarray]:
+    """Law of a binary operation on independent random variables
+
+    Summary
+    -------
+    Apply ``operation`` to every pair of sample values through an outer product,
+    multiply the corresponding probabilities and merge repeated outcomes with
+    ``reduce_arrays``. For ``operation = np.add`` this is the convolution of
+    both laws.
+
+    Parameters
+    ----------
+    first_values, first_probabilities : np.ndarray
+        the law of the first random variable
+
+    second_values, second_probabilities : np.ndarray
+        the law of the second random variable, assumed independent of the first
+
+    operation : np.ufunc, optional
+        a binary ufunc with an ``outer`` method, default is ``np.add``
+
+    drop_zeros : bool, optional
+        drop outcomes carrying zero probability (c.f., ``reduce_arrays``), default is True
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        sorted, unique sample values and their probabilities
+
+    """
+    values = operation.outer(first_values, second_values)
+    probabilities = np.multiply.outer(first_probabilities, second_probabilities)
+    return reduce_arrays(values, probabilities, drop_zeros)
+
+def combine_many_arrays(laws: list[tuple], operation: np.ufunc = np.add, combine=None, drop_zeros: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    """Law of a binary operation folded over many independent random variables
+
+    Summary
+    -------
+    Like ``combine_arrays``, but now for arbitrary many laws. If the full outer
+    product is small, it is built at once by broadcasting and reduced in a single
+    pass. Otherwise, the laws are combined pairwise in a balanced tree, reducing
+    repeated values at each level so that intermediate supports stay small.
+
+    Parameters
+    ----------
+    laws : list[tuple[np.ndarray, np.ndarray]]
+        a list of ``(values, probabilities)`` pairs
+
+    operation : np.ufunc, optional
+        an associative binary ufunc with an ``outer`` method, default is ``np.add``
+
+    combine : function, optional
+        the pairwise kernel used in the balanced tree, with the signature of
+        ``combine_arrays`` less the ``operation`` argument. Default is ``combine_arrays``
+        with the passed ``operation``
+
+    drop_zeros : bool, optional
+        drop outcomes carrying zero probability (c.f., ``reduce_arrays``), default is True
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        sorted, unique sample values and their probabilities
+
+    """
+    if combine is None:
+        combine = lambda v1, p1, v2, p2: combine_arrays(v1, p1, v2, p2, operation, drop_zeros)
+
+    laws = [(np.asarray(values), np.asarray(probabilities)) for values, probabilities in laws]
+    size: int = int(np.prod([len(values) for values, _ in laws]))
+    if size <= OUTER_SIZE:
+        values = reduce(operation.outer, [values for values, _ in laws])
+        probabilities = reduce(np.multiply.outer, [probabilities for _, probabilities in laws])
+        return reduce_arrays(values, probabilities, drop_zeros)
+
+    while len(laws) > 1:
+        paired = [combine(*laws[i], *laws[i+1]) for i in range(0, len(laws) - 1, 2)]
+        if len(laws) % 2 == 1:
+            paired += [laws[-1]]
+        laws = paired
+
+    return reduce_arrays(*laws[0], drop_zeros)
+
+def reduce_rows(values: np.ndarray, probabilities: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise group-by reduction of a joint probability law
+
+    Summary
+    -------
+    Like ``reduce_arrays``, but for joint samples given as the rows of an
+    ``(N, dimension)`` array. Repeated rows are merged by summing their probabilities
+    and rows carrying zero probability are dropped. Rows are returned in
+    lexicographic order. On exact numeric backends, rows are merged through a dict
+    since ``numpy.unique`` does not sort object arrays along an axis.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        the (possibly repeated) joint samples as rows
+
+    probabilities : np.ndarray
+        the probabilities assigned to each row in ``values``
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        unique rows of joint samples and their probabilities
+
+    """
+    if values.dtype == object:
+        law: dict = {}
+        for row, probability in zip(map(tuple, values.tolist()), probabilities.tolist()):
+            law[row] = law.get(row, 0) + probability
+        rows: list = sorted(row for row, probability in law.items() if probability != 0)
+        unique_rows = np.empty((len(rows), values.shape[1]), dtype=object)
+        unique_rows[:] = rows
+        return unique_rows, np.array([law[row] for row in rows], dtype=object)
+
+    unique_rows, inverse = np.unique(values, axis=0, return_inverse=True)
+    unique_probabilities = np.bincount(inverse.ravel(), weights=probabilities, minlength=len(unique_rows))
+
+    nonzero = unique_probabilities != 0
+    return unique_rows[nonzero], unique_probabilities[nonzero]
@@ -1,4 +1,5 @@
-from itertools import product
+from ..core import NumericBackend, get_backend, promote, backend_of
+from .array_reduction import combine_arrays, combine_many_arrays
 import numpy as np
 
 def depr_convolve_dicts(first_dict: dict, second_dict: dict) -> dict:
@@ -12,14 +13,17 @@ def depr_convolve_dicts(first_dict: dict, second_dict: dict) -> dict:
                 convolved_dict[key + key2] = val*val2
     return convolved_dict
 
-def convolve_dicts(first_dict: dict, second_dict: dict) -> dict:
+def convolve_dicts(first_dict: dict, second_dict: dict, backend=None) -> dict:
     """Convolution of dictionaries
 
     Summary
     -------
     this function returns the convolution of dictionaries wih arbitrary values
     (either integral or rational) as keys. It coincides with the numpy.convolve 
-    function if these keys are ordered, natural numbers. 
+    function if these keys are ordered, natural numbers. The outer sum of the keys
+    is reduced by sorting (c.f., ``combine_arrays``), so that values of any sign are
+    convolved exactly as by the loop in ``depr_convolve_dicts``. Keys and values are
+    returned sorted by key, of the type of the inputs (c.f., ``_dicts_backend``).
 
     Parameters
     ----------
@@ -30,6 +34,10 @@ def convolve_dicts(first_dict: dict, second_dict: dict) -> dict:
         second dictionary in the convolution. Note, convolution is commutative,
         so the it doesn't matter which dictionary is first or second
 
+    backend : str, NumericBackend or None, optional
+        the numeric backend on which to convolve (c.f., ``NumericBackend``). Default is None,
+        which infers the backend from the keys and values (c.f., ``_dicts_backend``)
+
     Returns
     -------
     convolved : dict
@@ -52,30 +60,54 @@ def convolve_dicts(first_dict: dict, second_dict: dict) -> dict:
     False
 
     """
-    key_value_pairs = product(first_dict.items(), second_dict.items())
-    convolved: dict = {}
-    for (k1, v1), (k2, v2) in key_value_pairs:
-        try:
-            convolved[k1 + k2] += v1*v2
-        except KeyError:
-            convolved[k1 + k2] = v1*v2
+    backend, integral = _dicts_backend(first_dict, second_dict, backend=backend)
+    first_values, first_probabilities = _dict_to_arrays(first_dict, backend)
+    second_values, second_probabilities = _dict_to_arrays(second_dict, backend)
+    values, probabilities = combine_arrays(first_values, first_probabilities, second_values, second_probabilities, np.add, drop_zeros=False)
+    return _arrays_to_dict(values, probabilities, integral)
+
+def _dicts_backend(*dicts, backend=None) -> tuple[NumericBackend, bool]:
+    """The numeric backend on which to combine dicts
+
+    Summary
+    -------
+    The most exact backend among the keys and values of all dicts (c.f., ``promote``), so that
+    ``Fraction`` and ``Decimal`` entries are combined exactly. Dicts of ints only are combined 
+    on the fraction backend and returned as ints, which is flagged by the second entry returned.
+    A backend passed explicitly is used as is (c.f., ``get_backend``)
+
+    """
+    if backend is not None:
+        return get_backend(backend), False
+    entries: list = [entry for d in dicts for item in d.items() for entry in item]
+    if all(isinstance(entry, (int, np.integer)) for entry in entries):
+        return get_backend('fraction'), True
+    return promote(*(backend_of(entry) for entry in entries)), False
+
+def _dict_to_arrays(dictionary: dict, backend: NumericBackend) -> tuple[np.ndarray, np.ndarray]:
+    """arrays of keys and values on ``backend``, sorted by key"""
+    keys = backend.array(list(dictionary.keys()))
+    values = backend.array(list(dictionary.values()))
+    order = np.argsort(keys, kind='stable')
+    return keys[order], values[order]
 
-    return convolved
+def _arrays_to_dict(keys: np.ndarray, values: np.ndarray, integral: bool) -> dict:
+    """the dict of arrays of keys and values, cast back to ints for dicts of ints (c.f., ``_dicts_backend``)"""
+    if integral:
+        return {int(key): int(value) for key, value in zip(keys.tolist(), values.tolist())}
+    return dict(zip(keys.tolist(), values.tolist()))
 
-def convolve_dicts_many(*dicts) -> dict:
+def convolve_dicts_many(*dicts, backend=None) -> dict:
     """like ``convolve_dicts``, but now for arbitrary many dicts
+
+    Summary
+    -------
+    The outer sum of all keys is formed and reduced in a few vectorised steps,
+    with larger inputs convolved pairwise in a balanced tree (c.f., ``combine_many_arrays``).
+    The numeric backend is passed through the keyword ``backend`` (c.f., ``convolve_dicts``)
     
     """
-    key_value_pairs = product(*[d.items() for d in dicts])
-    convolved: dict = {}
-    for key_values in key_value_pairs:
-        stacked = np.vstack(key_values)
-        key = np.sum(stacked[:,0]) 
-        value = np.prod(stacked[:,1])
-        try:
-            convolved[key] += value
-        except KeyError:
-            convolved[key] = value 
-
-    return convolved
-
+    backend, integral = _dicts_backend(*dicts, backend=backend)
+    laws = [_dict_to_arrays(d, backend) for d in dicts]
+    values, probabilities = combine_many_arrays(laws, np.add, drop_zeros=False)
+    return _arrays_to_dict(values, probabilities, integral)
@@ -1,24 +1,31 @@
-from itertools import product
+from .array_reduction import combine_many_arrays
+from .dict_convolution import _dicts_backend, _dict_to_arrays, _arrays_to_dict
 import numpy as np
 
-def dict_mul(*dicts) -> dict:
+def dict_mul(*dicts, backend=None) -> dict:
     """
     
     Summary
     -------
     Multiply arbitrary many dictionaries with key, value pairs being objects
     with a __mul__ method (i.e., can be multiplied). Return a dictionary of 
-    the same type as the inputs
+    the same type as the inputs, the products of ``Fraction`` or ``Decimal`` keys and values
+    are exact (c.f., ``_dicts_backend``). The outer product of all keys is formed and
+    reduced in a few vectorised steps (c.f., ``combine_many_arrays``)
 
     Parameters
     ----------
     dictionaries : list[dict]
-        the keys and values of any passed dictionary must be float type objects
+        the keys and values of any passed dictionary must be int, float, ``Decimal`` or ``Fraction`` objects
+
+    backend : str, NumericBackend or None, optional
+        the numeric backend on which to multiply (c.f., ``NumericBackend``). Default is None,
+        which infers the backend from the keys and values
 
     Returns
     -------
     dictionary : dict
-        the keys and values will be float type objects
+        the keys and values will be of the most exact type among the inputs, sorted by key
     
     Example
     -------
@@ -28,16 +35,7 @@ def dict_mul(*dicts) -> dict:
     {10: 0.3, 15: 0.7}  
 
     """
-    key_value_pairs = product(*[d.items() for d in dicts])
-    multiplied: dict = {}
-    for key_values in key_value_pairs:
-        stacked = np.vstack(key_values)
-        key = np.prod(stacked[:,0])
-        prob = np.prod(stacked[:,1])
-
-        try:
-            multiplied[key] += prob 
-        except KeyError:
-            multiplied[key] = prob 
-            
-    return multiplied
+    backend, integral = _dicts_backend(*dicts, backend=backend)
+    laws = [_dict_to_arrays(d, backend) for d in dicts]
+    values, probabilities = combine_many_arrays(laws, np.multiply, drop_zeros=False)
+    return _arrays_to_dict(values, probabilities, integral)
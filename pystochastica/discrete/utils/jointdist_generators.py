@@ -1,7 +1,7 @@
-from ..core import SampleBase
+from ..core import SampleBase, JointDistribution, NumericBackend, promote, array_backend, cached
 from itertools import product
 from  functools import reduce
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from fractions import Fraction
 import numpy as np
 import sympy as sp
@@ -29,7 +29,8 @@ def generate_jdist(*marginals) -> dict:
     -------
     From a list of random variables (``RandVar`` objects), generate the 
     product distribution with given random variables as marginals (i.e., 
-    the joint distribution for a list of independent random variables)
+    the joint distribution for a list of independent random variables).
+    The result is memoised by the names and fingerprints of the marginals (c.f., ``ArithmeticCache``)
 
     Parameters
     ----------
@@ -42,28 +43,129 @@ def generate_jdist(*marginals) -> dict:
         the product distribution
 
     """
-    sample_prob_pairs_list = []
-    for mg_rv in marginals:
-        try:
-            sample_prob_pairs = [(sample, Decimal(str(prob))) for sample, prob in mg_rv.pspace.items()]
-        except InvalidOperation:
-            # probabilties are Fraction type objects, leave as such
-            sample_prob_pairs = [(sample, prob) for sample, prob in mg_rv.pspace.items()]
-
-        sample_prob_pairs_list += [sample_prob_pairs]
-
-    sample_prob_pairs_all = product(*sample_prob_pairs_list)
-    jd_pspace: dict = {}
-    for sample_prob_pair in sample_prob_pairs_all:
-        stacked = np.vstack(sample_prob_pair)
-        jd_key = tuple(stacked[:,0])
-        jd_value = list_product(stacked[:,1])
-        try:
-            jd_pspace[jd_key] += jd_value
-        except KeyError:
-            jd_pspace[jd_key] = jd_value
-
-    return jd_pspace
+    # the samples carry the names of the marginals, so these are part of the key
+    key = lambda: ('jdist',) + tuple((mg_rv.name, mg_rv.fingerprint) for mg_rv in marginals)
+    return dict(cached(key, lambda: _product_pspace(*marginals)))
+
+def _product_pspace(*marginals) -> dict:
+    """the product distribution of ``marginals`` as a pspace dict, c.f., ``generate_jdist``"""
+    # probabilities are multiplied on the most exact backend among the marginals, in a single outer product
+    backend = promote(*[mg_rv.backend for mg_rv in marginals])
+    probabilities: np.ndarray = reduce(np.multiply.outer, [backend.array(mg_rv.probabilities) for mg_rv in marginals]).ravel()
+    samples: list = [list(mg_rv.pspace.keys()) for mg_rv in marginals]
+    return dict(zip(product(*samples), probabilities.tolist()))
+
+def _law_columns(values: np.ndarray, probabilities: np.ndarray) -> np.ndarray:
+    """the sample values of a law as an ``(n, columns)`` array, random variables have a single column"""
+    values = np.asarray(values)
+    return values.reshape(len(probabilities), -1)
+
+def product_arrays(laws: list[tuple], backend: NumericBackend = None) -> tuple[np.ndarray, np.ndarray]:
+    """The product distribution as columnar arrays
+
+    Summary
+    -------
+    The joint table of independent laws, each a random variable's ``(values, probabilities)``
+    or a joint table ``(values, probabilities)`` with ``values`` of shape ``(n_i, d_i)``. Each column 
+    is built by broadcasting its law along its own axis of the product, and the probabilities 
+    by a single outer product, in row-major order of the laws. No python tuples are built
+    (c.f., ``generate_jdist``)
+
+    Parameters
+    ----------
+    laws : list[tuple[np.ndarray, np.ndarray]]
+        the independent laws as ``(values, probabilities)`` pairs
+
+    backend : NumericBackend, optional
+        the backend of the result, default is the most exact among the laws
+
+    Returns
+    -------
+    result : tuple[np.ndarray, np.ndarray]
+        the ``(prod n_i, sum d_i)`` array of joint samples and their probabilities
+
+    Example
+    -------
+    >>> product_arrays([(numpy.array([0., 1.]), numpy.array([0.5, 0.5])), (numpy.array([2.]), numpy.array([1.]))])
+    (array([[0., 2.],
+           [1., 2.]]), array([0.5, 0.5]))
+
+    """
+    if backend is None:
+        backend = promote(*[array_backend(np.asarray(probabilities)) for _, probabilities in laws])
+    laws = [(backend.array(_law_columns(values, probabilities)), backend.array(probabilities)) for values, probabilities in laws]
+    shape: tuple = tuple(len(probabilities) for _, probabilities in laws)
+
+    columns: list = []
+    for axis, (values, _) in enumerate(laws):
+        axis_shape: tuple = tuple(-1 if i == axis else 1 for i in range(len(laws)))
+        columns += [np.broadcast_to(column.reshape(axis_shape), shape).ravel() for column in values.T]
+    probabilities: np.ndarray = reduce(np.multiply.outer, [probabilities for _, probabilities in laws]).ravel()
+    return np.stack(columns, axis=1), probabilities
+
+def product_chunks(laws: list[tuple], chunk_size: int = 2**16, backend: NumericBackend = None):
+    """The product distribution streamed in chunks
+
+    Summary
+    -------
+    Like ``product_arrays``, but yielding the joint table in consecutive chunks of at most 
+    ``chunk_size`` rows, in the same row order. Rows are decoded from their flat index into
+    the product by ``numpy.unravel_index``, so memory is bounded by the chunk size whatever 
+    the size of the product, e.g., to write 10^7 rows to disk
+
+    Parameters
+    ----------
+    laws : list[tuple[np.ndarray, np.ndarray]]
+        the independent laws as ``(values, probabilities)`` pairs
+
+    chunk_size : int, optional
+        the largest number of rows per chunk, default is 2**16
+
+    backend : NumericBackend, optional
+        the backend of the result, default is the most exact among the laws
+
+    Yields
+    ------
+    chunk : tuple[np.ndarray, np.ndarray]
+        joint samples as rows and their probabilities
+
+    """
+    if backend is None:
+        backend = promote(*[array_backend(np.asarray(probabilities)) for _, probabilities in laws])
+    laws = [(backend.array(_law_columns(values, probabilities)), backend.array(probabilities)) for values, probabilities in laws]
+    shape: tuple = tuple(len(probabilities) for _, probabilities in laws)
+    size: int = int(np.prod(shape))
+
+    for start in range(0, size, chunk_size):
+        indices = np.unravel_index(np.arange(start, min(start + chunk_size, size)), shape)
+        values: np.ndarray = np.concatenate([law_values[index] for (law_values, _), index in zip(laws, indices)], axis=1)
+        probabilities: np.ndarray = reduce(np.multiply, [law_probabilities[index] for (_, law_probabilities), index in zip(laws, indices)])
+        yield values, probabilities
+
+def generate_jdist_columnar(*marginals) -> JointDistribution:
+    """The product distribution from a list of random variables, as a columnar joint distribution
+
+    Summary
+    -------
+    Like ``generate_jdist``, but built by ``product_arrays`` directly into the arrays of a 
+    ``JointDistribution``, without a pspace dict. Marginals may also be joint distributions, 
+    whose columns are kept together
+
+    Parameters
+    ----------
+    marginals : list[RandVar or JointDistribution]
+        the independent marginals
+
+    Returns
+    -------
+    result : JointDistribution
+        the product distribution, on the most exact backend among the marginals
+
+    """
+    backend: NumericBackend = promote(*[mg_rv.backend for mg_rv in marginals])
+    names: list = [name for mg_rv in marginals for name in (mg_rv._name if isinstance(mg_rv, JointDistribution) else [mg_rv._name])]
+    values, probabilities = product_arrays([(mg_rv.values, mg_rv.probabilities) for mg_rv in marginals], backend)
+    return JointDistribution._from_arrays(names, values, probabilities, backend)
 
 def generate_jdist_random(\
         dimension: int = 3, 
@@ -1,4 +1,5 @@
 from .. import *
+from ..dict_convolution import depr_convolve_dicts
 from ...samples import Sample
 import numpy as np
 import sympy as sp
@@ -51,4 +52,119 @@ def test_rv_to_init():
     raw_dict = {'name': 'X', 'pspace': {'-1': 0.5, '1': 0.5}}
     initted = rvdict_to_init(raw_dict)
     assert isinstance(initted['name'], sp.Expr)
-    assert all(isinstance(sample, Sample) for sample in initted['pspace'].keys())
\ No newline at end of file
+    assert all(isinstance(sample, Sample) for sample in initted['pspace'].keys())
+
+def test_convolve_arrays():
+
+    values1 = np.array([-1.5, -0.5, 2.0, 7.25])
+    probabilities1 = np.array([0.1, 0.2, 0.55, 0.15])
+    values2 = np.arange(-200, 201)*0.25 # long enough to convolve by FFT
+    probabilities2 = np.full(401, 1/401)
+
+    assert lattice_indices(values1, values2) is not None
+    assert lattice_indices(values1, np.array([np.pi])) is None
+
+    convolved = convolve_arrays(values1, probabilities1, values2, probabilities2)
+    reduced = combine_arrays(values1, probabilities1, values2, probabilities2)
+    assert np.array_equal(convolved[0], reduced[0])
+    assert np.allclose(convolved[1], reduced[1])
+
+    long_convolved = convolve_arrays(values2, probabilities2, values2, probabilities2)
+    assert len(long_convolved[0]) == 801
+    assert round(sum(long_convolved[1]), sf) == 1
+
+def test_combine_many_arrays():
+
+    laws = [(np.arange(-20, 21)*0.5, np.full(41, 1/41))]*4 # outer product too large to build at once
+    summed = combine_many_arrays(laws, np.add)
+    multiplied = combine_many_arrays(laws, np.multiply)
+    assert np.allclose(summed[0], np.arange(-80, 81)*0.5)
+    assert round(sum(summed[1]), sf) == 1
+    assert round(sum(multiplied[1]), sf) == 1
+
+    convolved = convolve_dicts_many(dict1, dict2, dict3)
+    pairwise = convolve_dicts(convolve_dicts(dict1, dict2), dict3)
+    assert list(convolved.keys()) == list(pairwise.keys())
+    assert np.allclose(list(convolved.values()), list(pairwise.values()))
+
+def test_prune_rebin_arrays():
+
+    values, probabilities, lost_mass, wasserstein = prune_arrays(np.array([0., 1., 2.]), np.array([0.001, 0.499, 0.5]), 0.01)
+    assert list(values) == [1., 2.]
+    assert np.isclose(probabilities.sum(), 1)
+    assert np.isclose(lost_mass, 0.001) and np.isclose(wasserstein, 0.002)
+
+    rng = np.random.default_rng(0)
+    values = np.sort(rng.normal(size=1000))
+    probabilities = rng.random(1000)
+    probabilities /= probabilities.sum()
+    rebinned_values, rebinned_probabilities, wasserstein = rebin_arrays(values, probabilities, 50)
+
+    mean = values @ probabilities
+    assert len(rebinned_values) <= 50
+    assert np.isclose(rebinned_values @ rebinned_probabilities, mean)
+    assert np.isclose(((rebinned_values - mean)**2) @ rebinned_probabilities, ((values - mean)**2) @ probabilities)
+    assert 0 < wasserstein < np.ptp(values)/49
+
+def test_convolve_rows():
+    rng = np.random.default_rng(0)
+    first_values, second_values = rng.integers(0, 3, size=(40, 2)).astype(float), rng.integers(0, 3, size=(30, 2)).astype(float)
+    first_values, first_probabilities = reduce_rows(first_values, np.full(40, 1/40))
+    second_values, second_probabilities = reduce_rows(second_values, np.full(30, 1/30))
+
+    values, probabilities = convolve_rows(first_values, first_probabilities, second_values, second_probabilities)
+    chunked_values, chunked_probabilities = convolve_rows(first_values, first_probabilities, second_values, second_probabilities, chunk_size=10)
+    assert np.array_equal(values, chunked_values) and np.allclose(probabilities, chunked_probabilities)
+    assert np.isclose(probabilities.sum(), 1) and len(np.unique(values, axis=0)) == len(values)
+    assert np.allclose(probabilities @ values, first_probabilities @ first_values + second_probabilities @ second_values)
+
+def test_convolve_arrays_close_values():
+    # distinct values within rounding errors of a common grid point must not be merged
+    values = np.array([1e6, 1e6 + 1e-9, 1e6 + 1])
+    probabilities = np.array([0.3, 0.3, 0.4])
+    coin = (np.array([0.0, 1.0]), np.array([0.5, 0.5]))
+    lattice = lattice_indices(values, coin[0])
+    assert lattice is None or len(np.unique(lattice[3][0])) == 3
+
+    convolved = convolve_arrays(values, probabilities, *coin)
+    assert np.isclose(convolved[1].sum(), 1)
+    assert np.isclose(convolved[0] @ convolved[1], 1e6 + 0.4 + 0.5)
+
+def test_convolve_signed():
+    # weights of any sign, long enough to convolve by FFT, are neither clipped nor masked
+    rng = np.random.default_rng(0)
+    first, second = rng.normal(size=100), rng.normal(size=100)
+    assert np.allclose(convolve_dense(first, second), np.convolve(first, second))
+
+    first_dict, second_dict = dict(enumerate(first.tolist())), dict(enumerate(second.tolist()))
+    convolved = convolve_dicts(first_dict, second_dict)
+    expected = depr_convolve_dicts(first_dict, second_dict)
+    assert list(convolved.keys()) == sorted(expected.keys())
+    assert np.allclose([convolved[key] for key in expected], list(expected.values()), rtol=1e-12, atol=1e-12)
+    assert convolve_dicts({0: 1, 1: 1}, {0: 1, 1: -1}) == {0: 1.0, 1: 0.0, 2: -1.0}
+
+def test_dicts_keep_types():
+    from fractions import Fraction
+    from decimal import Decimal
+
+    # ints stay ints, as by the dict loops
+    assert convolve_dicts({0: 1, 1: 2}, {0: 3, 2: -1}) == {0: 3, 1: 6, 2: -1, 3: -2}
+    assert all(type(key) is int and type(value) is int for key, value in dict_mul({2: 1, -1: 3}, {3: 2}).items())
+
+    # rationals and decimals are multiplied exactly
+    multiplied = dict_mul({Fraction(1, 10): Fraction(1, 3), Fraction(1, 5): Fraction(2, 3)}, {Fraction(1, 10): Fraction(1)})
+    assert multiplied == {Fraction(1, 100): Fraction(1, 3), Fraction(1, 50): Fraction(2, 3)}
+    convolved = convolve_dicts_many({Decimal('0.1'): Decimal('0.5'), Decimal('0.2'): Decimal('0.5')}, {Decimal('0.1'): Decimal('1')})
+    assert convolved == {Decimal('0.2'): Decimal('0.5'), Decimal('0.3'): Decimal('0.5')}
+
+def test_dicts_backend():
+    from fractions import Fraction
+
+    # float inputs round-trip exactly through the fraction backend
+    first, second = {0.1: 0.25, 0.2: 0.75}, {-0.1: 0.5, 0.3: 0.5}
+    convolved = convolve_dicts(first, second, backend='fraction')
+    assert all(isinstance(key, Fraction) and isinstance(value, Fraction) for key, value in convolved.items())
+    assert sum(convolved.values()) == 1 and Fraction('0.1') in convolved
+    assert convolved == convolve_dicts_many(first, second, backend='fraction')
+    assert {float(key): float(value) for key, value in convolved.items()} == convolve_dicts({Fraction('0.1'): 0.25, Fraction('0.2'): 0.75}, {-0.1: 0.5, 0.3: 0.5}, backend='float64')
+    assert dict_mul(first, {Fraction(1, 3): Fraction(1)}, backend='fraction') == {Fraction(1, 30): Fraction(1, 4), Fraction(1, 15): Fraction(3, 4)}
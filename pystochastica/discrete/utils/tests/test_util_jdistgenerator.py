@@ -1,6 +1,8 @@
 from ...variables import RandVar
 from ...core import JointDistribution
 from .. import rvdict_to_pspace, generate_jdist, generate_jdist_random
+from .. import generate_jdist_columnar, product_arrays, product_chunks
+import numpy as np
 import sympy as sp
 
 X, Y, Z = sp.symbols('X, Y, Z')
@@ -26,3 +28,23 @@ def test_jdist_generator():
 def test_jdist_random_gen():
     jd: JointDistribution = JointDistribution(pspace=generate_jdist_random(dimension=5))
     assert jd.dimension == 5
+
+def test_jdist_columnar():
+    mX = RandVar(name=X, pspace=rvdict_to_pspace(X_dict))
+    mY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    mZ = RandVar(name=Z, pspace=rvdict_to_pspace(Z_dict))
+
+    jd: JointDistribution = generate_jdist_columnar(mX, mY, mZ)
+    assert jd.name == [X, Y, Z] and jd.values.shape == (20, 3)
+    assert jd == JointDistribution(pspace=generate_jdist(mX, mY, mZ))
+
+    # chunks stream the same rows, in the same order
+    laws = [(mX.values, mX.probabilities), (mY.values, mY.probabilities), (mZ.values, mZ.probabilities)]
+    chunks = list(product_chunks(laws, chunk_size=7))
+    assert [len(probabilities) for _, probabilities in chunks] == [7, 7, 6]
+    assert np.array_equal(np.concatenate([values for values, _ in chunks]), jd.values)
+    assert np.allclose(np.concatenate([probabilities for _, probabilities in chunks]), jd.probabilities)
+
+    # joint tables are kept together as blocks of columns
+    values, probabilities = product_arrays([(jd.values, jd.probabilities), (mX.values, mX.probabilities)])
+    assert values.shape == (40, 4) and np.isclose(probabilities.sum(), 1)
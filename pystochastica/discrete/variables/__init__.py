@@ -1 +1,3 @@
 from ._randvar import RandVar
+from ._lazy import LazyRandVar
+from ._order import maximum, minimum, order_statistic
@@ -0,0 +1,299 @@
+from ..core import RandVarBase, NumericBackend, promote, as_name
+from ..core import ErrorBudget, EXACT
+from ..simulations import AliasSampler
+from ._randvar import RandVar
+from decimal import Decimal
+from fractions import Fraction
+from functools import reduce
+import numpy as np
+
+JOINT_SIZE: int = 2**24 # largest joint support of the leaves enumerated by exact evaluation
+
+class LazyRandVar:
+	"""
+
+	Summary
+	-------
+	Deferred arithmetic among random variables. Operations on ``LazyRandVar`` objects only
+	record a node in an expression graph over leaf ``RandVar`` objects, no intermediate
+	law is computed. The graph is evaluated once, on demand, through ``evaluate``
+
+	- ``'exact'``, by enumerating the joint support of the distinct leaves
+	- ``'monte_carlo'``, by drawing the leaves independently and evaluating the graph on the draws
+
+	Leaves are identified by the ``RandVar`` object they wrap, so that a variable used twice
+	is the *same* random variable, e.g., X - X is 0 and X*X is X**2. Distinct leaves are
+	assumed independent. Structurally identical subexpressions, e.g., Y*Z in (X + Y*Z)*(Y*Z),
+	are evaluated once.
+
+	Example
+	-------
+	>>> X = RandVar(name=sympy.Symbol('X'), values=[-1, 1], probabilities=[0.5, 0.5]).lazy()
+	>>> Y = RandVar(name=sympy.Symbol('Y'), values=[0, 1], probabilities=[0.5, 0.5]).lazy()
+	>>> (X*Y - X).evaluate().values
+	array([-1.,  0.,  1.])
+
+	"""
+	# numpy scalars defer to the reflected operations below, e.g., numpy.float64(0.5)*X
+	__array_ufunc__ = None
+
+	def __init__(self, op: str, args: tuple, name) -> None:
+		"""Constructor method
+
+		Parameters
+		----------
+		op : str
+			one of ``'leaf'``, ``'const'``, ``'add'``, ``'mul'`` or ``'pow'``
+
+		args : tuple
+			the ``RandVar`` for leaves, the number for constants, else the ``LazyRandVar`` operands.
+			The exponent of ``'pow'`` is a constant
+
+		name : LazyName
+			the name of the expression
+
+		"""
+		self.op: str = op
+		self.args: tuple = args
+		self._name = name
+
+	@classmethod
+	def leaf(cls, randvar: RandVarBase):
+		"""wrap a random variable as a leaf of the expression graph"""
+		return cls('leaf', (randvar,), randvar._name)
+
+	@classmethod
+	def const(cls, number):
+		"""wrap a number as a constant of the expression graph"""
+		return cls('const', (number,), as_name(number))
+
+	@property
+	def name(self):
+		return self._name.expr()
+
+	@property
+	def leaves(self) -> list:
+		"""the distinct random variables in the graph, in order of first appearance"""
+		leaves, seen, visited, stack = [], set(), set(), [self]
+		while stack:
+			node = stack.pop()
+			if id(node) in visited:
+				continue
+			visited.add(id(node))
+			if node.op == 'leaf':
+				if id(node.args[0]) not in seen:
+					seen.add(id(node.args[0]))
+					leaves.append(node.args[0])
+			elif not node.op == 'const':
+				stack.extend(reversed(node.args))
+		return leaves
+
+	def _evaluate_nodes(self, leaf_values: dict, backend: NumericBackend):
+		"""Evaluate the graph on arrays of leaf values
+
+		Summary
+		-------
+		Iterative post-order traversal with hash-consing. Each node is keyed by its
+		operation and the keys of its operands, so that structurally identical
+		subexpressions share one key and are computed once.
+
+		Parameters
+		----------
+		leaf_values : dict
+			the values of each leaf, an array keyed by the ``id`` of its ``RandVar``.
+			The arrays need only broadcast against each other
+
+		backend : NumericBackend
+			the backend on which constants are held
+
+		"""
+		keys: dict = {}			# structural key -> index into results
+		node_keys: dict = {}	# id(node) -> index into results
+		results: list = []
+		stack: list = [self]
+		while stack:
+			node = stack[-1]
+			if id(node) in node_keys:
+				stack.pop()
+				continue
+
+			if node.op == 'leaf':
+				key = ('leaf', id(node.args[0]))
+			elif node.op == 'const':
+				key = ('const', node.args[0])
+			else:
+				pending = [arg for arg in node.args if id(arg) not in node_keys]
+				if pending:
+					stack.extend(pending)
+					continue
+				key = (node.op,) + tuple(node_keys[id(arg)] for arg in node.args)
+
+			if key not in keys:
+				if node.op == 'leaf':
+					result = leaf_values[key[1]]
+				elif node.op == 'const':
+					result = backend.number(node.args[0])
+				elif node.op == 'add':
+					result = results[key[1]] + results[key[2]]
+				elif node.op == 'mul':
+					result = results[key[1]] * results[key[2]]
+				else:
+					result = backend.power(np.asarray(results[key[1]]), node.args[1].args[0])
+				keys[key] = len(results)
+				results.append(result)
+			node_keys[id(node)] = keys[key]
+			stack.pop()
+
+		return results[node_keys[id(self)]]
+
+	def _error_budget(self, leaves: list) -> ErrorBudget:
+		"""approximated leaves carry their lost mass, without a Wasserstein-1 bound for general graphs"""
+		error_budget: ErrorBudget = EXACT
+		for leaf in leaves:
+			error_budget = error_budget + leaf.error_budget
+		return error_budget.unbounded()
+
+	def evaluate(self, method: str = 'exact', iterations: int = 10000, rng: np.random.Generator = None) -> RandVar:
+		"""Evaluate the expression graph
+
+		Parameters
+		----------
+		method : str, optional
+			``'exact'`` to enumerate the joint support of the leaves, or ``'monte_carlo'``
+			for the empirical law of ``iterations`` independent draws. Default is ``'exact'``
+
+		iterations : int, optional
+			the number of draws for ``'monte_carlo'``, default is 10000
+
+		rng : numpy.random.Generator, optional
+			the source of randomness for ``'monte_carlo'``, also accepts a seed
+
+		Returns
+		-------
+		randvar : RandVar
+			the law of the expression. Exact results are cached
+
+		Raises
+		------
+		ValueError
+			if ``method`` is unknown, or if the joint support of the leaves exceeds ``JOINT_SIZE``
+			for ``'exact'``
+
+		"""
+		if method == 'exact':
+			try:
+				return self._exact
+			except AttributeError:
+				self._exact: RandVar = self._evaluate_exact()
+				return self._exact
+		if method == 'monte_carlo':
+			return self._evaluate_monte_carlo(iterations, rng)
+		raise ValueError(f"{method} is not an evaluation method, expected 'exact' or 'monte_carlo'")
+
+	def _evaluate_exact(self) -> RandVar:
+		leaves: list = self.leaves
+		shape: tuple = tuple(len(leaf.values) for leaf in leaves)
+		size: int = int(np.prod(shape, dtype=float))
+		if size > JOINT_SIZE:
+			raise ValueError(f"the joint support of the leaves has {size} points, use method='monte_carlo'")
+
+		backend: NumericBackend = promote(*(leaf.backend for leaf in leaves))
+		leaf_values: dict = {}
+		leaf_probabilities: list = []
+		for axis, leaf in enumerate(leaves):
+			values, probabilities = leaf.values, leaf.probabilities
+			if leaf.backend is not backend:
+				values, probabilities = backend.array(values), backend.array(probabilities)
+			# each leaf on its own axis, intermediates broadcast over the leaves they depend on only
+			leaf_values[id(leaf)] = values.reshape(tuple(-1 if i == axis else 1 for i in range(len(leaves))))
+			leaf_probabilities.append(probabilities)
+
+		values = np.broadcast_to(self._evaluate_nodes(leaf_values, backend), shape)
+		probabilities = reduce(np.multiply.outer, leaf_probabilities)
+		return RandVar._from_support(self._name, values, probabilities, backend, self._error_budget(leaves))
+
+	def _evaluate_monte_carlo(self, iterations: int, rng: np.random.Generator) -> RandVar:
+		rng = None if rng is None else np.random.default_rng(rng)
+		leaves: list = self.leaves
+		backend: NumericBackend = promote(*(leaf.backend for leaf in leaves))
+		leaf_values: dict = {id(leaf): backend.array(_draw(leaf, iterations, rng)) for leaf in leaves}
+
+		values = np.broadcast_to(self._evaluate_nodes(leaf_values, backend), (iterations,))
+		probabilities = np.full(iterations, backend.number(1) / iterations, dtype=backend.dtype)
+		return RandVar._from_support(self._name, values, probabilities, backend, self._error_budget(leaves))
+
+	@property
+	def E(self):
+		return self.evaluate().E
+
+	@property
+	def V(self):
+		return self.evaluate().V
+
+	def Prob(self, predicate: str, thresholds=None):
+		return self.evaluate().Prob(predicate, thresholds)
+
+	def __add__(self, second_rv):
+		second_rv = _as_lazy(second_rv)
+		if second_rv is NotImplemented:
+			return NotImplemented
+		return LazyRandVar('add', (self, second_rv), self._name + second_rv._name)
+
+	def __radd__(self, second_rv):
+		second_rv = _as_lazy(second_rv)
+		if second_rv is NotImplemented:
+			return NotImplemented
+		return LazyRandVar('add', (second_rv, self), second_rv._name + self._name)
+
+	def __mul__(self, second_rv):
+		second_rv = _as_lazy(second_rv)
+		if second_rv is NotImplemented:
+			return NotImplemented
+		return LazyRandVar('mul', (self, second_rv), self._name * second_rv._name)
+
+	def __rmul__(self, second_rv):
+		second_rv = _as_lazy(second_rv)
+		if second_rv is NotImplemented:
+			return NotImplemented
+		return LazyRandVar('mul', (second_rv, self), second_rv._name * self._name)
+
+	def __neg__(self):
+		return (-1)*self
+
+	def __sub__(self, second_rv):
+		second_rv = _as_lazy(second_rv)
+		if second_rv is NotImplemented:
+			return NotImplemented
+		return self + (-1)*second_rv
+
+	def __rsub__(self, second_rv):
+		second_rv = _as_lazy(second_rv)
+		if second_rv is NotImplemented:
+			return NotImplemented
+		return second_rv + (-1)*self
+
+	def __pow__(self, power):
+		if not isinstance(power, (int, float, Decimal, Fraction, np.number)):
+			return NotImplemented
+		return LazyRandVar('pow', (self, LazyRandVar.const(power)), self._name**power)
+
+	def __str__(self) -> str:
+		return f"LazyRandVar({self.name})"
+
+	def __repr__(self) -> str:
+		return self.__str__()
+
+def _draw(leaf: RandVarBase, iterations: int, rng: np.random.Generator) -> np.ndarray:
+	"""independent draws of a leaf, through its cached alias table if it is a ``RandVar``"""
+	sampler: AliasSampler = leaf.sampler if isinstance(leaf, RandVar) else AliasSampler(leaf.probabilities)
+	return leaf.values[sampler.draw(iterations, rng=rng)]
+
+def _as_lazy(operand):
+	"""wrap numbers and random variables as nodes of the expression graph"""
+	if isinstance(operand, LazyRandVar):
+		return operand
+	if isinstance(operand, RandVarBase):
+		return LazyRandVar.leaf(operand)
+	if isinstance(operand, (int, float, Decimal, Fraction, np.number)):
+		return LazyRandVar.const(operand)
+	return NotImplemented
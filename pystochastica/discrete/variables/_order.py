@@ -0,0 +1,188 @@
+from ..core import RandVarBase, NumericBackend, promote
+from ..core import ErrorBudget, EXACT
+from ._randvar import RandVar
+from collections import Counter
+import numpy as np
+import sympy as sp
+
+def _as_randvars(randvars: tuple) -> list:
+	"""validate the operands of order statistics, viewing ``RandVarBase`` objects as ``RandVar`` objects"""
+	if len(randvars) == 0:
+		raise ValueError("order statistics require at least one random variable")
+	views: list = []
+	for randvar in randvars:
+		if not isinstance(randvar, RandVarBase):
+			raise TypeError(f"{randvar} is not a random variable")
+		if not isinstance(randvar, RandVar):
+			randvar = RandVar._from_arrays(randvar._name, randvar.values, randvar.probabilities, randvar.backend)
+		views.append(randvar)
+	return views
+
+def _copy_names(randvars: list) -> list:
+	"""the names of the operands, names passed more than once indexed as independent copies X[0], X[1], ...
+	(c.f., ``RandVar.iid_name``), so that, e.g., the maximum of X and X is not named X"""
+	names: list = [randvar.name for randvar in randvars]
+	counts: Counter = Counter(names)
+	seen: Counter = Counter()
+	copy_names: list = []
+	for name in names:
+		if counts[name] == 1:
+			copy_names.append(name)
+			continue
+		label = name if isinstance(name, sp.Symbol) else sp.Symbol(f"({name})")
+		copy_names.append(sp.IndexedBase(label)[seen[name]])
+		seen[name] += 1
+	return copy_names
+
+def _merged_support(randvars: list) -> tuple:
+	"""Pointwise cumulative and survival probabilities over the merged support
+
+	Summary
+	-------
+	Each cumulative probability Pr(X_i <= u) and survival probability Pr(X_i > u) at each
+	u in the union of the sorted supports, read off the cached cumulative arrays of
+	X_i by binary search (c.f., ``RandVar.cumulative``)
+
+	Returns
+	-------
+	result : tuple
+		the backend, the merged support of length m and two ``(n, m)`` arrays, the cumulative
+		and the survival probabilities
+
+	"""
+	backend: NumericBackend = promote(*(randvar.backend for randvar in randvars))
+	support: np.ndarray = np.unique(np.concatenate([backend.array(randvar.values) for randvar in randvars]))
+	cumulative, survival = [], []
+	for randvar in randvars:
+		prefix, suffix = randvar._cumulative_arrays()
+		index = np.searchsorted(randvar.values, support, side='right')
+		cumulative.append(backend.array(prefix[index]))
+		survival.append(backend.array(suffix[index]))
+	return backend, support, np.stack(cumulative), np.stack(survival)
+
+def _error_budget(randvars: list) -> ErrorBudget:
+	"""order statistics are 1-Lipschitz in the sup-norm, so Wasserstein-1 errors of the operands add up"""
+	error_budget: ErrorBudget = EXACT
+	for randvar in randvars:
+		error_budget = error_budget + randvar.error_budget
+	return error_budget
+
+def maximum(*randvars) -> RandVar:
+	"""Maximum of independent random variables
+
+	Summary
+	-------
+	The law of max(X_1, ..., X_n) for independent X_i, from the product of the cumulative
+	distribution functions, Pr(max <= u) = prod_i Pr(X_i <= u), over the merged supports.
+	This costs O(m n log m) for supports of total size m, rather than enumerating the
+	product of the supports (c.f., ``generate_jdist``). Passing a random variable more than
+	once passes independent copies of it, named X[0], X[1], ...
+
+	Parameters
+	----------
+	randvars : list[RandVar]
+		the independent random variables
+
+	Returns
+	-------
+	randvar : RandVar
+		the maximum, named ``Max(X_1, ..., X_n)``
+
+	Example
+	-------
+	>>> X = RandVar(name=sympy.Symbol('X'), values=[0, 1], probabilities=[0.5, 0.5])
+	>>> Y = RandVar(name=sympy.Symbol('Y'), values=[0, 2], probabilities=[0.5, 0.5])
+	>>> maximum(X, Y).probabilities
+	array([0.25, 0.25, 0.5 ])
+
+	"""
+	randvars = _as_randvars(randvars)
+	backend, support, cumulative, _ = _merged_support(randvars)
+	distribution = np.prod(cumulative, axis=0)
+	probabilities = np.diff(distribution, prepend=backend.number(0))
+	name = sp.Max(*_copy_names(randvars))
+	return RandVar._from_support(name, support, probabilities, backend, _error_budget(randvars))
+
+def minimum(*randvars) -> RandVar:
+	"""Minimum of independent random variables
+
+	Summary
+	-------
+	The law of min(X_1, ..., X_n) for independent X_i, from the product of the survival
+	functions, Pr(min > u) = prod_i Pr(X_i > u), over the merged supports (c.f., ``maximum``)
+
+	Parameters
+	----------
+	randvars : list[RandVar]
+		the independent random variables
+
+	Returns
+	-------
+	randvar : RandVar
+		the minimum, named ``Min(X_1, ..., X_n)``
+
+	"""
+	randvars = _as_randvars(randvars)
+	backend, support, _, survival = _merged_support(randvars)
+	survival = np.prod(survival, axis=0)
+	total = np.prod([randvar._cumulative_arrays()[1][0] for randvar in randvars])
+	probabilities = -np.diff(survival, prepend=backend.number(total))
+	name = sp.Min(*_copy_names(randvars))
+	return RandVar._from_support(name, support, probabilities, backend, _error_budget(randvars))
+
+def order_statistic(k: int, *randvars) -> RandVar:
+	"""The k-th smallest of independent random variables
+
+	Summary
+	-------
+	The law of the order statistic X_(k) of independent X_1, ..., X_n, i.e., X_(1) is the minimum
+	and X_(n) is the maximum. Pr(X_(k) <= u) is the probability that at least k of the X_i are at
+	most u, the tail of a Poisson-binomial law with success probabilities Pr(X_i <= u). This is
+	computed by dynamic programming over the X_i, vectorised over the merged supports, in
+	O(m n^2) for supports of total size m
+
+	Parameters
+	----------
+	k : int
+		the rank, from 1 to n
+
+	randvars : list[RandVar]
+		the independent random variables
+
+	Returns
+	-------
+	randvar : RandVar
+		the order statistic, named ``order_statistic(k, X_1, ..., X_n)``
+
+	Raises
+	------
+	ValueError
+		if k is not one of 1, ..., n
+
+	Example
+	-------
+	>>> X = [RandVar(name=sympy.Symbol(f'X_{i}'), values=[0, 1], probabilities=[0.5, 0.5]) for i in range(3)]
+	>>> order_statistic(2, *X).probabilities # the median, 0 if at least two of three are 0
+	array([0.5, 0.5])
+
+	"""
+	randvars = _as_randvars(randvars)
+	n: int = len(randvars)
+	if not (isinstance(k, (int, np.integer)) and 1 <= k <= n):
+		raise ValueError(f"{k} is not a rank among {n} random variables")
+
+	backend, support, cumulative, survival = _merged_support(randvars)
+	# counts[j] is the probability that exactly j of the X_i are at most u, at each u of the support
+	counts = np.zeros((n + 1, len(support)), dtype=backend.dtype)
+	counts[:] = backend.number(0)
+	counts[0] = backend.number(1)
+	for i in range(n):
+		counts[1:i+2] = counts[1:i+2]*survival[i] + counts[0:i+1]*cumulative[i]
+		counts[0] = counts[0]*survival[i]
+	distribution = counts[k:].sum(axis=0)
+	probabilities = np.diff(distribution, prepend=backend.number(0))
+	if not backend.exact:
+		probabilities = np.maximum(probabilities, 0.0) # rounding in the sums of the dynamic program
+
+	name = sp.Function('order_statistic')(k, *_copy_names(randvars))
+	return RandVar._from_support(name, support, probabilities, backend, _error_budget(randvars))
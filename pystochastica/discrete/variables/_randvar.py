@@ -1,8 +1,12 @@
-from ..core import RandVarBase, JointDistribution
+from ..core import RandVarBase, JointDistribution, NumericBackend, promote, as_name, applied_name
+from ..core import ErrorBudget, EXACT, product_budget, get_approximation, cached
+from ..core import COMPARISONS, parse_predicate, event_mask, threshold_number
 from ..samples import Sample
-from ..simulations import RandVarSimulator
-from ..utils import convolve_dicts, dict_mul
-from decimal import Decimal, InvalidOperation
+from ..simulations import RandVarSimulator, AliasSampler
+from ..utils import reduce_arrays, combine_arrays, convolve_arrays, convolve_dense, lattice_indices
+from ..utils.array_convolution import MAX_LATTICE_LENGTH
+from ..utils import prune_arrays, rebin_arrays
+from decimal import Decimal
 from fractions import Fraction
 import numpy as np
 import sympy as sp
@@ -20,39 +24,152 @@ class RandVar(RandVarBase):
 	- subtraction
 	- multiplication
 
+	The probability law is held as a sorted array of sample values alongside 
+	an array of probabilities (c.f., ``RandVarBase``), so arithmetic runs on 
+	these arrays directly. Arithmetic between random variables on different
+	numeric backends is carried out on the more exact one (c.f., ``promote``).
+
+	Supports can be bounded through ``prune`` and ``rebin``, or for every result
+	of arithmetic within the context ``approximate``. The error incurred is tracked
+	in ``error_budget`` (c.f., ``ErrorBudget``).
+
 	Note
 	----
 	Arithmetic among ``RandVar`` objects assumes these are independent as 
 	random variables. For dependent variables, see ``RandVec``
 
 	"""
+	_sample_class: type = Sample
+
 	def __init__(self, **kwargs):
 		super().__init__(**kwargs)
 
+	@classmethod
+	def _from_support(cls, name, values: np.ndarray, probabilities: np.ndarray, backend: NumericBackend = None, error_budget: ErrorBudget = EXACT):
+		"""initialise from unsorted, possibly repeated sample values, merging repeated values. 
+		The result is approximated if called within the context ``approximate``"""
+		return cls._from_law(name, _reduced_law(values, probabilities), backend, error_budget)
+
+	@classmethod
+	def _from_law(cls, name, law: tuple, backend: NumericBackend = None, error_budget: ErrorBudget = EXACT):
+		"""initialise from a law ``(values, probabilities, approximation_budget)`` as returned by ``_reduced_law``"""
+		values, probabilities, approximation_budget = law
+		randvar = cls._from_arrays(name, values, probabilities, backend)
+		error_budget = error_budget + approximation_budget
+		if not error_budget.exact:
+			randvar.error_budget = error_budget
+		return randvar
+
+	@staticmethod
+	def _cached_law(key, compute) -> tuple:
+		"""Memoised arithmetic
+
+		Summary
+		-------
+		The law of ``compute()``, reduced and approximated as by ``_from_support``, memoised in the
+		arithmetic cache (c.f., ``ArithmeticCache``) under ``key`` and the current approximation settings.
+		Keys are built from the operation and the fingerprints of the operands, by the function ``key``
+		called only if caching is enabled
+
+		"""
+		return cached(lambda: key() + (get_approximation(),), lambda: _reduced_law(*compute()))
+
+	def _abs_mean(self) -> float:
+		"""E|X| for X = self, as a float"""
+		return float(np.abs(self.values.astype(float)) @ self.probabilities.astype(float))
+
+	def _product_budget(self, second_rv) -> ErrorBudget:
+		"""error budget of the product of self and second_rv, c.f., ``product_budget``"""
+		if self.error_budget.exact and second_rv.error_budget.exact:
+			return EXACT
+		return product_budget(self.error_budget, self._abs_mean(), second_rv.error_budget, second_rv._abs_mean())
+
+	def prune(self, threshold: float):
+		"""Drop negligible atoms
+
+		Summary
+		-------
+		Drop the samples with probability below ``threshold`` and renormalise (c.f., ``prune_arrays``).
+		The mass dropped and the incurred Wasserstein-1 error are added to ``error_budget``
+
+		Parameters
+		----------
+		threshold : float
+			samples with probability strictly below ``threshold`` are dropped
+
+		Returns
+		-------
+		randvar : RandVar
+			the pruned random variable under the same name, or self if nothing was dropped
+
+		"""
+		values, probabilities, lost_mass, wasserstein = prune_arrays(self.values, self.probabilities, threshold)
+		if lost_mass == 0:
+			return self
+		randvar = RandVar._from_arrays(self._name, values, probabilities, self.backend)
+		randvar.error_budget = self.error_budget + ErrorBudget(lost_mass, wasserstein)
+		return randvar
+
+	def rebin(self, size: int):
+		"""Bound the support size
+
+		Summary
+		-------
+		Rebin onto a uniform grid of at most ``size`` points, preserving mean and variance 
+		(c.f., ``rebin_arrays``). The incurred Wasserstein-1 error is added to ``error_budget``
+
+		Parameters
+		----------
+		size : int
+			the largest support size kept, at least 2
+
+		Returns
+		-------
+		randvar : RandVar
+			the rebinned random variable under the same name, or self if its support is small enough
+
+		Example
+		-------
+		>>> X = RandVar(name=sympy.Symbol('X'), values=numpy.arange(1000), probabilities=numpy.full(1000, 1/1000))
+		>>> Y = X.rebin(10)
+		>>> len(Y.values), bool(numpy.isclose(Y.V, X.V))
+		(10, True)
+
+		"""
+		if len(self.values) <= size:
+			return self
+		values, probabilities, wasserstein = rebin_arrays(self.values, self.probabilities, size)
+		randvar = RandVar._from_arrays(self._name, values, probabilities, self.backend)
+		randvar.error_budget = self.error_budget + ErrorBudget(0.0, wasserstein)
+		return randvar
+
+	def _arrays(self, backend: NumericBackend) -> tuple[np.ndarray, np.ndarray]:
+		"""the probability law of self as arrays on ``backend``"""
+		if backend is self.backend:
+			return self.values, self.probabilities
+		return backend.array(self.values), backend.array(self.probabilities)
+
 	def __add__(self, second_rv):
 		"""assumes ``self`` and ``second_rv`` are *independent*. Use ``RandVec`` for dependent variables"""
 		if isinstance(second_rv, (int, float, Decimal, Fraction)):
-			try:
-				second_rv = Decimal(str(second_rv))
-			except InvalidOperation:
-				# second_rv is a Fraction object
-				pass
-			new_name = self.name + second_rv
-			new_pspace: dict = {sample + second_rv: prob for sample, prob in self.pspace.items()}
+			backend: NumericBackend = self.backend
+			new_name = self._name + second_rv
+			law: tuple = _reduced_law(self.values + backend.number(second_rv), self.probabilities)
+			error_budget: ErrorBudget = self.error_budget
+		elif not isinstance(second_rv, RandVarBase):
+			return NotImplemented # e.g., LazyRandVar
 		else:
-			new_name = self.name + second_rv.name 
-			if new_name == 0:
+			if self._name.cancels(second_rv._name):
 				raise ValueError("use the RandVec data type to subract self from self")
+			new_name = self._name + second_rv._name
 			
-			new_pspace_dict: dict = convolve_dicts(
-					{sample.value: prob for sample, prob in self.pspace.items()}, 
-					{sample.value: prob for sample, prob in second_rv.pspace.items()}
+			backend: NumericBackend = promote(self.backend, second_rv.backend)
+			law: tuple = RandVar._cached_law(
+					lambda: ('add',) + tuple(sorted((self.fingerprint, second_rv.fingerprint))),
+					lambda: convolve_arrays(*self._arrays(backend), *second_rv._arrays(backend))
 				)
-			new_pspace: dict = {
-					Sample(**{'name': new_name, 'value': value}): prob for value, prob in new_pspace_dict.items()
-				}
-		new_name = sp.nsimplify(new_name)
-		return RandVar(**{'name': new_name, 'pspace': new_pspace})
+			error_budget: ErrorBudget = self.error_budget + second_rv.error_budget
+		return RandVar._from_law(new_name, law, backend, error_budget)
 	
 	def __radd__(self, second_rv):
 		return self.__add__(second_rv)
@@ -62,24 +179,21 @@ class RandVar(RandVarBase):
 		if isinstance(second_rv, (int, float, Decimal, Fraction, JointDistribution)):
 			if isinstance(second_rv, JointDistribution):
 				return second_rv.__mul__(self) # delegate to RandVec.__mul__
-			try:
-				second_rv = Decimal(str(second_rv))
-			except InvalidOperation:
-				# second_rv is a Fraction object
-				pass
-			new_name = second_rv * self.name
-			new_pspace = {second_rv * sample: prob for sample, prob in self.pspace.items()}
+			backend: NumericBackend = self.backend
+			new_name = as_name(second_rv) * self._name
+			law: tuple = _reduced_law(backend.number(second_rv) * self.values, self.probabilities)
+			error_budget: ErrorBudget = self.error_budget.scaled(second_rv)
+		elif not isinstance(second_rv, RandVarBase):
+			return NotImplemented # e.g., LazyRandVar
 		else:
-			new_name = self.name*second_rv.name
-			new_pspace_dict: dict = dict_mul(
-					{sample.value: prob for sample, prob in self.pspace.items()},
-					{sample.value: prob for sample, prob in second_rv.pspace.items()}
+			new_name = self._name*second_rv._name
+			backend: NumericBackend = promote(self.backend, second_rv.backend)
+			law: tuple = RandVar._cached_law(
+					lambda: ('mul',) + tuple(sorted((self.fingerprint, second_rv.fingerprint))),
+					lambda: combine_arrays(*self._arrays(backend), *second_rv._arrays(backend), np.multiply)
 				)
-			new_pspace: dict = {
-					Sample(**{'name': new_name, 'value': value}): prob for value, prob in new_pspace_dict.items()
-				}
-		new_name = sp.nsimplify(new_name)
-		return RandVar(**{'name': new_name, 'pspace': new_pspace})
+			error_budget: ErrorBudget = self._product_budget(second_rv)
+		return RandVar._from_law(new_name, law, backend, error_budget)
 	
 	def __rmul__(self, second_rv):
 		return self.__mul__(second_rv)
@@ -100,14 +214,184 @@ class RandVar(RandVarBase):
 		if power == 1:
 			return self 
 		
-		new_name = self.name**power
-		new_pspace: dict = {}
-		for sample, prob in self.pspace.items():
-			try:
-				new_pspace[sample**power] += prob
-			except KeyError:
-				new_pspace[sample**power] = prob
-		return RandVar(**{'name': new_name, 'pspace': new_pspace})
+		new_name = self._name**power
+		law: tuple = RandVar._cached_law(
+				lambda: ('pow', self.fingerprint, power),
+				lambda: (self.backend.power(self.values, power), self.probabilities)
+			)
+		return RandVar._from_law(new_name, law, self.backend, self.error_budget.unbounded())
+
+	def apply(self, function, name=None):
+		"""Pushforward by a function
+
+		Summary
+		-------
+		The law of f(X) for X = self. The function is evaluated once over the array of 
+		sample values, so it must be vectorised, e.g., a numpy ufunc. Colliding outputs 
+		are merged by summing their probabilities (c.f., ``reduce_arrays``)
+
+		Parameters
+		----------
+		function : function
+			a vectorised function, mapping the array of sample values to an array of equal length
+
+		name : sympy.Expr, optional
+			the name of the result, default is ``f(X)`` after the name of ``function`` (c.f., ``applied_name``)
+
+		Returns
+		-------
+		randvar : RandVar
+			the random variable f(X), on the numeric backend of self. Approximated within the 
+			context ``approximate``, where its error budget is unbounded
+
+		Raises
+		------
+		ValueError
+			if ``function`` does not return one value per sample value
+
+		Example
+		-------
+		>>> X = RandVar(name=sympy.Symbol('X'), values=[-1, 0, 1, 2], probabilities=[0.1, 0.2, 0.3, 0.4])
+		>>> payoff = X.apply(lambda x: numpy.maximum(x, 0), name=sympy.Max(sympy.Symbol('X'), 0))
+		>>> payoff.values, payoff.probabilities
+		(array([0., 1., 2.]), array([0.3, 0.3, 0.4]))
+
+		"""
+		new_values: np.ndarray = self.backend.array(function(self.values))
+		if not new_values.shape == self.values.shape:
+			raise ValueError(f"{function} returned shape {new_values.shape}, expected {self.values.shape}")
+		new_name = applied_name(function, self.name) if name is None else name
+		error_budget: ErrorBudget = self.error_budget.unbounded()
+		return RandVar._from_support(new_name, new_values, self.probabilities, self.backend, error_budget)
+
+	def lazy(self):
+		"""Deferred arithmetic on self
+
+		Summary
+		-------
+		Wrap self as a leaf of an expression graph (c.f., ``LazyRandVar``). Arithmetic on
+		the result is recorded rather than computed, and self appearing more than once in
+		an expression is treated as the same random variable, e.g., X - X is 0
+
+		Example
+		-------
+		>>> X = RandVar(name=sympy.Symbol('X'), values=[-1, 1], probabilities=[0.5, 0.5]).lazy()
+		>>> (X*X).evaluate().values
+		array([1.])
+
+		"""
+		from ._lazy import LazyRandVar # deferred, _lazy builds on this module
+		return LazyRandVar.leaf(self)
+
+	def iid_name(self, n: int) -> sp.Expr:
+		"""the name ``Sum(X[i], (i, 0, n-1))`` for the sum of n independent copies of X = self"""
+		label = self.name if isinstance(self.name, sp.Symbol) else sp.Symbol(f"({self.name})")
+		index = sp.Symbol('i', integer=True)
+		return sp.Sum(sp.IndexedBase(label)[index], (index, 0, n-1))
+
+	def iid_sum(self, n: int, partial_sums: bool = False):
+		"""Sum of independent copies
+
+		Summary
+		-------
+		The law of X_0 + X_1 + ... + X_{n-1} for X_i independent copies of self, 
+		computed by repeated squaring with O(log n) convolutions (c.f., ``convolve_arrays``).
+
+		Parameters
+		----------
+		n : int
+			the number of independent copies to sum, must be at least 1
+
+		partial_sums : bool, optional
+			if True, return the list of all partial sums X_0 + ... + X_{k-1} for 
+			k = 1, ..., n instead. On a lattice, each partial sum is a single direct 
+			convolution of the previous one with the law of self. Default is False
+
+		Returns
+		-------
+		result : RandVar or list[RandVar]
+			the n-fold sum, or all partial sums if ``partial_sums`` is True.
+			These are named as sums over copies of self (c.f., ``iid_name``)
+
+		Raises
+		------
+		ValueError
+			if n is not a positive integer
+
+		Example
+		-------
+		>>> X_name = sympy.Symbol('X')
+		>>> X = RandVar(name=X_name, values=[-1, 1], probabilities=[0.5, 0.5])
+		>>> S = X.iid_sum(1000)
+		>>> S.V
+		1000.0
+
+		"""
+		if not (isinstance(n, (int, np.integer)) and n >= 1):
+			raise ValueError(f"{n} is not a positive integer")
+
+		if partial_sums:
+			return self._iid_partial_sums(n)
+
+		# within the context ``approximate``, each intermediate convolution is approximated
+		name = self.iid_name(n)
+		values, probabilities, error_budget = None, None, EXACT
+		base_values, base_probabilities, base_budget = self.values, self.probabilities, self.error_budget
+		while n > 0:
+			if n & 1:
+				if values is None:
+					values, probabilities, error_budget = base_values, base_probabilities, base_budget
+				else:
+					values, probabilities = convolve_arrays(values, probabilities, base_values, base_probabilities)
+					values, probabilities, approximation_budget = _approximate_arrays(values, probabilities)
+					error_budget = error_budget + base_budget + approximation_budget
+			n >>= 1
+			if n > 0:
+				base_values, base_probabilities = convolve_arrays(base_values, base_probabilities, base_values, base_probabilities)
+				base_values, base_probabilities, approximation_budget = _approximate_arrays(base_values, base_probabilities)
+				base_budget = base_budget + base_budget + approximation_budget
+
+		randvar = RandVar._from_arrays(name, values, probabilities, self.backend)
+		if not error_budget.exact:
+			randvar.error_budget = error_budget
+		return randvar
+
+	def _iid_partial_sums(self, n: int) -> list:
+		"""all partial sums of independent copies of self, c.f., ``iid_sum``. Within the context ``approximate``,
+		each partial sum is approximated as by ``iid_sum``, off a lattice also before it is convolved further"""
+		partial_sums: list = [self._partial_sum(1, self.values, self.probabilities, self.error_budget)]
+		lattice = lattice_indices(self.values)
+		if lattice is not None and n*int(lattice[3][0][-1]) + 1 > MAX_LATTICE_LENGTH:
+			lattice = None # the grid is too fine for dense vectors over the support of the n-fold sum
+		if lattice is None:
+			values, probabilities, error_budget = self.values, self.probabilities, self.error_budget
+			for k in range(2, n+1):
+				values, probabilities = convolve_arrays(values, probabilities, self.values, self.probabilities)
+				values, probabilities, approximation_budget = _approximate_arrays(values, probabilities)
+				error_budget = error_budget + self.error_budget + approximation_budget
+				partial_sums += [self._partial_sum(k, values, probabilities, error_budget)]
+			return partial_sums
+
+		scale, step, (origin,), (indices,) = lattice
+		# accumulate rather than assign, so no probability is overwritten
+		step_dense = np.bincount(indices, weights=self.probabilities, minlength=int(indices[-1]) + 1)
+		dense = step_dense
+		for k in range(2, n+1):
+			dense = convolve_dense(dense, step_dense, nonnegative=True)
+			nonzero = np.flatnonzero(dense)
+			# the dense convolutions stay exact, so only the partial sum returned is approximated
+			values, probabilities, approximation_budget = _approximate_arrays((k*origin + step*nonzero) / scale, dense[nonzero])
+			error_budget = ErrorBudget(k*self.error_budget.lost_mass, k*self.error_budget.wasserstein) + approximation_budget
+			partial_sums += [self._partial_sum(k, values, probabilities, error_budget)]
+
+		return partial_sums
+
+	def _partial_sum(self, k: int, values: np.ndarray, probabilities: np.ndarray, error_budget: ErrorBudget):
+		"""the sum of k independent copies of self with the law passed, c.f., ``iid_name``"""
+		randvar = RandVar._from_arrays(self.iid_name(k), values, probabilities, self.backend)
+		if not error_budget.exact:
+			randvar.error_budget = error_budget
+		return randvar
 
 	def calculate_expectation(self, inplace=False) -> None:
 		"""calculate the expectation
@@ -127,15 +411,7 @@ class RandVar(RandVarBase):
 		0.6
 		
 		"""
-		expectation: Decimal = Decimal('0.0')
-		for sample, prob in self.pspace.items():
-			try:
-				expectation += sample.value * prob
-			except TypeError:
-				expectation: float = float(expectation)
-				expectation += float(sample.value) * prob
-
-		expectation: float = float(expectation) # store as float object, not Decimal
+		expectation: float = self.backend.number(self.values @ self.probabilities)
 		if inplace == True:
 			return expectation
 		else:
@@ -161,39 +437,106 @@ class RandVar(RandVarBase):
 		0.64
 
 		"""
-		square_expectation: Decimal = Decimal('0.0')
-		for sample, prob in self.pspace.items():
-			try:
-				square_expectation += (sample.value**2) * prob
-			except TypeError:
-				square_expectation: float = float(square_expectation)
-				square_expectation += (float(sample.value)**2) * prob
-
-		square_expectation: float = float(square_expectation)
 		expectation: float = self.E
+		variance: float = self.backend.number(((self.values - expectation)**2) @ self.probabilities)
 		if inplace==True: 
 			# inplace is True, do not store output
-			return square_expectation - expectation**2
+			return variance
 		else:
 			# inplace is False, store output as class attr
-			self.variance: float = square_expectation - expectation**2
+			self.variance: float = variance
 		
 	@property 
 	def V(self):
 		return self.calculate_variance(inplace=True)
 	
-	def Prob(self, predicate: str) -> float:
+	def _cumulative_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+		"""prefix and suffix sums of the probabilities over the sorted support, each of length n + 1, 
+		computed once. Upper tails are read off the suffix sums, avoiding the cancellation in 1 - Pr(X <= x)"""
+		try:
+			return self._cumulative
+		except AttributeError:
+			zero = [self.backend.number(0)]
+			prefix: np.ndarray = np.concatenate((zero, np.cumsum(self.probabilities)))
+			suffix: np.ndarray = np.concatenate((np.cumsum(self.probabilities[::-1])[::-1], zero))
+			self._cumulative: tuple = (prefix, suffix)
+			return self._cumulative
+
+	@property
+	def cumulative(self) -> np.ndarray:
+		"""the cumulative probabilities Pr(X <= x) at each x in ``values``"""
+		return self._cumulative_arrays()[0][1:]
+
+	def _interval_mass(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+		"""the probability of values[lower:upper], for arrays of indices into the sorted support"""
+		prefix, suffix = self._cumulative_arrays()
+		size: int = len(self.values)
+		lower, upper = np.broadcast_arrays(np.asarray(lower), np.asarray(upper))
+		mass = np.where(lower == 0, prefix[upper], np.where(upper == size, suffix[lower], prefix[upper] - prefix[lower]))
+		mass = np.where(upper - lower == 1, self.probabilities[np.minimum(lower, size - 1)], mass)
+		return np.where(upper <= lower, prefix[0], mass)
+
+	def _event_probability(self, clauses: tuple) -> np.ndarray:
+		"""Probability of a conjunction of comparisons
+
+		Summary
+		-------
+		Each clause ``(operator, threshold)`` bounds a range of indices into the sorted support, 
+		found by binary search. The event is the intersection of these ranges, less the points
+		excluded by ``!=``, so its probability is read off the cumulative arrays in O(log n) per
+		threshold. Thresholds may be arrays, on the numeric backend of self
+		
+		"""
+		lower, upper, holes = 0, len(self.values), []
+		for operator, threshold in clauses:
+			left = np.searchsorted(self.values, threshold, side='left')
+			right = np.searchsorted(self.values, threshold, side='right')
+			if operator == '<=':
+				upper = np.minimum(upper, right)
+			elif operator == '<':
+				upper = np.minimum(upper, left)
+			elif operator == '>=':
+				lower = np.maximum(lower, left)
+			elif operator == '>':
+				lower = np.maximum(lower, right)
+			elif operator == '==':
+				lower, upper = np.maximum(lower, left), np.minimum(upper, right)
+			elif operator == '!=':
+				holes.append((left, right))
+			else:
+				raise ValueError(f"{operator} is not a comparison, expected one of {list(COMPARISONS.keys())}")
+
+		if len(holes) == 1:
+			# the mass either side of the excluded point, rather than a difference of masses
+			(left, right), = holes
+			return (
+					self._interval_mass(lower, np.maximum(lower, np.minimum(left, upper)))
+					+ self._interval_mass(np.minimum(upper, np.maximum(right, lower)), upper)
+				)
+		mass = self._interval_mass(lower, upper)
+		for left, right in holes:
+			mass = mass - self._interval_mass(np.maximum(lower, left), np.minimum(upper, right))
+		return mass
+
+	def Prob(self, predicate: str, thresholds=None):
 		"""
 		Parameters
 		----------
 		predicate : str
 			the event whose probability is to be evaluated, e.g., for Probability(X <= 1), 
-			the predicate is ``<= 1``
+			the predicate is ``<= 1``. Comparisons may be joined by ``and`` for intervals, e.g.,
+			``> -1 and <= 1`` (c.f., ``parse_predicate``). These are answered by binary search
+			over the sorted support, any other predicate is evaluated as python source per value
+
+		thresholds : array_like, optional
+			if passed, ``predicate`` is a comparison operator alone, e.g., ``'<='``, and the 
+			probability of the comparison against each threshold is returned. Default is None
 
 		Returns
 		-------
-		rsult : float
-			the calculated probability 
+		rsult : float or np.ndarray
+			the calculated probability, on the numeric backend of self, or the array of 
+			probabilities for each of ``thresholds``
 
 		Example
 		-------
@@ -206,24 +549,160 @@ class RandVar(RandVarBase):
 		1.0
 		>>> X.Prob('!= 1')
 		0.5
+		>>> X.Prob('> -2 and < 1')
+		0.5
+		>>> X.Prob('<=', [-2, -1, 0, 1])
+		array([0. , 0.5, 0.5, 1. ])
 
 		"""
-		rsult: Decimal = Decimal('0.0')
-		for sample, prob in self.pspace.items():
-			stmnt = f"{sample.value}" + predicate
-			if eval(stmnt):
-				try:
-					rsult += prob
-				except TypeError:
-					rsult: float = float(rsult)
-					rsult += prob
-			else:
-				pass 
+		if thresholds is not None:
+			return self._event_probability(((predicate.strip(), self.backend.array(thresholds)),))
 
+		clauses = parse_predicate(predicate)
+		if clauses is None:
+			event: np.ndarray = event_mask(self.values, predicate, self.backend)
+			return self.backend.number(self.probabilities[event].sum())
+
+		clauses = tuple((operator, threshold_number(threshold, self.backend)) for operator, threshold in clauses)
+		rsult: float = self.backend.number(np.asarray(self._event_probability(clauses))[()])
 		return rsult
 
-	def generate(self, iterations: int) -> np.ndarray:
+	def _tail_moments(self) -> np.ndarray:
+		"""suffix sums of values*probabilities over the sorted support, of length n + 1, computed once"""
+		try:
+			return self._tail_moment
+		except AttributeError:
+			moments: np.ndarray = self.values * self.probabilities
+			self._tail_moment: np.ndarray = np.concatenate((np.cumsum(moments[::-1])[::-1], [self.backend.number(0)]))
+			return self._tail_moment
+
+	def _levels(self, levels, upper: bool = True) -> np.ndarray:
+		"""probability levels as an array on the backend of self, validated to lie in [0, 1], or [0, 1) if not ``upper``"""
+		levels = self.backend.array(levels)
+		if np.any(levels < 0) or np.any(levels > 1) or (not upper and np.any(levels == 1)):
+			raise ValueError(f"probability levels must lie in [0, 1{']' if upper else ')'}")
+		return levels
+
+	def quantile(self, q):
+		"""The quantile function, i.e., the inverse of the cumulative distribution function
+
+		Summary
+		-------
+		The smallest sample value x with Pr(X <= x) >= q, found by binary search over the 
+		cached cumulative probabilities (c.f., ``cumulative``)
+
+		Parameters
+		----------
+		q : float or array_like
+			the probability level(s), in [0, 1]
+
+		Returns
+		-------
+		result : float or np.ndarray
+			the quantile(s) on the numeric backend of self, an array if ``q`` is
+
+		Raises
+		------
+		ValueError
+			if any of ``q`` lies outside [0, 1]
+
+		Example
+		-------
+		>>> X = RandVar(name=sympy.Symbol('X'), values=[1, 2, 3, 4], probabilities=[0.1, 0.2, 0.3, 0.4])
+		>>> X.quantile(0.5)
+		3.0
+		>>> X.quantile([0.0, 0.1, 0.95])
+		array([1., 1., 4.])
+
+		"""
+		levels: np.ndarray = self._levels(q)
+		index = np.minimum(np.searchsorted(self.cumulative, levels, side='left'), len(self.values) - 1)
+		result = self.values[index]
+		return result if np.ndim(q) else np.asarray(result)[()]
+
+	def value_at_risk(self, alpha=0.95):
+		"""Value at risk
+
+		Summary
+		-------
+		For X = self modelling losses, the value at risk at level ``alpha`` is the ``alpha``-quantile
+		of X (c.f., ``quantile``). For profits and losses, pass -X
+
+		Parameters
+		----------
+		alpha : float or array_like, optional
+			the confidence level(s), in [0, 1]. Default is 0.95
+
+		Returns
+		-------
+		result : float or np.ndarray
+			the value at risk on the numeric backend of self, an array if ``alpha`` is
+
+		"""
+		return self.quantile(alpha)
+
+	def expected_shortfall(self, alpha=0.95):
+		"""Expected shortfall (conditional value at risk)
+
+		Summary
+		-------
+		For X = self modelling losses, the expected shortfall at level ``alpha`` is the average of 
+		the quantiles of X above ``alpha``, ES = 1/(1 - alpha) * int_alpha^1 VaR_u du. For discrete laws, 
+		this is the mean of the losses beyond the value at risk with the atom at the value at risk 
+		weighted by Pr(X <= VaR) - alpha. Read off cached cumulative arrays in O(log n) per level
+
+		Parameters
+		----------
+		alpha : float or array_like, optional
+			the confidence level(s), in [0, 1). Default is 0.95
+
+		Returns
+		-------
+		result : float or np.ndarray
+			the expected shortfall on the numeric backend of self, an array if ``alpha`` is
+
+		Raises
+		------
+		ValueError
+			if any of ``alpha`` lies outside [0, 1)
+
+		Example
+		-------
+		>>> X = RandVar(name=sympy.Symbol('X'), values=[1, 2, 3, 4], probabilities=[0.1, 0.2, 0.3, 0.4])
+		>>> X.expected_shortfall(0.5)
+		3.8
+
+		"""
+		levels: np.ndarray = self._levels(alpha, upper=False)
+		prefix, _ = self._cumulative_arrays()
+		index = np.minimum(np.searchsorted(self.cumulative, levels, side='left'), len(self.values) - 1)
+		shortfall = (self._tail_moments()[index + 1] + self.values[index]*(prefix[index + 1] - levels)) / (1 - levels)
+		return shortfall if np.ndim(alpha) else np.asarray(shortfall)[()]
+
+	@property
+	def sampler(self) -> AliasSampler:
+		"""the alias table over the support of self, built once on first use (c.f., ``AliasSampler``)"""
+		try:
+			return self._sampler
+		except AttributeError:
+			self._sampler: AliasSampler = AliasSampler(self.probabilities)
+			return self._sampler
+
+	def generate(self, iterations: int, rng: np.random.Generator = None) -> np.ndarray:
 		"""generate random samples of self (the random variable)
+
+		Parameters
+		----------
+		iterations : int
+			the number of independent samples to draw
+
+		rng : numpy.random.Generator, optional
+			the source of randomness, also accepts a seed. Default is the global state of ``numpy.random``, as set by ``numpy.random.seed``
+
+		Returns
+		-------
+		out : np.ndarray
+			the samples on the numeric backend of self, drawn in O(1) each from the cached alias table
 		
 		Example
 		-------
@@ -231,13 +710,10 @@ class RandVar(RandVarBase):
 		>>> X_pspace = {Sample(name=X_name, value=1): 0.8, Sample(name=X_name, value=-1): 0.2}
 		>>> X = RandVar(name=X_name, pspace=X_pspace)
 		>>> X.generate(5)
-		[1, 1, -1, 1, 1]
+		array([ 1.,  1., -1.,  1.,  1.])
 		
 		"""
-		sample_values = [sample.value for sample in self.pspace.keys()]
-		probabilities = list(self.pspace.values())
-		out = np.random.choice(sample_values, iterations, probabilities)
-
+		out = self.values[self.sampler.draw(iterations, rng=rng)]
 		return out
 
 	def pdf(self, **kwargs):
@@ -263,3 +739,21 @@ class RandVar(RandVarBase):
 		"""
 		rv_sim = RandVarSimulator(**kwargs)
 		rv_sim.cdfs(self)
+
+def _reduced_law(values: np.ndarray, probabilities: np.ndarray) -> tuple:
+	"""merge repeated values and approximate as set by the context ``approximate``, c.f., ``RandVar._from_support``"""
+	values, probabilities = reduce_arrays(values, probabilities)
+	return _approximate_arrays(values, probabilities)
+
+def _approximate_arrays(values: np.ndarray, probabilities: np.ndarray) -> tuple:
+	"""prune and rebin a probability law as set by the context ``approximate``, returning the incurred ``ErrorBudget``"""
+	threshold, size = get_approximation()
+	error_budget: ErrorBudget = EXACT
+	if threshold is not None:
+		values, probabilities, lost_mass, wasserstein = prune_arrays(values, probabilities, threshold)
+		if lost_mass:
+			error_budget = ErrorBudget(lost_mass, wasserstein)
+	if size is not None and len(values) > size:
+		values, probabilities, wasserstein = rebin_arrays(values, probabilities, size)
+		error_budget = error_budget + ErrorBudget(0.0, wasserstein)
+	return values, probabilities, error_budget
@@ -0,0 +1,55 @@
+from .. import RandVar, LazyRandVar
+from ...core import numeric_backend
+from fractions import Fraction
+import numpy as np
+import sympy as sp
+
+X, Y, Z = sp.symbols('X, Y, Z')
+
+def test_lazy_dependence():
+
+    rvX = RandVar(name=X, values=[-1, 1], probabilities=[0.5, 0.5])
+    rvY = RandVar(name=Y, values=[0, 1, 2], probabilities=[0.2, 0.3, 0.5])
+    lazyX, lazyY = rvX.lazy(), rvY.lazy()
+
+    # shared leaves are the same random variable
+    zero = (lazyX - lazyX).evaluate()
+    assert np.array_equal(zero.values, [0.0]) and zero.name == 0
+    assert np.array_equal((lazyX*lazyX).evaluate().values, [1.0])
+
+    # X*Y - X + 2 = X*(Y - 1) + 2
+    expr = lazyX*lazyY - lazyX + 2
+    assert isinstance(expr, LazyRandVar) and expr.leaves == [rvX, rvY]
+    result = expr.evaluate()
+    assert result.name == X*Y - X + 2
+    assert np.allclose(result.values, [1.0, 2.0, 3.0])
+    assert np.allclose(result.probabilities, [0.35, 0.3, 0.35])
+    assert expr.evaluate() is result
+
+    # expressions without shared leaves agree with eager arithmetic, also mixing in RandVar objects
+    rvZ = RandVar(name=Z, values=[-0.5, 0.4], probabilities=[0.44, 0.56])
+    eager = rvX*rvY + rvZ**2
+    lazy = (lazyX*rvY + rvZ.lazy()**2).evaluate()
+    assert np.allclose(lazy.values, eager.values) and np.allclose(lazy.probabilities, eager.probabilities)
+    assert (rvX + lazyY).name == X + Y
+
+def test_lazy_evaluate():
+
+    rvX = RandVar(name=X, values=[-1, 1], probabilities=[0.5, 0.5])
+    with numeric_backend('fraction'):
+        rvY = RandVar(name=Y, values=[0, 1], probabilities=[0.9, 0.1])
+    expr = rvY.lazy()*rvX.lazy() + rvX
+
+    exact = expr.evaluate()
+    assert exact.backend.name == 'fraction'
+    assert list(exact.probabilities) == [Fraction(1, 20), Fraction(9, 20), Fraction(9, 20), Fraction(1, 20)]
+
+    sampled = expr.evaluate('monte_carlo', iterations=20000, rng=0)
+    assert set(sampled.values.tolist()) <= set(exact.values.tolist())
+    assert abs(float(sampled.E) - float(exact.E)) < 0.05
+
+    try:
+        expr.evaluate('quadrature')
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,47 @@
+from .. import RandVar, maximum, minimum, order_statistic
+from itertools import product
+from fractions import Fraction
+import numpy as np
+import sympy as sp
+
+def brute_force(randvars: list, statistic) -> tuple:
+    law: dict = {}
+    for atoms in product(*[list(zip(rv.values, rv.probabilities)) for rv in randvars]):
+        value = statistic([value for value, _ in atoms])
+        law[value] = law.get(value, 0) + np.prod([probability for _, probability in atoms])
+    values = sorted(law)
+    return np.array(values), np.array([law[value] for value in values])
+
+def test_order_statistics():
+    rng = np.random.default_rng(0)
+    randvars = [
+            RandVar(name=sp.Symbol(f'X_{i}'), values=rng.choice(np.arange(-4, 5), size=3, replace=False), probabilities=[0.2, 0.3, 0.5])
+            for i in range(4)
+        ]
+    statistics = [(maximum(*randvars), max), (minimum(*randvars), min)]
+    statistics += [(order_statistic(k, *randvars), lambda values, k=k: sorted(values)[k-1]) for k in range(1, 5)]
+    for randvar, statistic in statistics:
+        values, probabilities = brute_force(randvars, statistic)
+        assert np.array_equal(randvar.values, values) and np.allclose(randvar.probabilities, probabilities)
+    assert maximum(*randvars).name == sp.Max(*sp.symbols('X_0:4'))
+
+def test_order_statistics_exact():
+    randvars = [RandVar(name=sp.Symbol(f'X_{i}'), values=[0, 1], probabilities=[0.5, 0.5], backend='fraction') for i in range(3)]
+    assert list(maximum(*randvars).probabilities) == [Fraction(1, 8), Fraction(7, 8)]
+    assert list(minimum(*randvars).probabilities) == [Fraction(7, 8), Fraction(1, 8)]
+    assert list(order_statistic(2, *randvars).probabilities) == [Fraction(1, 2), Fraction(1, 2)]
+
+    try:
+        order_statistic(4, *randvars)
+        assert False
+    except ValueError:
+        pass
+
+def test_order_statistics_repeated():
+    # a random variable passed twice is passed as two independent copies
+    X = sp.Symbol('X')
+    rvX = RandVar(name=X, values=[0, 1], probabilities=[0.5, 0.5])
+    rvM = maximum(rvX, rvX)
+    assert np.allclose(rvM.probabilities, [0.25, 0.75]) and rvM.name == sp.Max(sp.IndexedBase(X)[0], sp.IndexedBase(X)[1])
+    assert np.allclose(minimum(rvX, rvX).probabilities, [0.75, 0.25]) and minimum(rvX, rvX).name != X
+    assert np.isclose((rvM - rvX).E, 0.25)
@@ -1,6 +1,9 @@
 from .. import RandVar
 from ...utils import rvdict_to_pspace
+from ...core import numeric_backend, approximate, ArithmeticCache, arithmetic_cache
 from decimal import Decimal
+from fractions import Fraction
+import numpy as np
 import sympy as sp
 
 X, Y, Z = sp.symbols('X, Y, Z')
@@ -112,3 +115,200 @@ def test_randvar_prob():
 
     assert isinstance(U.Prob('<= 1'), (float, Decimal))
 
+
+def test_randvar_arrays():
+
+    rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    rvY_arrays = RandVar(name=Y, values=[3, -3, 0, -2, 2], probabilities=[0.11, 0.15, 0.25, 0.3, 0.19])
+    assert rvY == rvY_arrays
+
+    rvZ = RandVar(name=Z, pspace=rvdict_to_pspace(Z_dict))
+    rvU = rvY*rvZ + rvZ**2
+    assert np.all(np.diff(rvU.values) > 0) # sorted, unique support
+    assert round(sum(rvU.probabilities), 8) == 1
+    assert len(rvU.pspace) == len(rvU.values)
+
+def test_randvar_iid_sum():
+
+    rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    rvZ = RandVar(name=Z, pspace=rvdict_to_pspace(Z_dict))
+
+    sf: int = 5
+    for rv in [rvY, rvZ]:
+        rv_sum = rv.iid_sum(7)
+        partial_sums = rv.iid_sum(7, partial_sums=True)
+        assert len(partial_sums) == 7
+        assert round(rv_sum.E, sf) == round(7*rv.E, sf)
+        assert round(rv_sum.V, sf) == round(7*rv.V, sf)
+        assert all(round(partial_sums[k].V, sf) == round((k + 1)*rv.V, sf) for k in range(7))
+        assert np.allclose(partial_sums[-1].values, rv_sum.values)
+
+    # distinct values within rounding errors of a common grid point keep their mass
+    rvX = RandVar(name=X, values=[1e6, 1e6 + 1e-9, 1e6 + 1], probabilities=[0.3, 0.3, 0.4])
+    partial_sums = rvX.iid_sum(3, partial_sums=True)
+    assert np.isclose(rvX.iid_sum(3).probabilities.sum(), 1)
+    assert all(np.isclose(partial_sum.probabilities.sum(), 1) for partial_sum in partial_sums)
+    assert np.isclose(partial_sums[-1].E, 3*rvX.E)
+
+def test_randvar_generate():
+
+    rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    outcomes = rvY.generate(200000, rng=np.random.default_rng(0))
+    frequencies = np.array([np.mean(outcomes == value) for value in rvY.values])
+
+    assert outcomes.dtype == np.float64
+    assert np.all(np.isin(outcomes, rvY.values))
+    assert np.allclose(frequencies, rvY.probabilities, atol=0.01) # not uniform
+    assert np.array_equal(rvY.generate(10, rng=1), rvY.generate(10, rng=1))
+
+    np.random.seed(0) # the global state is used by default
+    first = rvY.generate(10)
+    np.random.seed(0)
+    assert np.array_equal(first, rvY.generate(10))
+
+def test_randvar_backends():
+
+    with numeric_backend('fraction'):
+        rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    rvZ = RandVar(name=Z, pspace=rvdict_to_pspace(Z_dict), backend='decimal')
+    rvU = rvY*rvZ + rvZ**2
+
+    assert rvU.backend.name == 'fraction'
+    assert sum(rvU.probabilities) == 1 # exact
+    assert isinstance(rvU.E, Fraction)
+    assert isinstance((rvZ + 1).V, Decimal)
+
+    rvY_float = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    rvZ_float = RandVar(name=Z, pspace=rvdict_to_pspace(Z_dict))
+    rvU_float = rvY_float*rvZ_float + rvZ_float**2
+    assert np.allclose(rvU.values.astype(float), rvU_float.values)
+    assert np.allclose(rvU.probabilities.astype(float), rvU_float.probabilities)
+
+def test_randvar_approximate():
+
+    rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    rvZ = RandVar(name=Z, pspace=rvdict_to_pspace(Z_dict))
+    assert rvY.error_budget.exact
+    assert rvY.prune(0.01) is rvY
+
+    rvY_pruned = rvY.prune(0.12)
+    assert len(rvY_pruned.values) == 4
+    assert np.isclose(rvY_pruned.error_budget.lost_mass, 0.11)
+
+    with approximate(threshold=1e-12, size=32):
+        rvU = rvY
+        for _ in range(20):
+            rvU = rvU*rvZ + rvY
+    assert len(rvU.values) <= 32
+    assert 0 < rvU.error_budget.wasserstein < np.inf
+
+    rvS = rvY.iid_sum(40)
+    with approximate(size=16):
+        rvS_rebinned = rvY.iid_sum(40)
+    assert len(rvS_rebinned.values) <= 16
+    assert np.isclose(rvS_rebinned.E, rvS.E) and np.isclose(rvS_rebinned.V, rvS.V)
+
+    # partial sums are approximated as the n-fold sum, on and off a lattice
+    for rv in (rvY, RandVar(name=X, values=[0, 1, np.pi], probabilities=[0.3, 0.3, 0.4])):
+        with approximate(threshold=1e-3, size=16):
+            partial_sums = rv.iid_sum(20, partial_sums=True)
+            rv_sum = rv.iid_sum(20)
+        assert all(len(partial_sum.values) <= 16 for partial_sum in partial_sums)
+        assert not partial_sums[-1].error_budget.exact and not rv_sum.error_budget.exact
+        assert not partial_sums[0].values.flags.writeable
+
+def test_randvar_cache():
+
+    rvX = RandVar(name=X, values=[-1, 1], probabilities=[0.5, 0.5])
+    rvY = RandVar(name=Y, values=[0, 1, 2], probabilities=[0.2, 0.3, 0.5])
+    rvZ = RandVar(name=Z, values=[-1, 1], probabilities=[0.5, 0.5])
+    with arithmetic_cache(ArithmeticCache()) as cache:
+        first, second = rvX + rvY, rvY + rvZ
+        assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+        assert second.name == Y + Z and np.shares_memory(first.values, second.values)
+        assert second == rvZ + rvY and cache.stats['hits'] == 2
+        assert np.array_equal((rvX*rvY).values, (rvY*rvZ).values) and cache.stats['hits'] == 3
+        assert np.array_equal((rvY**2).values, (rvY**2).values) and cache.stats['hits'] == 4
+
+        # laws are read-only, as cached laws are shared among results
+        for array in (first.values, first.probabilities, rvX.values):
+            try:
+                array *= 2
+                assert False
+            except ValueError:
+                pass
+
+        # results under approximation are cached apart
+        with approximate(threshold=0.2):
+            assert len((rvX + rvY).values) < len(first.values)
+
+def test_randvar_prob_queries():
+
+    rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    thresholds = np.linspace(-4, 4, 33)
+    for operator in ('<=', '<', '>=', '>', '==', '!='):
+        brute = [rvY.probabilities[eval(f"rvY.values {operator} {t}")].sum() for t in thresholds]
+        assert np.allclose(rvY.Prob(operator, thresholds), brute)
+        assert np.isclose(rvY.Prob(f"{operator} 0"), brute[16])
+
+    assert np.isclose(rvY.Prob('> -3 and <= 2'), 0.3 + 0.25 + 0.19)
+    assert np.isclose(rvY.Prob('>= -3 and != 0 and != 2'), 1 - 0.25 - 0.19)
+    assert rvY.Prob('> 1 and < 0') == 0
+    assert np.allclose(rvY.cumulative, np.cumsum(rvY.probabilities))
+
+    # exact backends answer exactly
+    rvF = RandVar(name=Y, values=[0, 1, 2], probabilities=[0.1, 0.2, 0.7], backend='fraction')
+    assert rvF.Prob('> 0') == Fraction(9, 10) and rvF.Prob('!= 1') == Fraction(4, 5)
+
+def test_randvar_quantiles():
+
+    rvX = RandVar(name=X, values=[1, 2, 3, 4], probabilities=[0.1, 0.2, 0.3, 0.4])
+    assert rvX.quantile(0.5) == 3.0 and rvX.value_at_risk(0.95) == 4.0
+    assert np.array_equal(rvX.quantile([0.0, 0.1, 0.11, 1.0]), [1.0, 1.0, 2.0, 4.0])
+    assert np.isclose(rvX.expected_shortfall(0.0), rvX.E)
+    assert np.allclose(rvX.expected_shortfall([0.5, 0.6, 0.95]), [3.8, 4.0, 4.0])
+
+    # against the tail average of quantiles
+    rvY = RandVar(name=Y, pspace=rvdict_to_pspace(Y_dict))
+    grid = np.linspace(0.8, 1, 200001)[:-1]
+    assert np.isclose(rvY.expected_shortfall(0.8), rvY.quantile(grid).mean(), atol=1e-4)
+
+    rvF = RandVar(name=X, values=[1, 2, 3, 4], probabilities=[0.1, 0.2, 0.3, 0.4], backend='fraction')
+    assert rvF.expected_shortfall(0.5) == Fraction(19, 5)
+
+    for method, level in ((rvX.quantile, 1.5), (rvX.expected_shortfall, 1.0)):
+        try:
+            method(level)
+            assert False
+        except ValueError:
+            pass
+
+def test_randvar_apply():
+
+    rvX = RandVar(name=X, values=[-1, 0, 1, 2], probabilities=[0.1, 0.2, 0.3, 0.4])
+    payoff = rvX.apply(lambda x: np.maximum(x, 0), name=sp.Max(X, 0))
+    assert payoff.name == sp.Max(X, 0)
+    assert np.array_equal(payoff.values, [0.0, 1.0, 2.0]) and np.allclose(payoff.probabilities, [0.3, 0.3, 0.4])
+    assert rvX.apply(np.square) == RandVar(name=sp.Function('square')(X), values=[0, 1, 4], probabilities=[0.2, 0.4, 0.4])
+    assert rvX.apply(lambda x: x + 1).name == sp.Function('f')(X)
+
+    rvF = RandVar(name=X, values=[-1, 0, 1], probabilities=[0.25, 0.5, 0.25], backend='fraction')
+    assert list(rvF.apply(np.abs).probabilities) == [Fraction(1, 2), Fraction(1, 2)]
+
+    try:
+        rvX.apply(np.sum)
+        assert False
+    except ValueError:
+        pass
+
+def test_randvar_self_subtraction():
+
+    rvX = RandVar(name=X, values=[-1, 1], probabilities=[0.5, 0.5])
+    for difference in (lambda: rvX - rvX, lambda: 2*rvX + (-2)*rvX, lambda: 1*rvX - rvX):
+        try:
+            difference()
+            assert False
+        except ValueError:
+            pass
+    rvY = RandVar(name=Y, values=[-1, 1], probabilities=[0.5, 0.5])
+    assert (2*rvX - 2*rvY).V == 8
@@ -1 +1,2 @@
 from ._randvec import RandVec
+from ._factorized import FactorizedRandVec
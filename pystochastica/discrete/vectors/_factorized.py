@@ -0,0 +1,235 @@
+from ..core import RandVarBase, JointDistribution, NumericBackend, promote, dot_names, readonly
+from ..core import ErrorBudget, EXACT
+from ..variables import RandVar
+from ..utils import combine_many_arrays, convolve_arrays, product_arrays
+from ._randvec import RandVec
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
+
+def _as_block(block) -> RandVec:
+    """view a random variable as a 1-dimensional random vector, random vectors are passed through"""
+    if isinstance(block, RandVec):
+        return block
+    if isinstance(block, JointDistribution):
+        randvec = RandVec._from_arrays(block._name, block.values, block.probabilities, block.backend)
+    else:
+        randvec = RandVec._from_arrays([block._name], block.values[:, None], block.probabilities, block.backend)
+    if not block.error_budget.exact:
+        randvec.error_budget = block.error_budget
+    return randvec
+
+class FactorizedRandVec(RandVec):
+    """
+
+    Summary
+    -------
+    A random vector whose law factorizes over independent blocks, each block a random variable
+    (``RandVar``) or a random vector with a dense joint table (``RandVec``). The components are
+    the components of the blocks, in order. Only the blocks are held, so a vector of 30
+    independent binary random variables holds 60 atoms rather than 2^30 joint samples.
+
+    Expectation, covariance, ``dot``, ``sum``, ``Prob`` for rectangular events, sampling, addition
+    of vectors with matching blocks and scalar multiplication run blockwise. Any other operation
+    (e.g., ``pspace``, ``prune`` or multiplication by a random variable) materializes the joint
+    table of the product distribution through ``values`` and ``probabilities``, once.
+
+    Example
+    -------
+    >>> X = [RandVar(name=sympy.Symbol(f'X_{i}'), values=[0, 1], probabilities=[0.5, 0.5]) for i in range(30)]
+    >>> rvec = FactorizedRandVec(blocks=X)
+    >>> rvec.sum().V
+    7.5
+
+    """
+    def __new__(cls, **kwargs):
+        """Argument validation before calling the constructor
+
+        Parameters
+        ----------
+        blocks : list[RandVar or RandVec]
+            the independent blocks, at least one
+
+        Raises
+        ------
+        TypeError
+            if not all blocks are ``RandVarBase`` or ``JointDistribution`` objects
+
+        ValueError
+            if no blocks are passed
+
+        """
+        blocks: list = list(kwargs['blocks'])
+        if len(blocks) == 0:
+            raise ValueError("a factorized random vector requires at least one block")
+        if not all(isinstance(block, (RandVarBase, JointDistribution)) for block in blocks):
+            raise TypeError(f"not all blocks are of type {RandVarBase.__name__} or {JointDistribution.__name__}")
+        return object.__new__(cls)
+
+    def __init__(self, **kwargs) -> None:
+        """Constructor method
+
+        Parameters
+        ----------
+        blocks : list[RandVar or RandVec]
+            the independent blocks. Random variables are held as 1-dimensional random vectors
+
+        """
+        self.blocks: list[RandVec] = [_as_block(block) for block in kwargs['blocks']]
+        self._name: list = [name for block in self.blocks for name in block._name]
+        self.dimension: int = len(self._name)
+        self.backend: NumericBackend = promote(*(block.backend for block in self.blocks))
+
+        error_budget: ErrorBudget = EXACT
+        for block in self.blocks:
+            error_budget = error_budget + block.error_budget
+        if not error_budget.exact:
+            self.error_budget: ErrorBudget = error_budget
+
+    @classmethod
+    def _from_blocks(cls, blocks: list):
+        """trusted constructor from a list of blocks, skipping argument validation"""
+        randvec = object.__new__(cls)
+        randvec.__init__(blocks=blocks)
+        return randvec
+
+    @property
+    def slices(self) -> list[slice]:
+        """the indices of the components of each block"""
+        bounds = np.cumsum([0] + [block.dimension for block in self.blocks]).tolist()
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def _materialize(self) -> tuple[np.ndarray, np.ndarray]:
+        """the joint table of the product distribution over the blocks, built once"""
+        try:
+            return self._joint
+        except AttributeError:
+            pass
+        values, probabilities = product_arrays([block._arrays(self.backend) for block in self.blocks], self.backend)
+        self._joint: tuple = (readonly(values), readonly(probabilities))
+        return self._joint
+
+    @property
+    def values(self) -> np.ndarray:
+        """the joint samples of the product distribution, materialized on first access"""
+        return self._materialize()[0]
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        """the probabilities of the joint samples, materialized on first access"""
+        return self._materialize()[1]
+
+    def materialize(self) -> RandVec:
+        """the random vector with the joint table of the product distribution"""
+        randvec = RandVec._from_arrays(self._name, self.values, self.probabilities, self.backend)
+        if not self.error_budget.exact:
+            randvec.error_budget = self.error_budget
+        return randvec
+
+    @property
+    def components(self) -> np.ndarray:
+        """the marginals of the blocks as ``RandVar`` objects"""
+        try:
+            return self._components
+        except AttributeError:
+            self._components: np.ndarray = np.concatenate([block.components for block in self.blocks])
+            return self._components
+
+    def _same_blocks(self, second_rvec) -> bool:
+        """True if ``second_rvec`` is factorized over blocks of the same dimensions"""
+        return (
+                isinstance(second_rvec, FactorizedRandVec)
+                and [block.dimension for block in self.blocks] == [block.dimension for block in second_rvec.blocks]
+            )
+
+    def __add__(self, second_rvec):
+        """blockwise for shifts and for independent factorized vectors with matching blocks, c.f., ``RandVec.__add__``"""
+        if isinstance(second_rvec, (list, np.ndarray)):
+            return FactorizedRandVec._from_blocks([block + list(second_rvec[index]) for block, index in zip(self.blocks, self.slices)])
+        if self._same_blocks(second_rvec):
+            return FactorizedRandVec._from_blocks([block + second_block for block, second_block in zip(self.blocks, second_rvec.blocks)])
+        return super().__add__(second_rvec)
+
+    def __mul__(self, randvar):
+        """blockwise for scalars, multiplication by a random variable couples the blocks, c.f., ``RandVec.__mul__``"""
+        if isinstance(randvar, (int, float, Decimal, Fraction)):
+            return FactorizedRandVec._from_blocks([randvar*block for block in self.blocks])
+        return super().__mul__(randvar)
+
+    def dot(self, second_rvec):
+        """The dot product, as the sum of the independent blockwise dot products
+
+        Parameters
+        ----------
+        second_rvec : list, np.ndarray or RandVec
+            weights, or a random vector independent of self. The sum is blockwise if ``second_rvec``
+            is weights or a ``FactorizedRandVec`` with blocks of matching dimensions, otherwise
+            the joint table of self is materialized (c.f., ``RandVec.dot``)
+
+        Returns
+        -------
+        result : RandVar
+            the dot product, its law the convolution of the laws of the blockwise dot products
+
+        """
+        if isinstance(second_rvec, (list, np.ndarray)):
+            weights: list = list(second_rvec)
+            partial_dots: list = [block.dot(weights[index]) for block, index in zip(self.blocks, self.slices)]
+            new_name = dot_names(self._name, weights)
+        elif self._same_blocks(second_rvec):
+            partial_dots: list = [block.dot(second_block) for block, second_block in zip(self.blocks, second_rvec.blocks)]
+            new_name = dot_names(self._name, second_rvec._name)
+        else:
+            return super().dot(self.materialize() if isinstance(second_rvec, FactorizedRandVec) else second_rvec)
+
+        backend: NumericBackend = promote(*(partial_dot.backend for partial_dot in partial_dots))
+        values, probabilities = combine_many_arrays([partial_dot._arrays(backend) for partial_dot in partial_dots], combine=convolve_arrays)
+        error_budget: ErrorBudget = EXACT
+        for partial_dot in partial_dots:
+            error_budget = error_budget + partial_dot.error_budget
+        return RandVar._from_support(new_name, values, probabilities, backend, error_budget)
+
+    @property
+    def E(self):
+        try:
+            return self._expectation
+        except AttributeError:
+            self._expectation: np.ndarray = readonly(np.concatenate([self.backend.array(block.E) for block in self.blocks]))
+            return self._expectation
+
+    @property
+    def V(self):
+        """the covariance matrix, block diagonal since the blocks are independent"""
+        try:
+            return self._cov_mtrx
+        except AttributeError:
+            cov_mtrx = np.zeros((self.dimension, self.dimension), dtype=self.backend.dtype)
+            cov_mtrx[:] = self.backend.number(0)
+            for block, index in zip(self.blocks, self.slices):
+                cov_mtrx[index, index] = self.backend.array(block.V)
+            self._cov_mtrx: np.ndarray = readonly(cov_mtrx)
+            return self._cov_mtrx
+
+    def Prob(self, predicate: list[str]) -> float:
+        """the probability of a rectangular event, as the product of its probabilities on each block (c.f., ``RandVec.Prob``)"""
+        if isinstance(predicate, str):
+            predicate = [predicate]*self.dimension
+        probability = self.backend.number(1)
+        for block, index in zip(self.blocks, self.slices):
+            probability = probability * self.backend.number(block.Prob(list(predicate[index])))
+        return probability
+
+    def given(self, axis: int, predicate: str):
+        """conditioning on an event on one axis conditions its block only, the other blocks are independent of it (c.f., ``RandVec.given``)"""
+        if not (isinstance(axis, (int, np.integer)) and 0 <= axis < self.dimension):
+            raise ValueError(f"{axis} is not an axis of a random vector of dimension {self.dimension}")
+        blocks: list = list(self.blocks)
+        for k, index in enumerate(self.slices):
+            if index.start <= axis < index.stop:
+                blocks[k] = blocks[k].given(axis - index.start, predicate)
+        return FactorizedRandVec._from_blocks(blocks)
+
+    def generate(self, iterations: int, rng: np.random.Generator = None) -> np.ndarray:
+        """generate joint random samples of self, drawing each block independently (c.f., ``RandVec.generate``)"""
+        rng = None if rng is None else np.random.default_rng(rng)
+        return np.concatenate([self.backend.array(block.generate(iterations, rng=rng)) for block in self.blocks], axis=1)
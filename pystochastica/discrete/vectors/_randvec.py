@@ -1,8 +1,10 @@
-from ..core import JointDistribution
+from ..core import JointDistribution, NumericBackend, promote, as_name, dot_names, applied_name, readonly
+from ..core import ErrorBudget, EXACT, product_budget, get_approximation, cached, event_mask
 from ..variables import RandVar
+from ..simulations import AliasSampler
 from ..samples import Sample
-from ..utils import generate_jdist
-from decimal import Decimal, InvalidOperation
+from ..utils import reduce_rows, prune_arrays, convolve_rows
+from decimal import Decimal
 from fractions import Fraction
 import numpy as np
 import sympy as sp
@@ -26,7 +28,7 @@ def sample_base_descent(*samplebases) -> tuple[Sample]:
         a list of Sample type objects
     
     """
-    return tuple([Sample(name=samplebase.name, value=samplebase.value) for samplebase in samplebases])
+    return tuple([Sample._from_value(samplebase.name, samplebase.value) for samplebase in samplebases])
 
 def randvar_base_descent(*randvarbases) -> list[RandVar]:
     """Base conversion
@@ -34,10 +36,15 @@ def randvar_base_descent(*randvarbases) -> list[RandVar]:
     Summary
     -------
     Convert a list of ``RandVarBase`` objects to ``RandVar`` objects. This allows for 
-    utilising the arithmetic coded into the ``RandVar`` class
+    utilising the arithmetic coded into the ``RandVar`` class. Error budgets are carried over
     
     """
-    return [RandVar(name=rv.name, pspace=rv.pspace) for rv in randvarbases]
+    randvars: list = []
+    for rv in randvarbases:
+        randvars += [RandVar._from_arrays(rv._name, rv.values, rv.probabilities, rv.backend)]
+        if not rv.error_budget.exact:
+            randvars[-1].error_budget = rv.error_budget
+    return randvars
 
 class RandVec(JointDistribution):
     """
@@ -59,22 +66,88 @@ class RandVec(JointDistribution):
     In order to correctly calculate X - X, we need to sum the ``RandVec`` object [X, -X]
 
     """
+    # pspace keys are Sample type objects
+    _sample_class: type = Sample
+
     def __init__(self, **joint_pspace: dict) -> None:
         super().__init__(**joint_pspace)
 
-        # validate pspace keys are Sample type objects
-        pspace_validated: dict = {
-            sample_base_descent(*k): v for k, v in self.pspace.items()
-        }
-        self.pspace: dict = pspace_validated
+    @classmethod
+    def _from_rows(cls, name: list, values: np.ndarray, probabilities: np.ndarray, backend: NumericBackend = None, error_budget: ErrorBudget = EXACT):
+        """initialise from possibly repeated rows of joint samples, merging repeated rows. 
+        The result is pruned if called within the context ``approximate``"""
+        values, probabilities = reduce_rows(values, probabilities)
+        threshold, _ = get_approximation()
+        if threshold is not None:
+            values, probabilities, lost_mass, wasserstein = prune_arrays(values, probabilities, threshold)
+            if lost_mass:
+                error_budget = error_budget + ErrorBudget(lost_mass, wasserstein)
+
+        randvec = cls._from_arrays(name, values, probabilities, backend)
+        if not error_budget.exact:
+            randvec.error_budget = error_budget
+        return randvec
+
+    def _norm_mean(self, ord) -> float:
+        """E||X|| for X = self in the ``ord``-norm, as a float"""
+        return float(np.linalg.norm(self.values.astype(float), ord=ord, axis=1) @ self.probabilities.astype(float))
+
+    def prune(self, threshold: float):
+        """Drop negligible joint samples
+
+        Summary
+        -------
+        Drop the joint samples with probability below ``threshold`` and renormalise (c.f., ``prune_arrays``).
+        The mass dropped and the incurred Wasserstein-1 error, in the 1-norm, are added to ``error_budget``
 
-        # generate random vector components
-        self.derive_marginals()
-        self.derive_secondaries()
+        Parameters
+        ----------
+        threshold : float
+            joint samples with probability strictly below ``threshold`` are dropped
 
-        # Descent, RandvarBase --> RandVar, to fill random vector components
-        self.components: np.ndarray = np.array(randvar_base_descent(*self.marginals))
-        self.secondaries: np.ndarray = np.array(randvar_base_descent(*self.secondaries))
+        Returns
+        -------
+        randvec : RandVec
+            the pruned random vector under the same names, or self if nothing was dropped
+
+        """
+        values, probabilities, lost_mass, wasserstein = prune_arrays(self.values, self.probabilities, threshold)
+        if lost_mass == 0:
+            return self
+        randvec = RandVec._from_arrays(self._name, values, probabilities, self.backend)
+        randvec.error_budget = self.error_budget + ErrorBudget(lost_mass, wasserstein)
+        return randvec
+
+    def _arrays(self, backend: NumericBackend) -> tuple[np.ndarray, np.ndarray]:
+        """the joint distribution of self as arrays on ``backend``"""
+        if backend is self.backend:
+            return self.values, self.probabilities
+        return backend.array(self.values), backend.array(self.probabilities)
+
+    # random vector components, secondaries and the covariance matrix are derived
+    # from the joint distribution on first use and cached thereafter
+    @property
+    def components(self) -> np.ndarray:
+        """the marginals of the joint distribution as ``RandVar`` objects"""
+        try:
+            return self._components
+        except AttributeError:
+            # Descent, RandvarBase --> RandVar, to fill random vector components
+            self._components: np.ndarray = np.array(randvar_base_descent(*self.derive_marginals(inplace=True)))
+            return self._components
+
+    @property
+    def secondaries(self) -> np.ndarray:
+        """the secondaries of the joint distribution as ``RandVar`` objects (c.f., ``derive_secondaries``)"""
+        try:
+            return self._secondaries
+        except AttributeError:
+            self.secondaries = self.derive_secondaries(inplace=True)
+            return self._secondaries
+
+    @secondaries.setter
+    def secondaries(self, secondaries: list) -> None:
+        self._secondaries: np.ndarray = np.array(randvar_base_descent(*secondaries))
 
     def __add__(self, second_randvec):
         """Addition of ``RandVec`` objects
@@ -83,30 +156,28 @@ class RandVec(JointDistribution):
         -------
 
         The ``RandVec`` objects ``rvec1`` and ``rvec2`` are assumed to be *independent* as
-        as random vectors. This means, for each component i, ``rvec1_i`` and ``rvec2_i`` are
-        independent.
+        as random vectors, while the components within each are dependent as given by their
+        joint distributions. The joint distribution of the sum is the joint convolution of
+        both joint tables (c.f., ``convolve_rows``), computed over pairs of joint samples
 
         - if ``rvec1`` and ``rvec2`` are dependent, initialise a new random vector with dependency in the joint distribution
 
         """
         if isinstance(second_randvec, (list, np.ndarray)): # pass list or np.ndarray with np.array.shape = (self.dimension,)
-            try:
-                second_randvec: list[Decimal] = [Decimal(str(v)) for v in second_randvec]
-            except InvalidOperation:
-                """second_randvec is a list of Fraction objects"""
-                pass
-            new_pspace: dict = {}
-            for sample_tuple, prob in self.pspace.items():
-                new_tuple = tuple([sample_tuple[i] + second_randvec[i] for i in range(self.dimension)])
-                try:
-                    new_pspace[new_tuple] += prob
-                except KeyError:
-                    new_pspace[new_tuple] = prob 
-        else:
-            new_marginals = [self.components[i] + second_randvec.components[i] for i in range(self.dimension)]
-            new_pspace = generate_jdist(*new_marginals)
-        
-        return RandVec(pspace=new_pspace)
+            shift: np.ndarray = self.backend.array(list(second_randvec))
+            new_name: list = [n + v for n, v in zip(self._name, second_randvec)]
+            return RandVec._from_rows(new_name, self.values + shift, self.probabilities, self.backend, self.error_budget)
+
+        if not isinstance(second_randvec, JointDistribution):
+            return NotImplemented
+        if not second_randvec.dimension == self.dimension:
+            raise ValueError(f"dimension mismatch, cannot add {second_randvec.dimension}-dimensional to {self.dimension}-dimensional random vector")
+
+        backend: NumericBackend = promote(self.backend, second_randvec.backend)
+        new_name: list = [n + m for n, m in zip(self._name, second_randvec._name)]
+        new_values, new_probabilities = convolve_rows(*self._arrays(backend), *second_randvec._arrays(backend))
+        error_budget: ErrorBudget = self.error_budget + second_randvec.error_budget
+        return RandVec._from_rows(new_name, new_values, new_probabilities, backend, error_budget)
 
     def __radd__(self, second_randvec):
         return self.__add__(second_randvec)
@@ -126,28 +197,19 @@ class RandVec(JointDistribution):
 
         """
         if isinstance(randvar, (int, float, Decimal, Fraction)):
-            try:
-                randvar: Decimal = Decimal(str(randvar))
-            except InvalidOperation:
-                # randvar is a Fraction object
-                pass
-            new_pspace: dict = {
-                tuple([randvar*s for s in sample]): prob for sample, prob in self.pspace.items()
-                }
-        else:
-            # randvar is a RandVar object
-            new_pspace: dict = {}
-            for rv_sample, rv_prob in randvar.pspace.items():
-                for sample, prob in self.pspace.items():
-                    new_tup = tuple([rv_sample*s for s in sample])
-                    # new_tup = tuple([rv_sample] + list(sample))
-                    new_prob = rv_prob*prob
-                    try:
-                        new_pspace[new_tup] += new_prob
-                    except KeyError:
-                        new_pspace[new_tup] = new_prob
-
-        return RandVec(pspace=new_pspace)
+            new_name: list = [as_name(randvar)*n for n in self._name]
+            return RandVec._from_rows(new_name, self.backend.number(randvar)*self.values, self.probabilities, self.backend, self.error_budget.scaled(randvar))
+
+        # randvar is a RandVar object, scale each joint sample by each sample of randvar
+        backend: NumericBackend = promote(self.backend, randvar.backend)
+        (rv_values, rv_probabilities), (values, probabilities) = randvar._arrays(backend), self._arrays(backend)
+        new_name: list = [randvar._name*n for n in self._name]
+        new_values: np.ndarray = (rv_values[:, None, None] * values[None, :, :]).reshape(-1, self.dimension)
+        new_probabilities: np.ndarray = np.multiply.outer(rv_probabilities, probabilities).ravel()
+        error_budget: ErrorBudget = EXACT
+        if not (self.error_budget.exact and randvar.error_budget.exact):
+            error_budget = product_budget(randvar.error_budget, randvar._abs_mean(), self.error_budget, self._norm_mean(1))
+        return RandVec._from_rows(new_name, new_values, new_probabilities, backend, error_budget)
     
     def __rmul__(self, randvar):
         return self.__mul__(randvar)
@@ -163,6 +225,55 @@ class RandVec(JointDistribution):
     def __neg__(self):
         return (-1)*self
 
+    def apply(self, function, name=None):
+        """Pushforward by a function of the joint samples
+
+        Summary
+        -------
+        The law of f(X) for the random vector X = self. The function is evaluated once over 
+        the ``(N, dimension)`` array of joint samples, so it must act on rows in a vectorised 
+        manner, e.g., ``lambda rows: rows.max(axis=1)``. Colliding outputs are merged by 
+        summing their probabilities (c.f., ``reduce_arrays`` and ``reduce_rows``)
+
+        Parameters
+        ----------
+        function : function
+            a vectorised function, mapping the joint samples to an ``(N,)`` array of values, or
+            to an ``(N, k)`` array of joint values
+
+        name : sympy.Expr or list[sympy.Expr], optional
+            the name of the result, a list of k names for joint values. Default is ``f(X_0, X_1, ...)``, 
+            or ``f_i(X_0, X_1, ...)`` at each index i, after the name of ``function`` (c.f., ``applied_name``)
+
+        Returns
+        -------
+        result : RandVar or RandVec
+            the random variable f(X) for ``(N,)`` outputs, else the random vector f(X), on the 
+            numeric backend of self. Its error budget is unbounded
+
+        Raises
+        ------
+        ValueError
+            if ``function`` does not return one value, or one row of values, per joint sample
+
+        Example
+        -------
+        >>> M = rvec.apply(lambda rows: rows.max(axis=1), name=sympy.Symbol('M'))
+
+        """
+        new_values: np.ndarray = self.backend.array(function(self.values))
+        if not (new_values.ndim in (1, 2) and len(new_values) == len(self.values)):
+            raise ValueError(f"{function} returned shape {new_values.shape}, expected ({len(self.values)},) or ({len(self.values)}, k)")
+
+        error_budget: ErrorBudget = self.error_budget.unbounded()
+        if new_values.ndim == 1:
+            new_name = applied_name(function, *self.name) if name is None else name
+            return RandVar._from_support(new_name, new_values, self.probabilities, self.backend, error_budget)
+
+        if name is None:
+            name = [applied_name(function, *self.name, index=i) for i in range(new_values.shape[1])]
+        return RandVec._from_rows(list(name), new_values, self.probabilities, self.backend, error_budget)
+
     def dot(self, second_rvec):
         """
         Parameters
@@ -177,33 +288,125 @@ class RandVec(JointDistribution):
             The dot product of two random vectors is a random variable
         
         """
-        new_pspace: dict = {}
         if isinstance(second_rvec, (list, np.ndarray)):
-            new_name = np.array([sample.name for sample in next(sample_tup for sample_tup in self.pspace.keys())])@second_rvec
-            for sample_tup, prob in self.pspace.items():
-                new_sample = np.array(sample_tup)@second_rvec
-                try:
-                    new_pspace[new_sample] += prob
-                except KeyError:
-                    new_pspace[new_sample] = prob
-                    
-            new_name = sp.nsimplify(new_name)
-            return RandVar(**{'name': new_name, 'pspace': new_pspace})
-
-        new_name = np.array([sample.name for sample in next(sample_tup for sample_tup in self.pspace.keys())])\
-                    @ np.array([sample.name for sample in next(sample_tup for sample_tup in second_rvec.pspace.keys())])
-        for sample_tup, prob in self.pspace.items():
-            for second_sample_tup, second_prob in second_rvec.pspace.items():
-                new_sample = np.array(sample_tup) @ np.array(second_sample_tup)
-                new_prob = prob*second_prob
-                try:
-                    new_pspace[new_sample] += new_prob
-                except KeyError:
-                    new_pspace[new_sample] = new_prob
-
-        new_name = sp.nsimplify(new_name)
-        return RandVar(**{'name': new_name, 'pspace': new_pspace})
+            new_name = dot_names(self._name, second_rvec)
+            weights: np.ndarray = self.backend.array(list(second_rvec))
+            law: tuple = RandVar._cached_law(
+                    lambda: ('dot', self.fingerprint, tuple(weights.tolist())),
+                    lambda: (self.values @ weights, self.probabilities)
+                )
+            error_budget: ErrorBudget = self.error_budget.scaled(max(abs(float(w)) for w in second_rvec))
+            return RandVar._from_law(new_name, law, self.backend, error_budget)
+
+        backend: NumericBackend = promote(self.backend, second_rvec.backend)
+        new_name = dot_names(self._name, second_rvec._name)
+        law: tuple = RandVar._cached_law(
+                lambda: ('dot',) + tuple(sorted((self.fingerprint, second_rvec.fingerprint))),
+                lambda: _dot_arrays(*self._arrays(backend), *second_rvec._arrays(backend))
+            )
+        error_budget: ErrorBudget = EXACT
+        if not (self.error_budget.exact and second_rvec.error_budget.exact):
+            # |x.y - x'.y'| <= ||x - x'||_1 ||y'||_inf + ||x||_inf ||y - y'||_1
+            error_budget = product_budget(self.error_budget, self._norm_mean(np.inf), second_rvec.error_budget, second_rvec._norm_mean(np.inf))
+        return RandVar._from_law(new_name, law, backend, error_budget)
     
+    def _weight_matrix(self, weights) -> np.ndarray:
+        """weights as an ``(m, dimension)`` array on the backend of self, a single weight vector is one row"""
+        weights = self.backend.array(weights)
+        if weights.ndim == 1:
+            weights = weights[None, :]
+        if not (weights.ndim == 2 and weights.shape[1] == self.dimension):
+            raise ValueError(f"weights of shape {weights.shape} do not match the dimension {self.dimension}")
+        return weights
+
+    def dot_many(self, weights) -> list:
+        """Dot products with many weight vectors at once
+
+        Summary
+        -------
+        The laws of the weighted sums W[j] @ X for each row W[j] of ``weights``, from a single
+        ``(N, dimension) @ (dimension, m)`` matrix product over the joint table (c.f., ``dot``)
+
+        Parameters
+        ----------
+        weights : array_like
+            the ``(m, dimension)`` weight matrix, or a single weight vector
+
+        Returns
+        -------
+        result : list[RandVar]
+            the m weighted sums
+
+        Raises
+        ------
+        ValueError
+            if the weights do not match the dimension of self
+
+        Example
+        -------
+        >>> W = numpy.array([[1, 0], [0.5, 0.5], [0, 1]])
+        >>> [S.E for S in rvec.dot_many(W)] # E[X_0], (E[X_0] + E[X_1])/2, E[X_1]
+
+        """
+        weights = self._weight_matrix(weights)
+        sums: np.ndarray = self.values @ weights.T
+        randvars: list = []
+        for j, row in enumerate(weights.tolist()):
+            error_budget: ErrorBudget = self.error_budget.scaled(max(abs(float(w)) for w in row))
+            randvars += [RandVar._from_support(dot_names(self._name, row), sums[:, j], self.probabilities, self.backend, error_budget)]
+        return randvars
+
+    def dot_many_stats(self, weights, q=None) -> dict:
+        """Moments and quantiles of dot products with many weight vectors at once
+
+        Summary
+        -------
+        The expectations W @ E and variances diag(W V W^T) of the weighted sums W[j] @ X, read
+        off the cached expectation vector and covariance matrix of self, without building any
+        random variable. Quantiles are found per weighted sum by sorting the column of the
+        ``(N, m)`` matrix of weighted joint samples and searching its cumulative probabilities
+
+        Parameters
+        ----------
+        weights : array_like
+            the ``(m, dimension)`` weight matrix, or a single weight vector
+
+        q : float or array_like, optional
+            the probability level(s) of quantiles to compute (c.f., ``RandVar.quantile``), default is None
+
+        Returns
+        -------
+        result : dict
+            ``'E'`` and ``'V'``, arrays of shape ``(m,)``, and ``'quantiles'`` of shape ``(m, len(q))`` if ``q`` is passed
+
+        Raises
+        ------
+        ValueError
+            if the weights do not match the dimension of self, or if any of ``q`` lies outside [0, 1]
+
+        """
+        weights = self._weight_matrix(weights)
+        stats: dict = {
+                'E': weights @ self.E,
+                'V': ((weights @ self.V) * weights).sum(axis=1)
+            }
+        if q is None:
+            return stats
+
+        levels: np.ndarray = self.backend.array(np.atleast_1d(q))
+        if np.any(levels < 0) or np.any(levels > 1):
+            raise ValueError("probability levels must lie in [0, 1]")
+        sums: np.ndarray = self.values @ weights.T
+        order: np.ndarray = np.argsort(sums, axis=0, kind='stable')
+        sorted_sums: np.ndarray = np.take_along_axis(sums, order, axis=0)
+        cumulative: np.ndarray = np.cumsum(self.probabilities[order], axis=0)
+        quantiles = np.empty((len(weights), len(levels)), dtype=self.backend.dtype)
+        for j in range(len(weights)):
+            index = np.minimum(np.searchsorted(cumulative[:, j], levels, side='left'), len(sums) - 1)
+            quantiles[j] = sorted_sums[index, j]
+        stats['quantiles'] = quantiles
+        return stats
+
     def sum(self):
         """return the component sum of the random vector as a ``RandVar`` object (random variable)"""
         return self.dot(np.ones(self.dimension))
@@ -212,37 +415,51 @@ class RandVec(JointDistribution):
         return self.dot(second_rvec)
 
     def calculate_expectation(self, inplace=False) -> None:
-        expectation_vector = []
-        for rv in self.components:
-            if inplace == False:
-                rv.calculate_expectation()
-            else:
-                expectation_vector += [rv.calculate_expectation(inplace=inplace)]
+        """calculate the expectation vector
+
+        Summary
+        -------
+        Computed in a single pass over the joint table as the probability-weighted 
+        sum of its rows, p @ X
+
+        Parameters
+        ----------
+        inplace : bool, optional
+            store in memory (as class attrbute) if False, else return to console if True,
+            default is False
         
+        """
+        expectation_vector: list[float] = self.E.tolist()
         if inplace == False:
-            self.expectation: list[float] = [rv.expectation for rv in self.components]
+            self.expectation: list[float] = expectation_vector
         else:
             return expectation_vector
     
     @property
     def E(self):
-        return np.array(self.calculate_expectation(inplace=True))
+        """the expectation vector, computed once and returned read-only (c.f., ``readonly``)"""
+        try:
+            return self._expectation
+        except AttributeError:
+            self._expectation: np.ndarray = readonly(self.probabilities @ self.values)
+            return self._expectation
 
     def calculate_variance(self, inplace=False) -> None:
-        components: np.ndarray = self.components
-        secondaries: np.ndarray = self.secondaries
-
-        cov_mtrx = np.full((self.dimension, self.dimension), np.nan)
-        for i, component in enumerate(components):
-            for j, second_component in enumerate(components[i:]): # components[i:] includes components[i]
-                if j == 0:
-                    cov_mtrx[i, i] = component.V
-                else:
-                    it = iter(secondaries)
-                    secondary = next(s for s in it if s.name == component.name*second_component.name)
-                    cov_mtrx[i, i+j] = secondary.E - component.E*second_component.E
-                    cov_mtrx[i+j, i] = cov_mtrx[i, i+j]
+        """calculate the covariance matrix
+
+        Summary
+        -------
+        Computed in a single pass over the joint table as the probability-weighted 
+        product of the centred rows, (X - E).T @ diag(p) @ (X - E)
 
+        Parameters
+        ----------
+        inplace : bool, optional
+            store in memory (as class attrbute) if False, else return to console if True,
+            default is False
+        
+        """
+        cov_mtrx: np.ndarray = self.V
         if inplace == False:
             self.cov_mtrx = cov_mtrx
         else:
@@ -250,7 +467,14 @@ class RandVec(JointDistribution):
 
     @property
     def V(self):
-        return self.calculate_variance(inplace=True)
+        """the covariance matrix, computed once and returned read-only (c.f., ``readonly``)"""
+        try:
+            return self._cov_mtrx
+        except AttributeError:
+            centred: np.ndarray = self.values - self.E
+            cov_mtrx: np.ndarray = centred.T @ (self.probabilities[:, None] * centred)
+            self._cov_mtrx: np.ndarray = readonly((cov_mtrx + cov_mtrx.T)/2) # symmetric up to rounding, enforce exactly
+            return self._cov_mtrx
 
     def Prob(self, predicate: list[str]) -> float:
         """
@@ -258,12 +482,12 @@ class RandVec(JointDistribution):
         Parameters
         ----------
         predicate : str, list[str]
-            the event whose probability is to be calculated (c.f., ``RandVar.Prov``)
+            the event whose probability is to be calculated (c.f., ``RandVar.Prob``)
 
         Returns
         -------
         probability : float
-            the probability of the event passed. For the random vector [X, Y, Z, ...]
+            the probability of the event passed, on the numeric backend of self. For the random vector [X, Y, Z, ...]
             and event ['<= x', '== y', '> z', ...], ``probability`` is the joint probability 
             Pr(X <= x, Y == y, Z > z, ...)
 
@@ -280,13 +504,95 @@ class RandVec(JointDistribution):
         if isinstance(predicate, str):
             return self.Prob([predicate]*self.dimension)
 
-        rsult: Decimal = Decimal('0.0')
-        for sample_tuple, prob in self.pspace.items():
-            if all(eval(f"{sample_tuple[i].value}" + predicate[i]) for i in range(self.dimension)):
-                try:
-                    rsult += prob
-                except TypeError:
-                    rsult: float = float(rsult)
-                    rsult += prob
+        # compiled predicates are evaluated as vectorised comparisons on each column (c.f., ``event_mask``)
+        event: np.ndarray = np.ones(len(self.probabilities), dtype=bool)
+        for i in range(self.dimension):
+            event &= event_mask(self.values[:, i], predicate[i], self.backend)
+
+        rsult: float = self.backend.number(self.probabilities[event].sum())
+        return rsult
+
+    def conditional_marginal(self, index: int, axis: int, predicate: str) -> RandVar:
+        """The law of X_index conditioned on an event on X_axis, i.e., the component ``index`` of
+        ``self.given(axis, predicate)`` without building the conditional random vector (c.f., ``given``)"""
+        if not (isinstance(index, (int, np.integer)) and 0 <= index < self.dimension):
+            raise ValueError(f"{index} is not an axis of a random vector of dimension {self.dimension}")
+        rows, mass = self._event(axis, predicate)
+        error_budget: ErrorBudget = self.error_budget.unbounded()
+        return RandVar._from_support(self._name[index], self.values[rows, index], self.probabilities[rows]/mass, self.backend, error_budget)
+
+    def conditional_expectation(self, index: int, axis: int) -> RandVar:
+        """Conditional expectation
+
+        Summary
+        -------
+        The conditional expectation E[X_index | X_axis] of the components of self, as the random
+        variable g(X_axis) for g(x) = E[X_index | X_axis = x]. Its law is found by a single group-by
+        over the sorted index of the column ``axis`` (c.f., ``given``), rather than by conditioning
+        on each value of X_axis in turn
+
+        Parameters
+        ----------
+        index : int
+            the index of the random variable whose expectation is taken
+
+        axis : int
+            the index of the random variable conditioned on
+
+        Returns
+        -------
+        randvar : RandVar
+            the conditional expectation, named ``E(X_index, X_axis)``. Its expectation is E[X_index]
+
+        Raises
+        ------
+        ValueError
+            if ``index`` or ``axis`` is not an axis of self
+
+        Example
+        -------
+        >>> rvec.conditional_expectation(0, 1).E == rvec.E[0] # the tower property, for rvec = [X, Y]
+        True
+
+        """
+        values, probabilities = self._conditional_expectation_arrays(index, axis)
+        name = sp.Function('E')(self._name[index].expr(), self._name[axis].expr())
+        return RandVar._from_support(name, values, probabilities, self.backend, self.error_budget.unbounded())
+
+    @property
+    def sampler(self) -> AliasSampler:
+        """the alias table over the rows of the joint table, built once on first use (c.f., ``AliasSampler``)"""
+        try:
+            return self._sampler
+        except AttributeError:
+            self._sampler: AliasSampler = AliasSampler(self.probabilities)
+            return self._sampler
+
+    def generate(self, iterations: int, rng: np.random.Generator = None) -> np.ndarray:
+        """generate joint random samples of self (the random vector)
+
+        Summary
+        -------
+        Joint samples are drawn as row indices into the joint table in a single
+        vectorised call, so dependence between the components is preserved
+
+        Parameters
+        ----------
+        iterations : int
+            the number of independent joint samples to draw
+
+        rng : numpy.random.Generator, optional
+            the source of randomness, also accepts a seed. Default is the global state of ``numpy.random``, as set by ``numpy.random.seed``
+
+        Returns
+        -------
+        out : np.ndarray
+            array of shape ``(iterations, self.dimension)``, each row a joint sample
+
+        """
+        out = self.values[self.sampler.draw(iterations, rng=rng)]
+        return out
 
-        return rsult
\ No newline at end of file
+def _dot_arrays(values: np.ndarray, probabilities: np.ndarray, second_values: np.ndarray, second_probabilities: np.ndarray) -> tuple:
+    """the unreduced law of the dot product of independent random vectors given by their joint tables"""
+    return values @ second_values.T, np.multiply.outer(probabilities, second_probabilities)
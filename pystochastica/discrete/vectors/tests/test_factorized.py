@@ -0,0 +1,55 @@
+from ...variables import RandVar
+from .. import RandVec, FactorizedRandVec
+from fractions import Fraction
+import sympy as sp
+import numpy as np
+
+A, B = sp.symbols('A, B')
+
+def test_factorized_binaries():
+    binaries = [RandVar(name=sp.Symbol(f'X_{i}'), values=[0, 1], probabilities=[0.5, 0.5]) for i in range(30)]
+    rvec = FactorizedRandVec(blocks=binaries)
+    assert rvec.dimension == 30 and not hasattr(rvec, '_joint')
+
+    total = rvec.sum()
+    assert len(total.values) == 31 and total.E == 15.0 and total.V == 7.5
+    assert np.isclose(rvec.Prob('== 1'), 2.0**-30)
+    assert np.array_equal(rvec.V, np.eye(30)/4)
+    assert rvec.generate(5, rng=0).shape == (5, 30)
+    assert not hasattr(rvec, '_joint') # nothing above materializes the product
+
+def test_factorized_materialize():
+    rvX = RandVar(name=sp.Symbol('X'), values=[-1, 1], probabilities=[0.4, 0.6])
+    rvAB = RandVec(name=[A, B], values=[[0, 1], [1, 0], [1, 1]], probabilities=[0.2, 0.3, 0.5])
+    rvec = FactorizedRandVec(blocks=[rvX, rvAB])
+    joint = rvec.materialize()
+    assert joint.name == [sp.Symbol('X'), A, B] and len(joint.values) == 6
+
+    assert np.allclose(rvec.E, joint.E) and np.allclose(rvec.V, joint.V)
+    assert rvec.dot([1, 2, 3]) == joint.dot([1, 2, 3])
+    assert rvec.dot(rvec) == joint.dot(joint)
+    assert np.isclose(rvec.Prob(['> 0', '== 1', '> 0']), joint.Prob(['> 0', '== 1', '> 0']))
+
+    shifted = 2*rvec + [1, 0, 0]
+    assert isinstance(shifted, FactorizedRandVec) and np.allclose(shifted.E, 2*joint.E + [1, 0, 0])
+    assert isinstance(rvec + rvec, FactorizedRandVec) and (rvec + rvec).sum() == (joint + joint).sum()
+    assert rvec == joint # equality materializes the joint table
+
+def test_factorized_exact():
+    halves = [RandVar(name=sp.Symbol(f'X_{i}'), values=[0, 1], probabilities=[0.5, 0.5], backend='fraction') for i in range(3)]
+    rvec = FactorizedRandVec(blocks=halves)
+    assert rvec.Prob('== 0') == Fraction(1, 8)
+    assert list(rvec.sum().probabilities) == [Fraction(1, 8), Fraction(3, 8), Fraction(3, 8), Fraction(1, 8)]
+
+    try:
+        FactorizedRandVec(blocks=[])
+        assert False
+    except ValueError:
+        pass
+
+def test_factorized_given():
+    joint = RandVec(name=[A, B], values=[[0, 0], [1, 1], [1, 2]], probabilities=[0.2, 0.5, 0.3])
+    rvec = FactorizedRandVec(blocks=[RandVar(name=sp.Symbol('X'), values=[0, 1], probabilities=[0.5, 0.5]), joint])
+    conditioned = rvec.given(2, '>= 1')
+    assert isinstance(conditioned, FactorizedRandVec) and conditioned.blocks[0] is rvec.blocks[0]
+    assert conditioned.materialize() == rvec.materialize().given(2, '>= 1')
@@ -167,4 +167,121 @@ def test_randvec_randvar_mul():
         Sample(name=rvar_name, value=0): Fraction(20, 100)})
 
     rvec3 = rvar*rvec + 10*rvec2
-    assert isinstance(rvec3.sum(), RandVar)
\ No newline at end of file
+    assert isinstance(rvec3.sum(), RandVar)
+
+def test_randvec_generate():
+    X = sp.Symbol('X')
+    jd_XX = {
+        (Sample(name=X, value=1), Sample(name=X, value=1)): 0.5,
+        (Sample(name=X, value=-1), Sample(name=X, value=-1)): 0.5,
+        }
+    rvec = RandVec(pspace=jd_XX)
+    outcomes = rvec.generate(1000, rng=np.random.default_rng(0))
+    assert outcomes.shape == (1000, 2)
+    assert np.all(outcomes[:, 0] == outcomes[:, 1]) # joint samples preserve dependence
+
+    random_randvec = RandVec(pspace=generate_jdist_random(dimension=3))
+    outcomes = random_randvec.generate(200000, rng=np.random.default_rng(1))
+    spread = np.sqrt(np.diag(random_randvec.V))
+    assert np.all(np.abs(outcomes.mean(axis=0) - random_randvec.E) < 0.05*spread)
+
+def test_randvec_lazy_components():
+    rvec = RandVec(pspace=generate_jdist_random(dimension=3))
+    rvec2 = -2*rvec + rvec.E
+    assert not hasattr(rvec2, '_components') # intermediate results derive nothing
+    assert not hasattr(rvec2, '_secondaries')
+
+    assert len(rvec2.components) == 3
+    assert len(rvec2.secondaries) == 3
+    assert rvec2.V is rvec2.V # covariance matrix is cached
+
+def test_randvec_covariance():
+    rvec = RandVec(pspace=generate_jdist_random(dimension=3))
+    cov_mtrx = rvec.V
+    secondaries = iter(rvec.secondaries) # ordered (0, 1), (0, 2), (1, 2)
+    sf = 5
+    for i in range(rvec.dimension):
+        assert round(cov_mtrx[i, i], sf) == round(rvec.components[i].V, sf)
+        for j in range(i+1, rvec.dimension):
+            secondary = next(secondaries)
+            covariance = secondary.E - rvec.components[i].E*rvec.components[j].E
+            assert round(cov_mtrx[i, j], sf) == round(covariance, sf)
+            assert cov_mtrx[i, j] == cov_mtrx[j, i]
+
+    # cached moments are read-only, modifying them in place fails rather than corrupting them
+    expectation = rvec.E.copy()
+    for moment in (rvec.E, rvec.V):
+        try:
+            moment += 1
+            assert False
+        except ValueError:
+            pass
+    assert np.array_equal(rvec.E, expectation) and np.array_equal(rvec.V, cov_mtrx)
+
+def test_randvec_apply():
+    rvec = RandVec(pspace=jd_X1_X2_dict)
+    maximum = rvec.apply(lambda rows: rows.max(axis=1), name=sp.Max(X1, X2))
+    assert isinstance(maximum, RandVar) and maximum.name == sp.Max(X1, X2)
+    assert np.array_equal(maximum.values, [0.0, 1.0, 1.5])
+    assert np.allclose(maximum.probabilities, [0.19, 0.32, 0.49])
+
+    swapped = rvec.apply(lambda rows: rows[:, ::-1], name=[X2, X1])
+    assert isinstance(swapped, RandVec) and swapped.name == [X2, X1]
+    assert np.isclose(swapped.Prob(['== 1', '== 1.5']), 0.35)
+    assert rvec.apply(lambda rows: rows*2).name == [sp.Function('f_0')(X1, X2), sp.Function('f_1')(X1, X2)]
+
+def test_randvec_joint_sum():
+    X = sp.Symbol('X')
+    # [X, -X] for X = +-1, components dependent
+    rvec = RandVec(name=[X, -X], values=[[-1, 1], [1, -1]], probabilities=[0.5, 0.5])
+    rvec_sum = rvec + rvec
+    assert rvec_sum.name == [2*X, -2*X]
+    assert np.array_equal(rvec_sum.values, [[-2, 2], [0, 0], [2, -2]]) and np.allclose(rvec_sum.probabilities, [0.25, 0.5, 0.25])
+    assert rvec_sum.sum() == RandVar(name=sp.S.Zero, values=[0], probabilities=[1])
+
+    # sparse joint tables, the sum has at most N1*N2 rows
+    Xrvec, Yrvec = RandVec(pspace=jd_X1_X2_dict), RandVec(pspace=jd_Y1_Y2_dict)
+    joint_sum = Xrvec + Yrvec
+    assert len(joint_sum.values) <= len(Xrvec.values)*len(Yrvec.values)
+    assert np.allclose(joint_sum.E, Xrvec.E + Yrvec.E) and np.allclose(joint_sum.V, Xrvec.V + Yrvec.V)
+
+def test_randvec_dot_many():
+    rvec = RandVec(pspace=jd_X1_X2_dict)
+    weights = np.array([[1, 0], [0.5, 0.5], [2, -1]])
+    dots = rvec.dot_many(weights)
+    assert all(dot == rvec.dot(list(row)) for dot, row in zip(dots, weights))
+
+    levels = [0.1, 0.5, 0.9]
+    stats = rvec.dot_many_stats(weights, q=levels)
+    assert np.allclose(stats['E'], [dot.E for dot in dots]) and np.allclose(stats['V'], [dot.V for dot in dots])
+    assert np.array_equal(stats['quantiles'], [[dot.quantile(q) for q in levels] for dot in dots])
+    assert 'quantiles' not in rvec.dot_many_stats(weights[0])
+    try:
+        rvec.dot_many(np.ones((2, 3)))
+        assert False
+    except ValueError:
+        pass
+
+def test_randvec_conditioning():
+    X, Y = sp.symbols('X, Y')
+    rvec = RandVec(name=[X, Y], values=[[0, 0], [1, 0], [1, 1], [2, 1], [3, 2]], probabilities=['0.1', '0.2', '0.3', '0.25', '0.15'], backend='fraction')
+    conditioned = rvec.given(1, '>= 1 and < 2')
+    assert isinstance(conditioned, RandVec) and conditioned.name == [X, Y]
+    assert conditioned.values.tolist() == [[1, 1], [2, 1]] and conditioned.probabilities.tolist() == [Fraction(6, 11), Fraction(5, 11)]
+    assert rvec.given(1, '!= 1').probabilities.tolist() == [Fraction(2, 9), Fraction(4, 9), Fraction(1, 3)]
+    assert rvec.conditional_marginal(0, 1, '== 1') == conditioned.components[0]
+    assert rvec.given(0, '<= 1').Prob(['<= 1', '== 0']) == rvec.Prob(['<= 1', '== 0'])/rvec.Prob(['<= 1', '<= inf'])
+
+    # E[X | Y] as the law of g(Y), with the tower property E[E[X | Y]] = E[X]
+    expectation = rvec.conditional_expectation(0, 1)
+    assert expectation.name == sp.Function('E')(X, Y)
+    assert expectation.values.tolist() == [Fraction(2, 3), Fraction(16, 11), 3]
+    assert expectation.probabilities.tolist() == [Fraction(3, 10), Fraction(11, 20), Fraction(3, 20)]
+    assert expectation.E == rvec.E[0]
+
+    for axis, predicate in [(1, '> 5'), (2, '> 0')]:
+        try:
+            rvec.given(axis, predicate)
+            assert False
+        except ValueError:
+            pass